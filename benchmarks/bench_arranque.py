@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tiempo de arranque del paquete
+-----------------------------------
+Mide cuánto cuesta lanzar un proceso que importa el núcleo del juego
+(lo que paga cada bot o proceso trabajador), descontando el arranque del
+intérprete vacío, y lo compara con un presupuesto en milisegundos.
+También verifica que importar el núcleo no cargue tkinter.
+
+Uso:
+    python3 benchmarks/bench_arranque.py [--presupuesto 60] [-n 20]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASOS = {
+    'interprete': 'pass',
+    'import fsm_naval': 'import fsm_naval',
+    'servidor + cliente': 'from fsm_naval import NavalServerFSM, NavalClientFSM; '
+                          'NavalServerFSM; NavalClientFSM',
+}
+
+VERIFICAR_TKINTER = ('import sys; from fsm_naval import NavalServerFSM, NavalClientFSM; '
+                     'NavalServerFSM(); NavalClientFSM(); print("tkinter" in sys.modules)')
+
+
+def medir(codigo, n):
+    """Mediana en milisegundos de `n` arranques de `python -c codigo`."""
+    tiempos = []
+    for _ in range(n):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, check=True)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tiempo de arranque de fsm_naval')
+    parser.add_argument('-n', type=int, default=20, help='arranques por caso')
+    parser.add_argument('--presupuesto', type=float, default=60.0,
+                        help='ms permitidos por encima del intérprete vacío (por defecto 60)')
+    args = parser.parse_args()
+
+    resultados = {nombre: medir(codigo, args.n) for nombre, codigo in CASOS.items()}
+    base = resultados['interprete']
+    for nombre, ms in resultados.items():
+        extra = '' if nombre == 'interprete' else f"  (+{ms - base:.1f} ms)"
+        print(f"  {nombre:<22} {ms:7.1f} ms{extra}")
+
+    salida = subprocess.run([sys.executable, '-c', VERIFICAR_TKINTER], cwd=RAIZ,
+                            capture_output=True, text=True, check=True).stdout.strip()
+    ok = True
+    if salida != 'False':
+        print("  ERROR: importar el núcleo carga tkinter")
+        ok = False
+
+    extra = resultados['servidor + cliente'] - base
+    if extra > args.presupuesto:
+        print(f"  ERROR: arranque +{extra:.1f} ms supera el presupuesto de {args.presupuesto:.0f} ms")
+        ok = False
+    else:
+        print(f"  Dentro del presupuesto ({extra:.1f} <= {args.presupuesto:.0f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Benchmarks del núcleo del juego y del protocolo
+-----------------------------------
+Micro-benchmarks (cada función por separado):
+    NavalServerFSM.procesar_ataque, colocar_barco, limpiar_flota, mostrar_tablero
+    (sin filas cambiadas, que solo mide la caché, y con una fila cambiada,
+    que es el cuadro típico tras un ataque)
+    EstadoPartida.procesar_ataque (con reinicio por PoolEstados)
+    NavalClientFSM._procesar_respuesta
+    ActorPartida.enviar (ida y vuelta por el buzón y el hilo de la partida)
+Macro-benchmark:
+    ida y vuelta completa cliente -> servidor por loopback (TCP): ataque y
+    respuesta, con la partida reiniciada en el servidor cada 25 ataques
+
+Funciona sin red externa. Los resultados se guardan en JSON junto con los
+metadatos del entorno, y se pueden comparar contra una línea base.
+
+Uso:
+    python3 benchmarks/bench_fsm.py                       # medir y mostrar
+    python3 benchmarks/bench_fsm.py -o resultados.json    # guardar resultados
+    python3 benchmarks/bench_fsm.py --guardar-base        # actualizar benchmarks/baseline.json
+    python3 benchmarks/bench_fsm.py --comparar            # comparar con benchmarks/baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import atexit
+import socket
+import timeit
+import platform
+import argparse
+import statistics
+import subprocess
+import contextlib
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_POR_DEFECTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Permitir ejecutar el script sin instalar el paquete
+sys.path.insert(0, RAIZ)
+
+from fsm_naval import NavalServerFSM, NavalClientFSM
+from fsm_naval.estado import PoolEstados
+
+COORDS = [f"{f}{c}" for f in 'ABCDE' for c in '12345']
+
+
+def servidor_con_flota(s=None):
+    s = s or NavalServerFSM()
+    s.colocar_barco('S', ['B1', 'B2'])
+    s.colocar_barco('L', ['C1', 'C2', 'C3'])
+    s.colocar_barco('D', ['E5'])
+    return s
+
+
+# ----------------------------------------------------------------------
+# Casos
+# Cada caso devuelve (función a medir, operaciones por llamada)
+# ----------------------------------------------------------------------
+def caso_procesar_ataque():
+    s = servidor_con_flota()
+
+    def op():
+        for c in COORDS:
+            s.procesar_ataque(c)
+        s.limpiar_flota()
+        servidor_con_flota(s)
+    return op, len(COORDS)
+
+
+def caso_estado_procesar_ataque():
+    """Misma partida que caso_procesar_ataque con el estado compacto reciclado por el pool."""
+    pool = PoolEstados()
+
+    def op():
+        e = servidor_con_flota(pool.obtener())
+        for c in COORDS:
+            e.procesar_ataque(c)
+        pool.devolver(e)
+    return op, len(COORDS)
+
+
+def caso_actor_enviar():
+    """Costo de serializar un mensaje a través del actor de la partida (STATE no modifica el tablero)."""
+    from fsm_naval.actores import ActorPartida
+    actor = ActorPartida(servidor_con_flota())
+    atexit.register(actor.detener)
+
+    def op():
+        actor.enviar('STATE').result()
+    return op, 1
+
+
+def caso_colocar_barco():
+    s = NavalServerFSM()
+
+    def op():
+        s.colocar_barco('L', ['C1', 'C2', 'C3'])
+        # Deshacer sin pasar por limpiar_flota
+        for p in ('C1', 'C2', 'C3'):
+            s.tablero[p] = None
+        s.ships['L'].clear()
+        s.ship_cells.clear()
+    return op, 1
+
+
+def caso_limpiar_flota():
+    s = servidor_con_flota()
+    return s.limpiar_flota, 1
+
+
+def caso_mostrar_tablero():
+    """Cuadro sin filas cambiadas: solo se reusa el texto en caché."""
+    s = servidor_con_flota()
+    for c in ('A1', 'B1', 'C2'):
+        s.procesar_ataque(c)
+    salida = io.StringIO()
+
+    def op():
+        with contextlib.redirect_stdout(salida):
+            s.mostrar_tablero()
+        salida.seek(0)
+        salida.truncate()
+    return op, 1
+
+
+def caso_mostrar_tablero_una_fila():
+    """Redibujo tras un ataque: una fila cambiada por cuadro."""
+    s = servidor_con_flota()
+    salida = io.StringIO()
+
+    def op():
+        s.marcar_cambio('C2')
+        with contextlib.redirect_stdout(salida):
+            s.mostrar_tablero()
+        salida.seek(0)
+        salida.truncate()
+    return op, 1
+
+
+def caso_procesar_respuesta():
+    cli = NavalClientFSM()
+    respuestas = [(c, "404:Fallido") for c in COORDS[:12]] + [(c, "200:Impacto") for c in COORDS[12:]]
+
+    def op():
+        cli.estado_actual = cli.INICIO
+        for c, r in respuestas:
+            cli._procesar_respuesta(c, r)
+    return op, len(respuestas)
+
+
+SCRIPT_SERVIDOR = """
+import sys
+from fsm_naval import NavalServerFSM
+
+def reiniciar_si_completo(s):
+    # Con todas las celdas atacadas, partida nueva (antes de aceptar otra conexión)
+    if len(s.ataques_recibidos) == s.filas * s.columnas:
+        s.limpiar_flota()
+        s.colocar_barco('D', ['E5'])
+
+s = NavalServerFSM()
+s.host = '127.0.0.1'
+s.port = int(sys.argv[1])
+s.colocar_barco('D', ['E5'])
+s.observadores.append(reiniciar_si_completo)
+s.iniciar_servidor()
+"""
+
+
+def puerto_libre():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def caso_ida_y_vuelta():
+    """Servidor real en un proceso aparte (salida descartada), en un puerto libre de 127.0.0.1."""
+    puerto = puerto_libre()
+    proc = subprocess.Popen([sys.executable, '-c', SCRIPT_SERVIDOR, str(puerto)],
+                            stdout=subprocess.DEVNULL, cwd=RAIZ)
+    atexit.register(proc.terminate)
+
+    # Esperar a que el servidor acepte conexiones
+    for _ in range(200):
+        try:
+            socket.create_connection(('127.0.0.1', puerto), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.02)
+
+    cli = NavalClientFSM()
+    cli.server_host = '127.0.0.1'
+    cli.server_port = puerto
+
+    def op():
+        # Una partida completa: el último ataque hace que el servidor la reinicie
+        for c in COORDS:
+            cli._enviar_mensaje(c)
+    return op, len(COORDS)
+
+
+CASOS = {
+    'servidor.procesar_ataque': caso_procesar_ataque,
+    'servidor.colocar_barco': caso_colocar_barco,
+    'servidor.limpiar_flota': caso_limpiar_flota,
+    'servidor.mostrar_tablero': caso_mostrar_tablero,
+    'servidor.mostrar_tablero_una_fila': caso_mostrar_tablero_una_fila,
+    'estado.procesar_ataque': caso_estado_procesar_ataque,
+    'cliente._procesar_respuesta': caso_procesar_respuesta,
+    'actor.enviar': caso_actor_enviar,
+    'protocolo.ida_y_vuelta_tcp': caso_ida_y_vuelta,
+}
+
+
+# ----------------------------------------------------------------------
+# Medición
+# ----------------------------------------------------------------------
+def medir(op, ops_por_llamada, repeticiones=5):
+    """Mide `op` con timeit; devuelve estadísticas en nanosegundos por operación."""
+    temporizador = timeit.Timer(op)
+    numero, _ = temporizador.autorange()
+    tiempos = temporizador.repeat(repeat=repeticiones, number=numero)
+    por_op = [t / (numero * ops_por_llamada) * 1e9 for t in tiempos]
+    return {
+        'ns_por_op': statistics.median(por_op),
+        'ns_min': min(por_op),
+        'ns_max': max(por_op),
+        'llamadas': numero,
+        'repeticiones': repeticiones,
+    }
+
+
+def metadatos():
+    """Datos del entorno para poder interpretar (y comparar) los resultados."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=RAIZ, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'commit': commit,
+    }
+
+
+def ejecutar(filtro=None, repeticiones=5):
+    resultados = {}
+    for nombre, caso in CASOS.items():
+        if filtro and filtro not in nombre:
+            continue
+        op, n = caso()
+        resultados[nombre] = medir(op, n, repeticiones)
+        print(f"  {nombre:<32} {resultados[nombre]['ns_por_op']:>12.0f} ns/op")
+    return {'metadatos': metadatos(), 'resultados': resultados}
+
+
+def comparar(actual, base, umbral):
+    """
+    Compara contra una línea base.
+
+    Returns:
+        Lista de nombres de casos que empeoraron más que `umbral` (fracción).
+    """
+    print(f"\n  {'caso':<32} {'base':>12} {'actual':>12} {'cambio':>8}")
+    regresiones = []
+    for nombre, r in actual['resultados'].items():
+        b = base['resultados'].get(nombre)
+        if b is None:
+            print(f"  {nombre:<32} {'-':>12} {r['ns_por_op']:>12.0f}")
+            continue
+        cambio = r['ns_por_op'] / b['ns_por_op'] - 1
+        marca = '  <-- regresión' if cambio > umbral else ''
+        print(f"  {nombre:<32} {b['ns_por_op']:>12.0f} {r['ns_por_op']:>12.0f} {cambio:>+8.1%}{marca}")
+        if cambio > umbral:
+            regresiones.append(nombre)
+    if base.get('metadatos', {}).get('plataforma') != actual['metadatos']['plataforma']:
+        print("\n  Aviso: la línea base se midió en otra plataforma.")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks de la batalla naval FSM')
+    parser.add_argument('-o', '--salida', help='archivo JSON donde guardar los resultados')
+    parser.add_argument('-k', '--filtro', help='solo los casos cuyo nombre contenga este texto')
+    parser.add_argument('-r', '--repeticiones', type=int, default=5)
+    parser.add_argument('--base', default=BASE_POR_DEFECTO, help='archivo de línea base')
+    parser.add_argument('--guardar-base', action='store_true', help='guardar los resultados como línea base')
+    parser.add_argument('--comparar', action='store_true', help='comparar con la línea base')
+    parser.add_argument('--umbral', type=float, default=0.10,
+                        help='empeoramiento tolerado al comparar (fracción, por defecto 0.10)')
+    args = parser.parse_args()
+
+    print("Benchmarks FSM Naval:")
+    actual = ejecutar(args.filtro, args.repeticiones)
+
+    for ruta in filter(None, (args.salida, args.base if args.guardar_base else None)):
+        with open(ruta, 'w') as f:
+            json.dump(actual, f, indent=2)
+        print(f"\nResultados guardados en {ruta}")
+
+    if args.comparar:
+        if not os.path.exists(args.base):
+            print(f"\nNo existe la línea base {args.base} (use --guardar-base).")
+            return 2
+        with open(args.base) as f:
+            base = json.load(f)
+        if comparar(actual, base, args.umbral):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""
+FSM Naval Battle
+-----------------------------------
+Paquete con el núcleo del juego de batalla naval basado en autómatas finitos:
+
+- servidor : NavalServerFSM (defensa, tablero y flota)
+- cliente  : NavalClientFSM (ataque)
+- transporte, archivo, memoria, perfilado, torneo : módulos auxiliares
+- actores  : partidas como actores (muchos atacantes por partida)
+- gui_servidor, gui_cliente : interfaces Tkinter (se cargan solo si se piden)
+
+Las clases principales se exponen de forma perezosa, así que `import fsm_naval`
+no carga sockets ni tkinter hasta que se usan. Punto de entrada sin GUI:
+
+    python3 -m fsm_naval servidor|cliente|raid|torneo|archivo|gui-servidor|gui-cliente
+"""
+
+__all__ = ['NavalServerFSM', 'NavalClientFSM']
+
+
+def __getattr__(nombre):
+    if nombre == 'NavalServerFSM':
+        from .servidor import NavalServerFSM
+        return NavalServerFSM
+    if nombre == 'NavalClientFSM':
+        from .cliente import NavalClientFSM
+        return NavalClientFSM
+    raise AttributeError(f"module 'fsm_naval' has no attribute {nombre!r}")
@@ -0,0 +1,159 @@
+"""
+Punto de entrada de línea de comandos (sin GUI):
+
+    python3 -m fsm_naval servidor [--host H] [--puerto P] [--transporte URL] [--udp]
+                                  [--archivo BASE] [--flota ninguna|defecto|aleatoria] [--en-sitio]
+    python3 -m fsm_naval cliente  [--host H] [--puerto P] [--transporte URL] [--udp]
+                                  [--lobby HOST:PUERTO] [--en-sitio]
+    python3 -m fsm_naval lobby    [--host H] [--puerto P] [--jugadores N] [--anunciar HOST]
+    python3 -m fsm_naval raid     [--partidas N] [--atacantes N] [--segundos S] [--puerto P]
+    python3 -m fsm_naval torneo   [--partidas N] [--semilla S] [--procesos N]
+    python3 -m fsm_naval archivo  BASE [filas columnas]
+    python3 -m fsm_naval resolver [--filas F] [--columnas C] [--flota D1,S2,L3] [--tabla ARCHIVO]
+    python3 -m fsm_naval gui-servidor | gui-cliente
+
+Cada subcomando importa solo lo que necesita: tkinter se carga únicamente
+con los subcomandos gui-*.
+"""
+
+import sys
+import argparse
+
+
+def _servidor(argv):
+    parser = argparse.ArgumentParser(prog='fsm_naval servidor', description='Servidor de defensa (FSM)')
+    parser.add_argument('--host', default='')
+    parser.add_argument('--puerto', type=int, default=5000)
+    parser.add_argument('--transporte', help='tcp://host:puerto, unix:///ruta o mem://nombre')
+    parser.add_argument('--udp', action='store_true', help='modo datagrama UDP')
+    parser.add_argument('--archivo', help='base del archivo de partidas terminadas')
+    parser.add_argument('--flota', choices=('ninguna', 'defecto', 'aleatoria'), default='aleatoria')
+    parser.add_argument('--semilla', type=int, default=None, help='semilla de la flota aleatoria')
+    parser.add_argument('--sin-limites', action='store_true', help='desactivar el control de admisión')
+    parser.add_argument('--en-sitio', action='store_true',
+                        help='tablero fijo arriba de la consola, actualizado con ANSI')
+    args = parser.parse_args(argv)
+
+    from .servidor import NavalServerFSM
+
+    servidor = NavalServerFSM()
+    servidor.host = args.host
+    servidor.port = args.puerto
+    servidor.mostrar_en_sitio = args.en_sitio
+    if args.transporte:
+        from .transporte import crear_transporte
+        servidor.transporte = crear_transporte(args.transporte)
+    if args.archivo:
+        from .archivo import ArchivoPartidas
+        servidor.archivo = ArchivoPartidas(args.archivo)
+    if not args.sin_limites:
+        from .admision import ControlAdmision
+        servidor.admision = ControlAdmision()
+
+    if args.flota == 'defecto':
+        servidor._colocar_barcos_defecto()
+    elif args.flota == 'aleatoria':
+        import random
+        from .torneo import defensor_aleatorio
+        defensor_aleatorio(servidor, random.Random(args.semilla))
+
+    import os
+    if os.name == 'posix':
+        from .perfilado import instalar_senal
+        instalar_senal(servidor)
+
+    if args.udp:
+        servidor.iniciar_servidor_udp()
+    else:
+        servidor.iniciar_servidor()
+
+
+def _cliente(argv):
+    parser = argparse.ArgumentParser(prog='fsm_naval cliente', description='Cliente de ataque (FSM)')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--puerto', type=int, default=5000)
+    parser.add_argument('--transporte', help='tcp://host:puerto, unix:///ruta o mem://nombre')
+    parser.add_argument('--udp', action='store_true', help='modo datagrama UDP')
+    parser.add_argument('--lobby', help='pedir partida al lobby en host:puerto')
+    parser.add_argument('--en-sitio', action='store_true',
+                        help='tablero fijo arriba de la consola, actualizado con ANSI')
+    args = parser.parse_args(argv)
+
+    from .cliente import NavalClientFSM
+
+    cliente = NavalClientFSM()
+    cliente.server_host = args.host
+    cliente.server_port = args.puerto
+    cliente.modo_udp = args.udp
+    cliente.mostrar_en_sitio = args.en_sitio
+    if args.transporte:
+        from .transporte import crear_transporte
+        cliente.transporte = crear_transporte(args.transporte)
+    if args.lobby:
+        host, _, puerto = args.lobby.rpartition(':')
+        print("Esperando partida en el lobby...")
+        partida = cliente.unirse_lobby(host or 'localhost', int(puerto))
+        if partida is None:
+            return 1
+        print(f"Partida {partida} en {cliente.server_host}:{cliente.server_port}")
+    cliente.iniciar_cliente()
+
+
+def _lobby(argv):
+    from .lobby import main
+    return main(argv)
+
+
+def _raid(argv):
+    from .actores import main
+    return main(argv)
+
+
+def _torneo(argv):
+    from .torneo import main
+    main(argv)
+
+
+def _archivo(argv):
+    from .archivo import main
+    main(argv)
+
+
+def _resolver(argv):
+    from .solucionador import main
+    return main(argv)
+
+
+def _gui_servidor(argv):
+    from .gui_servidor import main
+    main()
+
+
+def _gui_cliente(argv):
+    from .gui_cliente import main
+    main()
+
+
+COMANDOS = {
+    'servidor': _servidor,
+    'cliente': _cliente,
+    'lobby': _lobby,
+    'raid': _raid,
+    'torneo': _torneo,
+    'archivo': _archivo,
+    'resolver': _resolver,
+    'gui-servidor': _gui_servidor,
+    'gui-cliente': _gui_cliente,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMANDOS:
+        print(__doc__.strip())
+        return 0 if argv and argv[0] in ('-h', '--help') else 2
+    return COMANDOS[argv[0]](argv[1:]) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+FSM Naval Battle - Partidas como Actores
+-----------------------------------
+Cada partida es un actor: un buzón FIFO (`queue.Queue`) y un hilo propio que
+aplica los mensajes de a uno. Ese hilo es el único que modifica el
+`NavalServerFSM` de la partida, así que muchos atacantes pueden disparar a
+la vez a la misma flota (partidas en equipo / raid) sin cerrojos en el
+servidor. Partidas distintas tienen hilos y buzones distintos y no comparten
+nada: corren en paralelo entre sí.
+
+- `ActorPartida.enviar()`   encola un mensaje del protocolo ("A1", "STATE")
+                            y devuelve un Future con (código, respuesta).
+- `ActorPartida.ejecutar()` encola cualquier función sobre el servidor (ej:
+                            las ediciones de flota de la GUI), que así no se
+                            mezclan con un ataque a medio aplicar.
+- `SistemaActores`          registro id -> actor.
+- `ServidorRaid`            servidor TCP con varios hilos de conexión que
+                            entregan los disparos al actor de la partida.
+
+Métricas por partida (`estadisticas()`):
+- mensajes por segundo y capacidad (mensajes por segundo de trabajo del hilo)
+- espera en el buzón, media y máxima
+- equidad del orden de disparo: inversiones = disparos aplicados después de
+  otro que llegó más tarde (llegada = aceptación de la conexión en
+  ServidorRaid); con un solo productor siempre es 0
+- por atacante: disparos, impactos y espera media; índice de Jain sobre los
+  disparos aplicados (rendimiento de cada atacante en la misma ventana de
+  tiempo) y sobre la espera media (1.0 = todos recibieron el mismo trato)
+
+Uso:
+    python3 -m fsm_naval raid [--partidas 4] [--atacantes 16] [--segundos 1]
+    python3 -m fsm_naval raid --puerto 5000 [--hilos 16] [--sin-limites]   # una partida por TCP
+"""
+
+import time
+import queue
+import random
+import socket
+import argparse
+import threading
+from concurrent.futures import Future
+
+from .transporte import TransporteTCP
+
+# Marca de fin en el buzón
+_FIN = object()
+
+
+class ActorPartida:
+    """
+    Partida servida por un hilo propio que procesa su buzón en orden.
+
+    Args:
+        servidor: NavalServerFSM de la partida (solo lo modifica el hilo del actor)
+        nombre: id de la partida (por defecto, el token de sesión del servidor)
+        max_buzon: mensajes en espera como máximo (0 = sin límite); con el buzón
+                   lleno enviar() bloquea al productor
+    """
+
+    def __init__(self, servidor, nombre=None, max_buzon=0):
+        self.servidor = servidor
+        self.nombre = nombre or servidor.token_sesion
+        self.buzon = queue.Queue(max_buzon)
+        self._activo = True
+
+        # Métricas (las actualiza solo el hilo del actor)
+        self.mensajes = 0
+        self.ocupado = 0.0               # Segundos de trabajo del hilo
+        self.espera_total = 0.0
+        self.espera_max = 0.0
+        self.inversiones = 0             # Disparos adelantados por uno que llegó después
+        self.primera_llegada = None
+        self.ultimo_fin = None
+        self._ultima_llegada = float('-inf')
+        self.por_atacante = {}           # clave -> [disparos, impactos, espera_total]
+
+        self._hilo = threading.Thread(target=self._bucle, name=f"partida-{self.nombre}", daemon=True)
+        self._hilo.start()
+
+    # ------------------------------------------------------------------
+    # Buzón
+    # ------------------------------------------------------------------
+    def enviar(self, mensaje, origen=None, llegada=None, atacante=None):
+        """
+        Encola un mensaje del protocolo para la partida.
+
+        Args:
+            mensaje: texto recibido (ej: 'A1' o 'STATE:token:versión')
+            origen: dirección del cliente (para el control de admisión)
+            llegada: instante de llegada (time.perf_counter); por defecto, ahora
+            atacante: clave del atacante para las métricas (por defecto, la IP de origen)
+
+        Returns:
+            Future con el Tuple (código_respuesta, mensaje_detalle).
+        """
+        if atacante is None and origen is not None:
+            atacante = origen[0] if isinstance(origen, tuple) else origen
+        futuro = Future()
+        llegada = time.perf_counter() if llegada is None else llegada
+        self._encolar((self._mensaje, (mensaje, origen), futuro, llegada, atacante))
+        return futuro
+
+    def ejecutar(self, funcion, *args):
+        """
+        Ejecuta funcion(*args) en el hilo de la partida, entre dos mensajes.
+
+        Returns:
+            Future con el valor devuelto por la función.
+        """
+        futuro = Future()
+        self._encolar((funcion, args, futuro, None, None))
+        return futuro
+
+    def _encolar(self, pedido):
+        if not self._activo:
+            raise RuntimeError(f"Partida {self.nombre} detenida")
+        self.buzon.put(pedido)
+
+    def _mensaje(self, mensaje, origen):
+        servidor = self.servidor
+        codigo, respuesta = servidor.procesar_mensaje(mensaje, origen)
+        if codigo not in ("429", "503"):
+            # Los observadores ven el tablero entre dos mensajes, nunca a medio aplicar
+            for observador in servidor.observadores:
+                observador(servidor)
+        return codigo, respuesta
+
+    def _bucle(self):
+        reloj = time.perf_counter
+        servidor = self.servidor
+        while True:
+            # Con una ventana de perfilado abierta (PROFILE llega por el buzón y se
+            # inicia en este hilo), despertar para cerrarla aunque no haya mensajes
+            perfilador = servidor.perfilador
+            try:
+                pedido = self.buzon.get(timeout=0.5 if perfilador and perfilador.activo else None)
+            except queue.Empty:
+                perfilador.revisar()
+                continue
+            if pedido is _FIN:
+                break
+            funcion, args, futuro, llegada, atacante = pedido
+            if not futuro.set_running_or_notify_cancel():
+                continue
+
+            inicio = reloj()
+            try:
+                resultado = funcion(*args)
+            except Exception as e:
+                futuro.set_exception(e)
+                continue
+            # Métricas antes de responder: quien recibe el resultado ya las ve actualizadas
+            if llegada is not None:
+                self._medir(llegada, inicio, reloj(), atacante, resultado[0])
+            futuro.set_result(resultado)
+            if servidor.perfilador:
+                servidor.perfilador.revisar()
+
+        if servidor.perfilador:
+            servidor.perfilador.revisar(cerrar=True)
+
+        # Responder a lo que haya quedado detrás de la marca de fin
+        while True:
+            try:
+                pedido = self.buzon.get_nowait()
+            except queue.Empty:
+                break
+            if pedido is not _FIN:
+                pedido[2].set_exception(RuntimeError(f"Partida {self.nombre} detenida"))
+
+    def _medir(self, llegada, inicio, fin, atacante, codigo):
+        self.mensajes += 1
+        self.ocupado += fin - inicio
+        espera = inicio - llegada
+        self.espera_total += espera
+        if espera > self.espera_max:
+            self.espera_max = espera
+        if self.primera_llegada is None:
+            self.primera_llegada = llegada
+        self.ultimo_fin = fin
+
+        if llegada < self._ultima_llegada:
+            self.inversiones += 1
+        else:
+            self._ultima_llegada = llegada
+
+        datos = self.por_atacante.get(atacante)
+        if datos is None:
+            datos = self.por_atacante[atacante] = [0, 0, 0.0]
+        datos[0] += 1
+        if codigo == "200":
+            datos[1] += 1
+        datos[2] += espera
+
+    def detener(self, esperar=True):
+        """Procesa lo ya encolado y termina el hilo; los envíos posteriores fallan."""
+        if self._activo:
+            self._activo = False
+            self.buzon.put(_FIN)
+        if esperar:
+            self._hilo.join()
+
+    # ------------------------------------------------------------------
+    # Métricas
+    # ------------------------------------------------------------------
+    def estadisticas(self):
+        n = self.mensajes
+        duracion = (self.ultimo_fin - self.primera_llegada) if n else 0.0
+        disparos = [d for d, _, _ in self.por_atacante.values()]
+        esperas = [e / d for d, _, e in self.por_atacante.values()]
+        return {
+            'partida': self.nombre,
+            'mensajes': n,
+            'por_segundo': n / duracion if duracion > 0 else 0.0,
+            'capacidad': n / self.ocupado if self.ocupado > 0 else 0.0,
+            'espera_media_ms': 1000 * self.espera_total / n if n else 0.0,
+            'espera_max_ms': 1000 * self.espera_max,
+            'inversiones': self.inversiones,
+            'en_buzon': self.buzon.qsize(),
+            'equidad': indice_jain(disparos),
+            'equidad_espera': indice_jain(esperas),
+            'atacantes': {
+                clave: {'disparos': d, 'impactos': i, 'espera_media_ms': 1000 * e / d}
+                for clave, (d, i, e) in self.por_atacante.items()
+            },
+        }
+
+
+def indice_jain(valores):
+    """Índice de equidad de Jain, (Σx)² / (n·Σx²): 1.0 = todos iguales, 1/n = uno se lleva todo."""
+    suma_cuadrados = sum(x * x for x in valores)
+    return sum(valores) ** 2 / (len(valores) * suma_cuadrados) if suma_cuadrados else 1.0
+
+
+class SistemaActores:
+    """Registro de partidas-actor: id de partida -> ActorPartida."""
+
+    def __init__(self):
+        self.actores = {}
+        self._lock = threading.Lock()   # Solo protege el registro, no las partidas
+
+    def crear(self, servidor, nombre=None, max_buzon=0):
+        """Crea y registra el actor de una partida (ValueError si el id ya existe)."""
+        actor = ActorPartida(servidor, nombre, max_buzon)
+        with self._lock:
+            if actor.nombre in self.actores:
+                actor.detener()
+                raise ValueError(f"La partida {actor.nombre} ya existe")
+            self.actores[actor.nombre] = actor
+        return actor
+
+    def obtener(self, nombre):
+        return self.actores.get(nombre)
+
+    def enviar(self, nombre, mensaje, origen=None, llegada=None, atacante=None):
+        """
+        Encola un mensaje para la partida `nombre`.
+
+        Returns:
+            Future con (código, respuesta); ("410", "Partida_Desconocida") si no existe.
+        """
+        actor = self.actores.get(nombre)
+        if actor is None:
+            futuro = Future()
+            futuro.set_result(("410", "Partida_Desconocida"))
+            return futuro
+        return actor.enviar(mensaje, origen, llegada, atacante)
+
+    def detener(self, nombre):
+        with self._lock:
+            actor = self.actores.pop(nombre, None)
+        if actor is not None:
+            actor.detener()
+        return actor
+
+    def detener_todos(self):
+        with self._lock:
+            actores, self.actores = list(self.actores.values()), {}
+        for actor in actores:
+            actor.detener(esperar=False)
+        for actor in actores:
+            actor.detener()
+
+    def estadisticas(self):
+        return {nombre: actor.estadisticas() for nombre, actor in list(self.actores.items())}
+
+
+class ServidorRaid:
+    """
+    Servidor TCP de una partida con muchos atacantes simultáneos.
+
+    El hilo principal solo acepta conexiones y anota su llegada; un número
+    fijo de hilos lee cada mensaje y lo entrega al actor, que los aplica en
+    orden. Las conexiones esperan a un hilo en una cola acotada: con la cola
+    llena se responde 503 enseguida en vez de acumular latencia.
+
+    PROFILE pasa por el buzón como cualquier mensaje: perfila el hilo del actor
+    (la aplicación de los disparos), que cierra la ventana cuando vence.
+
+    Args:
+        actor: ActorPartida de la partida
+        host, port: dirección de escucha (port=0: puerto libre)
+        hilos: hilos de conexión (lectura/escritura de sockets)
+        max_pendientes: conexiones aceptadas esperando un hilo (por defecto 4 por hilo)
+    """
+
+    # Espera sugerida a los rechazados por cola llena (milisegundos)
+    ESPERA_SATURADO = 50
+
+    def __init__(self, actor, host='', port=5000, hilos=16, max_pendientes=None):
+        self.actor = actor
+        self.host = host
+        self.port = port
+        self.hilos = hilos
+        self.max_pendientes = max_pendientes or 4 * hilos
+        self.server_socket = None
+
+        # Estadísticas
+        self.rechazadas = 0
+
+    def _trabajar(self, pendientes):
+        while True:
+            pedido = pendientes.get()
+            if pedido is None:
+                return
+            self._atender(*pedido)
+
+    def _atender(self, conn, direccion, llegada):
+        try:
+            conn.settimeout(self.actor.servidor.timeout_cliente)
+            datos = conn.recv(1024).decode(errors='replace').strip()
+            if not datos:
+                return
+            codigo, respuesta = self.actor.enviar(datos, direccion, llegada).result()
+            conn.sendall(f"{codigo}:{respuesta}".encode())
+            if codigo == "200" and respuesta.startswith("Hundido:"):
+                print("\n¡Toda la flota ha sido hundida!")
+        except (OSError, RuntimeError) as e:
+            print(f"Error al procesar la solicitud: {e}")
+        finally:
+            conn.close()
+
+    def _rechazar(self, conn):
+        """Responde 503 sin pasar por el actor (cola de conexiones llena)."""
+        self.rechazadas += 1
+        try:
+            # Leer el mensaje antes de cerrar: cerrar con datos sin leer envía RST
+            # y el cliente perdería la respuesta
+            conn.settimeout(0.05)
+            conn.recv(1024)
+            conn.sendall(f"503:Servidor_Saturado:{self.ESPERA_SATURADO}".encode())
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def detener(self):
+        """Cierra el socket de escucha (se puede llamar desde otro hilo)."""
+        if self.server_socket:
+            try:
+                self.server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.server_socket.close()
+
+    def iniciar(self):
+        """
+        Atiende la partida hasta que se llame a detener().
+
+        Returns:
+            True si llegó a escuchar, False si no (ej: puerto en uso).
+        """
+        transporte = TransporteTCP(self.host, self.port)
+        pendientes = queue.Queue(self.max_pendientes)
+        hilos = [threading.Thread(target=self._trabajar, args=(pendientes,), name=f"raid-{i}", daemon=True)
+                 for i in range(self.hilos)]
+        for hilo in hilos:
+            hilo.start()
+        try:
+            self.server_socket = transporte.escuchar(max(self.actor.servidor.max_pendientes, self.max_pendientes))
+            self.port = transporte.port
+            print(f"Partida {self.actor.nombre} (raid) escuchando en {transporte} con {self.hilos} hilos...")
+            while True:
+                conn, direccion = self.server_socket.accept()
+                try:
+                    pendientes.put_nowait((conn, direccion, time.perf_counter()))
+                except queue.Full:
+                    self._rechazar(conn)
+        except KeyboardInterrupt:
+            print("\nServidor detenido por el usuario.")
+        except OSError as e:
+            # detener() cierra el socket: accept() falla y se sale del bucle.
+            # Sin socket (ej: puerto en uso) es un error de verdad.
+            if self.server_socket is None or self.server_socket.fileno() != -1:
+                print(f"Error en el servidor: {e}")
+        finally:
+            if self.server_socket:
+                self.server_socket.close()
+            for _ in hilos:
+                pendientes.put(None)
+            for hilo in hilos:
+                hilo.join()
+            if self.server_socket is not None:
+                self.actor.ejecutar(self.actor.servidor.archivar_partida).result()
+                mostrar_estadisticas([self.actor.estadisticas()])
+                if self.rechazadas:
+                    print(f"{self.rechazadas} conexiones rechazadas con 503 (cola llena)")
+            print("Servidor cerrado.")
+        return self.server_socket is not None
+
+
+# ----------------------------------------------------------------------
+# Simulación y línea de comandos
+# ----------------------------------------------------------------------
+def simular_raid(partidas=4, atacantes=16, segundos=1.0, semilla=0):
+    """
+    Varias partidas con muchos atacantes (hilos) disparando a la vez a cada una.
+
+    Cada atacante dispara a celdas al azar de su partida (las repetidas reciben
+    409) sin pasar por la red, tan rápido como puede durante `segundos`: los
+    disparos de cada uno miden su rendimiento y el índice de Jain, si el
+    actor los atendió por igual.
+
+    Returns:
+        Tuple: (lista de estadísticas por partida, errores de consistencia)
+    """
+    from .servidor import NavalServerFSM
+    from .torneo import defensor_aleatorio
+
+    sistema = SistemaActores()
+    rng = random.Random(semilla)
+    for p in range(partidas):
+        servidor = NavalServerFSM()
+        defensor_aleatorio(servidor, rng)
+        sistema.crear(servidor, f"raid{p}")
+
+    respuestas = {nombre: [] for nombre in sistema.actores}
+    largada = threading.Barrier(partidas * atacantes)
+
+    def atacante(nombre, n):
+        rng_atacante = random.Random(f"{semilla}:{nombre}:{n}")
+        coords = list(sistema.obtener(nombre).servidor.tablero)
+        propias = []
+        largada.wait()
+        fin = time.perf_counter() + segundos
+        while time.perf_counter() < fin:
+            coord = rng_atacante.choice(coords)
+            propias.append((coord, sistema.enviar(nombre, coord, atacante=n).result()))
+        respuestas[nombre].extend(propias)   # list.extend es atómico
+
+    hilos = [threading.Thread(target=atacante, args=(nombre, n))
+             for nombre in sistema.actores for n in range(atacantes)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    # Consistencia: cada celda se aplica una sola vez y hay tantos impactos como celdas de barco
+    errores = []
+    for nombre, lista in respuestas.items():
+        servidor = sistema.obtener(nombre).servidor
+        aplicadas = [c for c, (codigo, _) in lista if codigo != "409"]
+        impactos = sum(1 for _, (codigo, _) in lista if codigo == "200")
+        celdas_barco = sum(1 for v in servidor.tablero.values() if v)
+        if len(aplicadas) != len(set(aplicadas)):
+            errores.append(f"{nombre}: celdas aplicadas más de una vez")
+        if impactos != sum(1 for c in set(aplicadas) if servidor.tablero[c]) or impactos > celdas_barco:
+            errores.append(f"{nombre}: impactos inconsistentes ({impactos})")
+
+    estadisticas = list(sistema.estadisticas().values())
+    sistema.detener_todos()
+    return estadisticas, errores
+
+
+def mostrar_estadisticas(estadisticas):
+    print(f"\n{'Partida':<18}{'Mensajes':>9}{'msg/s':>10}{'capac.':>10}"
+          f"{'espera ms':>11}{'máx ms':>9}{'invers.':>9}{'Jain':>7}{'Jain esp.':>10}")
+    for e in estadisticas:
+        print(f"{e['partida']:<18}{e['mensajes']:>9}{e['por_segundo']:>10.0f}{e['capacidad']:>10.0f}"
+              f"{e['espera_media_ms']:>11.3f}{e['espera_max_ms']:>9.2f}{e['inversiones']:>9}"
+              f"{e['equidad']:>7.3f}{e['equidad_espera']:>10.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='fsm_naval raid',
+                                     description='Partidas con muchos atacantes simultáneos (actores)')
+    parser.add_argument('--partidas', type=int, default=4)
+    parser.add_argument('--atacantes', type=int, default=16, help='atacantes (hilos) por partida')
+    parser.add_argument('--segundos', type=float, default=1.0, help='duración de la simulación')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--puerto', type=int, help='servir una partida por TCP en este puerto')
+    parser.add_argument('--host', default='')
+    parser.add_argument('--hilos', type=int, default=16, help='hilos de conexión del servidor TCP')
+    parser.add_argument('--sin-limites', action='store_true', help='desactivar el control de admisión')
+    args = parser.parse_args(argv)
+
+    if args.puerto is not None:
+        from .servidor import NavalServerFSM
+        from .torneo import defensor_aleatorio
+        servidor = NavalServerFSM()
+        defensor_aleatorio(servidor, random.Random(args.semilla))
+        if not args.sin_limites:
+            from .admision import ControlAdmision
+            # Una partida raid la comparten muchos clientes: su límite es el global
+            servidor.admision = ControlAdmision(tasa_partida=2000.0, rafaga_partida=500)
+        actor = ActorPartida(servidor)
+        escucho = ServidorRaid(actor, args.host, args.puerto, args.hilos).iniciar()
+        actor.detener()
+        return 0 if escucho else 1
+
+    inicio = time.perf_counter()
+    estadisticas, errores = simular_raid(args.partidas, args.atacantes, args.segundos, args.semilla)
+    total = sum(e['mensajes'] for e in estadisticas)
+    mostrar_estadisticas(estadisticas)
+    print(f"\n{total} mensajes en {time.perf_counter() - inicio:.2f} s")
+    for error in errores:
+        print(f"ERROR: {error}")
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    main()
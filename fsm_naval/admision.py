@@ -0,0 +1,158 @@
+"""
+FSM Naval Battle - Control de Admisión
+-----------------------------------
+Limita el ritmo de mensajes con cubetas de tokens (token bucket) en tres
+niveles, para que un bot agresivo no acapare el servidor:
+
+- por cliente (dirección de origen), con un número acotado de clientes
+  recordados (los menos recientes se olvidan, LRU)
+- por partida (token de sesión del servidor, o id de partida del lobby)
+- global (todo el servidor)
+
+Cuando un mensaje no se admite se responde sin procesarlo, indicando cuántos
+milisegundos esperar antes de reintentar:
+
+    429:Reduzca_Velocidad:<ms>   el cliente o la partida superó su ritmo
+    503:Servidor_Saturado:<ms>   se superó el límite global
+
+`NavalClientFSM` reconoce ambas respuestas y reintenta con espera
+exponencial y variación aleatoria (jitter).
+"""
+
+import time
+from collections import OrderedDict
+
+
+class CubetaTokens:
+    """
+    Cubeta de tokens: admite ráfagas de hasta `capacidad` mensajes y,
+    sostenidamente, `tasa` mensajes por segundo.
+    """
+
+    __slots__ = ('tasa', 'capacidad', 'tokens', 'ultimo')
+
+    def __init__(self, tasa, capacidad, ahora):
+        self.tasa = tasa
+        self.capacidad = capacidad
+        self.tokens = capacidad
+        self.ultimo = ahora
+
+    def espera(self, ahora):
+        """
+        Recarga la cubeta hasta `ahora`.
+
+        Returns:
+            Segundos que faltan para tener un token (0.0 si ya hay uno).
+        """
+        self.tokens = min(self.capacidad, self.tokens + (ahora - self.ultimo) * self.tasa)
+        self.ultimo = ahora
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.tasa
+
+    def consumir(self):
+        self.tokens -= 1
+
+
+class ControlAdmision:
+    """
+    Control de admisión por cliente, por partida y global.
+
+    Args:
+        tasa_cliente, rafaga_cliente: mensajes/s y ráfaga permitidos a cada cliente
+        tasa_partida, rafaga_partida: ídem para cada partida
+        tasa_global, rafaga_global: ídem para todo el servidor
+        max_clientes: clientes (y partidas) recordados como máximo
+        reloj: función de tiempo en segundos (monótona)
+    """
+
+    def __init__(self, tasa_cliente=20.0, rafaga_cliente=10, tasa_partida=100.0, rafaga_partida=40,
+                 tasa_global=2000.0, rafaga_global=500, max_clientes=4096, reloj=time.monotonic):
+        self.tasa_cliente = tasa_cliente
+        self.rafaga_cliente = rafaga_cliente
+        self.tasa_partida = tasa_partida
+        self.rafaga_partida = rafaga_partida
+        self.max_clientes = max_clientes
+        self.reloj = reloj
+
+        self.global_ = CubetaTokens(tasa_global, rafaga_global, reloj())
+        self.clientes = OrderedDict()  # clave de cliente -> CubetaTokens, del menos al más reciente
+        self.partidas = OrderedDict()  # id de partida -> CubetaTokens
+
+        # Estadísticas
+        self.admitidos = 0
+        self.limitados = 0    # Respuestas 429
+        self.saturados = 0    # Respuestas 503
+
+    def _cubeta(self, tabla, clave, tasa, capacidad, ahora):
+        cubeta = tabla.get(clave)
+        if cubeta is None:
+            cubeta = tabla[clave] = CubetaTokens(tasa, capacidad, ahora)
+            if len(tabla) > self.max_clientes:
+                # Olvidar al menos reciente: vuelve con la cubeta llena, como uno nuevo
+                tabla.popitem(last=False)
+        else:
+            tabla.move_to_end(clave)
+        return cubeta
+
+    def admitir(self, origen, partida=None):
+        """
+        Decide si se procesa un mensaje.
+
+        Args:
+            origen: dirección del cliente (tupla (ip, puerto) en TCP/UDP; se usa la IP)
+            partida: id de la partida a la que va el mensaje (None = sin partida)
+
+        Returns:
+            None si se admite; si no, Tuple (código_respuesta, mensaje_detalle).
+        """
+        ahora = self.reloj()
+        clave = origen[0] if isinstance(origen, tuple) else origen
+        cliente = self._cubeta(self.clientes, clave, self.tasa_cliente, self.rafaga_cliente, ahora)
+        cubetas = [cliente]
+        if partida is not None:
+            cubetas.append(self._cubeta(self.partidas, partida, self.tasa_partida, self.rafaga_partida, ahora))
+
+        # Se miran todas antes de consumir: un rechazo no gasta tokens de los otros niveles
+        espera = max(c.espera(ahora) for c in cubetas)
+        if espera > 0:
+            self.limitados += 1
+            return "429", f"Reduzca_Velocidad:{_milisegundos(espera)}"
+        espera = self.global_.espera(ahora)
+        if espera > 0:
+            self.saturados += 1
+            return "503", f"Servidor_Saturado:{_milisegundos(espera)}"
+
+        for c in cubetas:
+            c.consumir()
+        self.global_.consumir()
+        self.admitidos += 1
+        return None
+
+    def estadisticas(self):
+        return {
+            'admitidos': self.admitidos,
+            'limitados': self.limitados,
+            'saturados': self.saturados,
+            'clientes': len(self.clientes),
+        }
+
+
+def _milisegundos(segundos):
+    # Redondeo hacia arriba: reintentar antes de tiempo solo produce otro rechazo
+    return max(1, int(segundos * 1000 + 0.999))
+
+
+def espera_sugerida(respuesta):
+    """
+    Extrae la espera (en segundos) de una respuesta 429/503.
+
+    Returns:
+        Segundos a esperar, o None si la respuesta no pide esperar.
+    """
+    if not (respuesta.startswith("429:") or respuesta.startswith("503:")):
+        return None
+    try:
+        return int(respuesta.rsplit(':', 1)[1]) / 1000
+    except ValueError:
+        return 0.0
@@ -0,0 +1,464 @@
+"""
+FSM Naval Battle - Archivo de Partidas
+-----------------------------------
+Archivo binario compacto para guardar las partidas terminadas del servidor
+de defensa y recorrerlas rápidamente (analítica, entrenamiento de estrategias).
+
+Se usan dos ficheros por archivo:
+
+- `<base>.dat`: registros de longitud variable, uno por partida.
+    cabecera  <IBBBH : marca de tiempo, filas, columnas, resultado, nº de disparos
+    flota     3 máscaras de bits (D, S, L) de ceil(filas*columnas/8) bytes cada una
+    disparos  índices de celda empaquetados (1 byte, o 2 si el tablero supera 256 celdas)
+
+- `<base>.idx`: índice de entradas fijas de 16 bytes.
+    <QHBBHBx  : desplazamiento en .dat, día (desde 1970), filas, columnas,
+                nº de disparos, resultado
+
+- `<base>.part/<filas>x<columnas>-<disparos>.num`: índices secundarios, uno
+  por tamaño de tablero y nº de disparos, con los números de partida (<Q) de
+  esa combinación. Una búsqueda por tamaño o por disparos solo lee las
+  particiones que corresponden, no el índice entero. Si faltan o quedaron
+  cortas (archivo viejo, escritura interrumpida) se regeneran desde `.idx`.
+
+Como las partidas se agregan en orden cronológico, el índice y cada partición
+están ordenados por día y se puede buscar por fecha con búsqueda binaria. La
+lectura se hace con archivos mapeados en memoria (mmap), sin cargar el archivo
+completo.
+
+Varios procesos pueden agregar al mismo archivo: cada escritura toma un
+bloqueo exclusivo (flock) sobre `.idx` y busca el final real de los ficheros.
+Donde no hay `fcntl` (Windows) no hay bloqueo y debe escribir un solo proceso.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo, un solo proceso escritor
+    fcntl = None
+
+# Resultados posibles de una partida
+RESULTADO_INCOMPLETA = 0  # Partida abandonada (limpiar_flota / cierre del servidor)
+RESULTADO_HUNDIDA = 1     # Toda la flota fue hundida
+
+# Orden fijo de los tipos de barco dentro del registro
+TIPOS_BARCO = ('D', 'S', 'L')
+
+CABECERA = struct.Struct('<IBBBH')
+ENTRADA_INDICE = struct.Struct('<QHBBHBx')
+NUMERO_PARTIDA = struct.Struct('<Q')
+
+SEGUNDOS_POR_DIA = 86400
+
+
+def indice_celda(pos, columnas):
+    """Convierte una posición (ej: 'B3') en su índice lineal por filas."""
+    return (ord(pos[0]) - ord('A')) * columnas + int(pos[1:]) - 1
+
+
+def celda_indice(indice, columnas):
+    """Convierte un índice lineal en su posición (ej: 7 -> 'B3' con 5 columnas)."""
+    fila, col = divmod(indice, columnas)
+    return f"{chr(ord('A') + fila)}{col + 1}"
+
+
+def _bytes_mascara(celdas):
+    return (celdas + 7) // 8
+
+
+def _dia(marca_tiempo):
+    return int(marca_tiempo) // SEGUNDOS_POR_DIA
+
+
+def _bloquear(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _desbloquear(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _nombre_particion(filas, columnas, n_disparos):
+    return f"{filas}x{columnas}-{n_disparos}.num"
+
+
+def _clave_particion(nombre):
+    """'5x5-12.num' -> (5, 5, 12), o None si no es una partición."""
+    tam, _, resto = nombre.partition('x')
+    columnas, _, resto = resto.partition('-')
+    n_disparos, _, extension = resto.partition('.')
+    if extension != 'num' or not (tam.isdigit() and columnas.isdigit() and n_disparos.isdigit()):
+        return None
+    return int(tam), int(columnas), int(n_disparos)
+
+
+class ArchivoPartidas:
+    """
+    Escritura y lectura del archivo de partidas terminadas.
+
+    Uso típico:
+        archivo = ArchivoPartidas('partidas')
+        servidor.archivo = archivo          # el servidor archiva al terminar
+        ...
+        for partida in archivo.buscar(filas=5, columnas=5, max_disparos=12):
+            ...
+    """
+
+    def __init__(self, base):
+        self.ruta_datos = f"{base}.dat"
+        self.ruta_indice = f"{base}.idx"
+        self.ruta_particiones = f"{base}.part"
+
+        # Descriptores de escritura (se abren al agregar la primera partida)
+        self._f_datos = None
+        self._f_indice = None
+
+        # Mapas de memoria para lectura
+        self._mm_datos = None
+        self._mm_indice = None
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+    def agregar(self, servidor, marca_tiempo=None):
+        """
+        Agrega la partida actual de un `NavalServerFSM` o un `EstadoPartida` al archivo.
+
+        Args:
+            servidor: instancia con `filas`, `columnas`, `tablero`,
+                `secuencia_ataques` y `estado_actual`.
+            marca_tiempo: segundos desde 1970 (por defecto, ahora).
+
+        Returns:
+            Número de la partida dentro del archivo.
+        """
+        resultado = RESULTADO_HUNDIDA if servidor.estado_actual == servidor.HUNDIDO else RESULTADO_INCOMPLETA
+        flota = {t: [] for t in TIPOS_BARCO}
+        for pos, tipo in servidor.tablero.items():
+            if tipo in flota:
+                flota[tipo].append(pos)
+        return self.agregar_partida(servidor.filas, servidor.columnas, flota,
+                                    servidor.secuencia_ataques, resultado, marca_tiempo)
+
+    def agregar_partida(self, filas, columnas, flota, disparos, resultado, marca_tiempo=None):
+        """
+        Agrega una partida a partir de sus datos.
+
+        Args:
+            filas, columnas: tamaño del tablero
+            flota: mapa tipo -> posiciones (ej: {'S': ['B1','B2']})
+            disparos: secuencia de posiciones atacadas, en orden
+            resultado: RESULTADO_HUNDIDA o RESULTADO_INCOMPLETA
+            marca_tiempo: segundos desde 1970 (por defecto, ahora)
+
+        Returns:
+            Número de la partida dentro del archivo.
+        """
+        if marca_tiempo is None:
+            marca_tiempo = time.time()
+        celdas = filas * columnas
+        n_bytes = _bytes_mascara(celdas)
+
+        registro = bytearray(CABECERA.pack(int(marca_tiempo), filas, columnas, resultado, len(disparos)))
+        for tipo in TIPOS_BARCO:
+            mascara = 0
+            for pos in flota.get(tipo, ()):
+                mascara |= 1 << indice_celda(pos, columnas)
+            registro += mascara.to_bytes(n_bytes, 'little')
+
+        indices = [indice_celda(p, columnas) for p in disparos]
+        if celdas <= 256:
+            registro += bytes(indices)
+        else:
+            registro += struct.pack(f'<{len(indices)}H', *indices)
+
+        if self._f_datos is None:
+            self._f_datos = open(self.ruta_datos, 'ab')
+            self._f_indice = open(self.ruta_indice, 'ab')
+            os.makedirs(self.ruta_particiones, exist_ok=True)
+
+        _bloquear(self._f_indice)
+        try:
+            # Otro proceso pudo agregar desde nuestra última escritura: tell() sin
+            # seek daría el final que conocíamos, no el real
+            desplazamiento = self._f_datos.seek(0, os.SEEK_END)
+            self._f_datos.write(registro)
+            self._f_datos.flush()
+            numero = self._f_indice.seek(0, os.SEEK_END) // ENTRADA_INDICE.size
+            self._f_indice.write(ENTRADA_INDICE.pack(desplazamiento, _dia(marca_tiempo), filas, columnas,
+                                                     len(disparos), resultado))
+            self._f_indice.flush()
+            with open(os.path.join(self.ruta_particiones, _nombre_particion(filas, columnas, len(disparos))),
+                      'ab') as f:
+                f.write(NUMERO_PARTIDA.pack(numero))
+        finally:
+            _desbloquear(self._f_indice)
+        return numero
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+    def _mapear(self):
+        """Mapea en memoria los ficheros de datos e índice (solo lectura)."""
+        if self._f_datos is not None:
+            self._f_datos.flush()
+            self._f_indice.flush()
+        # Volver a mapear si el archivo creció desde el último mapeo
+        tam_indice = os.path.getsize(self.ruta_indice) if os.path.exists(self.ruta_indice) else 0
+        if self._mm_indice is not None and len(self._mm_indice) == tam_indice:
+            return
+        self._desmapear()
+        if tam_indice == 0:
+            return
+        with open(self.ruta_indice, 'rb') as f:
+            self._mm_indice = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.ruta_datos, 'rb') as f:
+            self._mm_datos = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _desmapear(self):
+        for mm in (self._mm_indice, self._mm_datos):
+            if mm is None:
+                continue
+            try:
+                mm.close()
+            except BufferError:
+                # Un recorrido de `indices` todavía tiene una vista sobre el
+                # mapa anterior: se libera solo cuando la vista se suelte.
+                pass
+        self._mm_indice = None
+        self._mm_datos = None
+
+    def __len__(self):
+        self._mapear()
+        if self._mm_indice is None:
+            return 0
+        return len(self._mm_indice) // ENTRADA_INDICE.size
+
+    def _dia_entrada(self, i):
+        return ENTRADA_INDICE.unpack_from(self._mm_indice, i * ENTRADA_INDICE.size)[1]
+
+    def _buscar_dia(self, dia, n, particion=None):
+        """
+        Primera posición con día >= `dia` (búsqueda binaria), en el índice o,
+        si se indica, en una partición (mmap de números de partida).
+        """
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = mid if particion is None else NUMERO_PARTIDA.unpack_from(particion, mid * NUMERO_PARTIDA.size)[0]
+            if self._dia_entrada(i) < dia:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # ------------------------------------------------------------------
+    # Índices secundarios
+    # ------------------------------------------------------------------
+    def _listar_particiones(self):
+        """Particiones en disco: (filas, columnas, disparos) -> (ruta, nº de partidas)."""
+        particiones = {}
+        try:
+            entradas = os.scandir(self.ruta_particiones)
+        except FileNotFoundError:
+            return particiones
+        with entradas:
+            for entrada in entradas:
+                clave = _clave_particion(entrada.name)
+                if clave is not None:
+                    particiones[clave] = (entrada.path, entrada.stat().st_size // NUMERO_PARTIDA.size)
+        return particiones
+
+    def _reconstruir_particiones(self):
+        """Regenera las particiones desde el índice principal (con el bloqueo de escritura)."""
+        os.makedirs(self.ruta_particiones, exist_ok=True)
+        with open(self.ruta_indice, 'rb') as f:
+            _bloquear(f)
+            try:
+                datos = f.read()
+                datos = datos[:len(datos) - len(datos) % ENTRADA_INDICE.size]
+                existentes = self._listar_particiones()
+                if sum(n for _, n in existentes.values()) == len(datos) // ENTRADA_INDICE.size:
+                    return  # Otro proceso ya las regeneró
+                numeros = {}
+                for i, (_, _, filas, columnas, nd, _) in enumerate(ENTRADA_INDICE.iter_unpack(datos)):
+                    numeros.setdefault((filas, columnas, nd), []).append(i)
+                for clave, lista in numeros.items():
+                    ruta = os.path.join(self.ruta_particiones, _nombre_particion(*clave))
+                    # Reemplazo atómico: un lector con la partición vieja mapeada no ve bytes a medias
+                    with open(ruta + '.tmp', 'wb') as salida:
+                        salida.write(struct.pack(f'<{len(lista)}Q', *lista))
+                    os.replace(ruta + '.tmp', ruta)
+                for clave, (ruta, _) in existentes.items():
+                    if clave not in numeros:
+                        os.remove(ruta)
+            finally:
+                _desbloquear(f)
+
+    def _particiones(self, n, filas, columnas, min_disparos, max_disparos):
+        """Rutas de las particiones que cumplen los filtros, regenerándolas si no cubren `n` partidas."""
+        particiones = self._listar_particiones()
+        if sum(cantidad for _, cantidad in particiones.values()) < n:
+            self._reconstruir_particiones()
+            particiones = self._listar_particiones()
+        return [ruta for (f, c, nd), (ruta, cantidad) in sorted(particiones.items())
+                if cantidad
+                and (filas is None or f == filas)
+                and (columnas is None or c == columnas)
+                and (min_disparos is None or nd >= min_disparos)
+                and (max_disparos is None or nd <= max_disparos)]
+
+    def _recorrer_particion(self, particion, n, desde, hasta, resultado):
+        """Números de partida de una partición dentro del rango de días (y anteriores a `n`)."""
+        total = len(particion) // NUMERO_PARTIDA.size
+        inicio = self._buscar_dia(_dia(desde), total, particion) if desde is not None else 0
+        fin = self._buscar_dia(_dia(hasta) + 1, total, particion) if hasta is not None else total
+        for k in range(inicio, fin):
+            i = NUMERO_PARTIDA.unpack_from(particion, k * NUMERO_PARTIDA.size)[0]
+            if i >= n:
+                # Agregada después de empezar el recorrido
+                break
+            if resultado is not None and ENTRADA_INDICE.unpack_from(
+                    self._mm_indice, i * ENTRADA_INDICE.size)[5] != resultado:
+                continue
+            yield i
+
+    def indices(self, desde=None, hasta=None, filas=None, columnas=None,
+                min_disparos=None, max_disparos=None, resultado=None):
+        """
+        Recorre el índice y devuelve los números de partida que cumplen los filtros,
+        en orden. Con filtros de tamaño o de disparos se recorren solo las
+        particiones que corresponden. Solo se recorren las partidas que existían
+        al empezar; se puede agregar durante el recorrido.
+
+        Args:
+            desde, hasta: marcas de tiempo (segundos); se comparan por día, ambos inclusive
+            filas, columnas: tamaño del tablero
+            min_disparos, max_disparos: rango de número de disparos (inclusive)
+            resultado: RESULTADO_HUNDIDA o RESULTADO_INCOMPLETA
+        """
+        n = len(self)
+        if n == 0:
+            return
+        if any(v is not None for v in (filas, columnas, min_disparos, max_disparos)):
+            mapas = []
+            try:
+                for ruta in self._particiones(n, filas, columnas, min_disparos, max_disparos):
+                    with open(ruta, 'rb') as f:
+                        mapas.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                yield from heapq.merge(*(self._recorrer_particion(mm, n, desde, hasta, resultado)
+                                         for mm in mapas))
+            finally:
+                for mm in mapas:
+                    mm.close()
+            return
+
+        inicio = self._buscar_dia(_dia(desde), n) if desde is not None else 0
+        fin = self._buscar_dia(_dia(hasta) + 1, n) if hasta is not None else n
+
+        vista = memoryview(self._mm_indice)[inicio * ENTRADA_INDICE.size:fin * ENTRADA_INDICE.size]
+        try:
+            for i, (_, _, _, _, _, res) in enumerate(ENTRADA_INDICE.iter_unpack(vista), start=inicio):
+                if resultado is not None and res != resultado:
+                    continue
+                yield i
+        finally:
+            vista.release()
+
+    def leer(self, i):
+        """
+        Decodifica la partida número `i`.
+
+        Returns:
+            dict con 'marca_tiempo', 'filas', 'columnas', 'resultado',
+            'flota' (tipo -> lista de posiciones) y 'disparos' (lista de posiciones).
+        """
+        if self._mm_indice is None or (i + 1) * ENTRADA_INDICE.size > len(self._mm_indice):
+            # Partida agregada después del último mapeo
+            self._mapear()
+        desplazamiento = ENTRADA_INDICE.unpack_from(self._mm_indice, i * ENTRADA_INDICE.size)[0]
+        mm = self._mm_datos
+        marca, filas, columnas, resultado, n_disparos = CABECERA.unpack_from(mm, desplazamiento)
+        celdas = filas * columnas
+        n_bytes = _bytes_mascara(celdas)
+        p = desplazamiento + CABECERA.size
+
+        flota = {}
+        for tipo in TIPOS_BARCO:
+            mascara = int.from_bytes(mm[p:p + n_bytes], 'little')
+            p += n_bytes
+            flota[tipo] = [celda_indice(k, columnas) for k in range(celdas) if mascara >> k & 1]
+
+        if celdas <= 256:
+            indices = mm[p:p + n_disparos]
+        else:
+            indices = struct.unpack_from(f'<{n_disparos}H', mm, p)
+
+        return {
+            'marca_tiempo': marca,
+            'filas': filas,
+            'columnas': columnas,
+            'resultado': resultado,
+            'flota': flota,
+            'disparos': [celda_indice(k, columnas) for k in indices],
+        }
+
+    def buscar(self, **filtros):
+        """Igual que `indices`, pero devuelve las partidas decodificadas."""
+        for i in self.indices(**filtros):
+            yield self.leer(i)
+
+    def cerrar(self):
+        """Cierra los ficheros abiertos y los mapas de memoria."""
+        self._desmapear()
+        if self._f_datos is not None:
+            self._f_datos.close()
+            self._f_indice.close()
+        self._f_datos = None
+        self._f_indice = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def main(argv=None):
+    """
+    Resumen rápido de un archivo de partidas:
+        python3 -m fsm_naval archivo <base> [filas columnas]
+    """
+    import sys
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Uso: python3 -m fsm_naval archivo <base> [filas columnas]")
+        return
+    filtros = {}
+    if len(argv) >= 3:
+        filtros['filas'] = int(argv[1])
+        filtros['columnas'] = int(argv[2])
+
+    with ArchivoPartidas(argv[0]) as archivo:
+        total = hundidas = disparos = 0
+        for i in archivo.indices(**filtros):
+            _, _, _, _, nd, res = ENTRADA_INDICE.unpack_from(archivo._mm_indice, i * ENTRADA_INDICE.size)
+            total += 1
+            if res == RESULTADO_HUNDIDA:
+                hundidas += 1
+                disparos += nd
+        print(f"Partidas: {total}  Hundidas: {hundidas}")
+        if hundidas:
+            print(f"Disparos promedio hasta hundir: {disparos / hundidas:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,553 @@
+"""
+FSM Naval Battle - Cliente de Ataque
+-----------------------------------
+Este programa implementa un cliente que envía ataques (cadenas de entrada)
+al servidor de defensa y muestra los resultados en una cuadrícula 5x5.
+
+Autómata Finito para el Cliente:
+-------------------------------
+Q = {q0, q1, q2, q3} : {Inicio, Atacando, Victoria, Derrota}
+Σ = {Hit, Miss, Sunk, Error}
+q₀ = q0 (Inicio)
+F = {q2, q3} (Victoria o Derrota - Estados finales)
+"""
+
+import os
+import socket
+import time
+
+from .transporte import TransporteTCP, crear_transporte, codificar_datagrama, decodificar_datagrama
+from .admision import espera_sugerida
+from .render import RenderTablero
+
+
+def separar_sesion(respuesta):
+    """
+    Separa el token y la versión que el servidor agrega a las respuestas de ataque.
+
+    Returns:
+        Tuple: (respuesta sin sufijo, token, versión); token y versión son None
+        si la respuesta no los trae (ej: 429/503 o un servidor anterior).
+    """
+    partes = respuesta.split(':')
+    if len(partes) >= 4 and partes[-1].isdigit():
+        return ':'.join(partes[:-2]), partes[-2], int(partes[-1])
+    return respuesta, None, None
+
+
+class NavalClientFSM:
+    """
+    Implementación de la Máquina de Estados Finitos para el cliente de ataque naval.
+    """
+    # Estados del autómata
+    INICIO = 'q0'      # Estado inicial
+    ATACANDO = 'q1'    # En proceso de ataque
+    VICTORIA = 'q2'    # Toda la flota enemiga ha sido hundida
+    DERROTA = 'q3'     # No se logró hundir la flota enemiga
+    
+    def __init__(self):
+        # Estado actual del autómata
+        self.estado_actual = self.INICIO
+        
+        # Tablero de seguimiento de ataques (5x5)
+        # Valores: '~' (sin atacar), 'O' (fallo/agua), 'X' (impacto)
+        self.filas = ['A', 'B', 'C', 'D', 'E']
+        self.columnas = ['1', '2', '3', '4', '5']
+        # Generar posiciones A1..E5
+        self.tablero_ataques = {f"{f}{c}": '~' for f in self.filas for c in self.columnas}
+        
+        # Conexión con el servidor
+        self.server_host = 'localhost'  # Por defecto localhost para facilidad
+        self.server_port = 5000         # Puerto por defecto
+
+        # Transporte (ver fsm_naval.transporte); None = TCP a server_host:server_port
+        self.transporte = None
+
+        # Partida asignada por un lobby (ver unirse_lobby): los mensajes viajan como
+        # "id|mensaje" al puerto del lobby. None = servidor de juego directo.
+        self.partida_lobby = None
+
+        # Modo UDP: un datagrama por mensaje, con retransmisión si no hay respuesta
+        self.modo_udp = False
+        self.timeout_udp = 0.2    # Segundos de espera del primer intento (se duplica en cada reintento)
+        self.reintentos_udp = 4
+        self.secuencia_udp = 0
+        self._socket_udp = None
+
+        # Respuestas 429/503 (ver fsm_naval.admision): reintentos y espera base
+        # del backoff exponencial que se suma a la espera pedida por el servidor
+        self.reintentos_saturacion = 5
+        self.espera_base = 0.05
+        
+        # Contador de ataques
+        self.ataques_realizados = 0
+        self.barcos_hundidos = 0
+
+        # Sesión: token de la partida del servidor y celdas de barcos ya hundidos
+        # (se obtienen con sincronizar_estado al reconectar)
+        self.token_sesion = None
+        self.celdas_hundidas = set()
+
+        # Caché de resultados: tablero_ataques responde los disparos repetidos
+        # sin ir a la red. Se mantiene consistente con el servidor mediante
+        # el token de sesión y la versión del tablero (ver sincronizar_estado).
+        self.version_tablero = None
+        self.cache_aciertos = 0  # Disparos respondidos localmente
+        self.cache_fallos = 0    # Disparos enviados al servidor
+        self.sincronizaciones = 0  # Tableros completos recibidos (la GUI repinta todo)
+
+        # Dibujo del tablero en consola (ver fsm_naval.render): solo rearma las
+        # filas marcadas con marcar_cambio; en sitio = tablero fijo arriba de la consola
+        self.render = None
+        self.mostrar_en_sitio = False
+        
+    def marcar_cambio(self, pos=None):
+        """Avisa al dibujo de consola que cambió una celda (None = todo el tablero)."""
+        if self.render is not None:
+            self.render.marcar(pos)
+
+    def _celda_ataque(self, pos):
+        """Texto de una celda del tablero de ataques (símbolo + espacio)."""
+        valor = self.tablero_ataques[pos]
+        if valor == 'X':
+            return "X "  # Impacto
+        if valor == 'O':
+            return "O "  # Agua
+        return "~ "      # Sin atacar
+
+    def mostrar_tablero(self):
+        """
+        Muestra el tablero de ataques realizados (solo rearma las filas que cambiaron).
+        """
+        cols = self.columnas
+        filas = self.filas
+
+        # El tamaño puede cambiar al sincronizar con otro servidor: rehacer el dibujo
+        if self.render is None or self.render.filas != filas or self.render.columnas != cols:
+            # Construir líneas de borde según ancho
+            inner_width = len(cols) * 2  # cada celda usa 2 caracteres (símbolo + espacio)
+            self.render = RenderTablero(
+                filas, cols, self._celda_ataque,
+                cabecera=["", f"Tablero de ataque ({len(filas)}x{len(cols)}):",
+                          "  " + " ".join(cols),
+                          " " + "┌" + "─" * inner_width + "┐"],
+                pie=[" " + "└" + "─" * inner_width + "┘",
+                     " ~: Sin atacar, O: Fallo, X: Impacto"])
+        self.render.en_sitio = self.mostrar_en_sitio
+        self.render.dibujar()
+    
+    def enviar_ataque(self, coordenada):
+        """
+        Envía un ataque al servidor y procesa la respuesta según la FSM.
+        
+        Args:
+            coordenada: Coordenada del ataque (ej: 'A1')
+            
+        Returns:
+            Respuesta del servidor
+        """
+        try:
+            # Validar coordenada
+            if coordenada not in self.tablero_ataques:
+                valids = ", ".join(sorted(self.tablero_ataques.keys()))
+                print(f"Coordenada {coordenada} inválida. Usa una de: {valids}.")
+                return None
+
+            # Resultado ya conocido: confirmar que la caché sigue siendo de la
+            # partida del servidor (STATE condicional: 304 sin datos si no cambió)
+            if self.tablero_ataques[coordenada] != '~':
+                self.sincronizar_estado()
+                if self.tablero_ataques.get(coordenada, '~') != '~':
+                    self.cache_aciertos += 1
+                    return "409:Atacado_Previamente"
+            self.cache_fallos += 1
+
+            response = self._enviar_mensaje(coordenada)
+
+            if self.modo_udp and response.startswith("410"):
+                # La partida cambió en el servidor: resincronizar y reintentar una vez
+                self.sincronizar_estado()
+                if self.tablero_ataques.get(coordenada, '~') != '~':
+                    self.cache_aciertos += 1
+                    return "409:Atacado_Previamente"
+                response = self._enviar_mensaje(coordenada)
+
+            response, token, version = separar_sesion(response)
+            if token is not None and self.token_sesion is not None and (
+                    token != self.token_sesion
+                    or (self.version_tablero is not None and version < self.version_tablero)):
+                # La partida se reinició en el servidor (limpiar_flota): la caché es
+                # de otra partida. El tablero nuevo ya incluye este disparo.
+                print("La partida cambió en el servidor, sincronizando...")
+                self.sincronizar_estado()
+                return response
+            if token is not None and self.token_sesion is None:
+                self.token_sesion = token
+
+            if response.startswith("410"):
+                # La partida ya no existe en el servidor (ej: el lobby la cerró al hundirse)
+                print(f"La partida terminó o no existe en el servidor: {response}")
+                return response
+            if response.startswith("409"):
+                # El servidor ya conocía el disparo y la caché no: alguien más
+                # atacó o hubo reconexión. Resincronizar en un solo viaje.
+                print(f"Caché desactualizada en {coordenada}, sincronizando con el servidor...")
+                self.sincronizar_estado()
+                return response
+            if espera_sugerida(response) is not None:
+                # El servidor sigue saturado tras los reintentos: el ataque no se procesó
+                print(f"Servidor saturado, ataque a {coordenada} no procesado: {response}")
+                return response
+            # Incrementar contador de ataques
+            self.ataques_realizados += 1
+            
+            # Procesar respuesta según FSM
+            self._procesar_respuesta(coordenada, response)
+
+            # La versión del servidor cuenta los disparos registrados: solo se
+            # avanza si la celda quedó escrita en la caché. Si no (ej: 400 o un
+            # disparo tras la victoria), el próximo STATE trae el tablero completo.
+            if self.version_tablero is not None and self.tablero_ataques[coordenada] != '~':
+                self.version_tablero += 1
+            
+            return response
+            
+        except ConnectionRefusedError:
+            print(f"Error: No se pudo conectar al servidor en {self._destino()}")
+            return None
+        except Exception as e:
+            print(f"Error al enviar el ataque: {e}")
+            return None
+    
+    def _destino(self):
+        """Descripción del servidor configurado (para mensajes)."""
+        return self.transporte or f"{self.server_host}:{self.server_port}"
+
+    def _enviar_udp(self, mensaje):
+        """
+        Envía un mensaje en modo UDP y espera la respuesta con la misma secuencia,
+        retransmitiendo si vence el tiempo de espera. El servidor reconoce las
+        retransmisiones por la secuencia, así que reenviar un ataque es seguro.
+        """
+        if self._socket_udp is None:
+            self._socket_udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # En UDP connect() solo fija el destino: es barato y sigue los cambios de servidor
+        self._socket_udp.connect((self.server_host, self.server_port))
+
+        self.secuencia_udp += 1
+        datagrama = codificar_datagrama(self.token_sesion or '-', self.secuencia_udp, mensaje)
+        espera = self.timeout_udp
+        for _ in range(self.reintentos_udp + 1):
+            self._socket_udp.send(datagrama)
+            self._socket_udp.settimeout(espera)
+            try:
+                while True:
+                    partida, secuencia, respuesta = decodificar_datagrama(self._socket_udp.recv(65535))
+                    # Descartar respuestas atrasadas de mensajes anteriores
+                    if secuencia == self.secuencia_udp:
+                        if self.token_sesion is None:
+                            self.token_sesion = partida
+                        return respuesta
+            except socket.timeout:
+                espera *= 2
+        raise TimeoutError(f"Sin respuesta UDP de {self.server_host}:{self.server_port}")
+
+    def _esperar_reintento(self, espera, intento):
+        """Duerme la espera pedida más un backoff exponencial con jitter."""
+        import random  # Solo hace falta bajo saturación: no cargarlo al arrancar
+        time.sleep(espera + random.uniform(0, self.espera_base * 2 ** intento))
+
+    def _enviar_mensaje(self, mensaje):
+        """
+        Envía un mensaje al servidor y devuelve la respuesta. Si el servidor pide
+        bajar el ritmo (429/503), espera y reintenta hasta `reintentos_saturacion`
+        veces; después devuelve la última respuesta de rechazo.
+        """
+        for intento in range(self.reintentos_saturacion + 1):
+            respuesta = self._enviar_udp(mensaje) if self.modo_udp else self._enviar_conexion(mensaje)
+            espera = espera_sugerida(respuesta)
+            if espera is None or intento == self.reintentos_saturacion:
+                return respuesta
+            self._esperar_reintento(espera, intento)
+
+    def _enviar_conexion(self, mensaje):
+        """Envía un mensaje al servidor (una conexión por mensaje) y devuelve la respuesta."""
+        # Crear socket conectado al servidor
+        transporte = self.transporte or TransporteTCP(self.server_host, self.server_port)
+        client_socket = transporte.conectar()
+        try:
+            # Enviar mensaje (con el id de partida delante si juega a través de un lobby)
+            if self.partida_lobby is not None:
+                mensaje = f"{self.partida_lobby}|{mensaje}"
+            client_socket.send(mensaje.encode())
+
+            # Recibir respuesta (puede llegar en varios segmentos)
+            partes = []
+            while True:
+                datos = client_socket.recv(4096)
+                if not datos:
+                    break
+                partes.append(datos)
+            return b"".join(partes).decode()
+        finally:
+            # Cerrar socket
+            client_socket.close()
+
+    def sincronizar_estado(self):
+        """
+        Recupera la vista completa del tablero desde el servidor (petición STATE),
+        en un solo viaje de ida y vuelta. Útil al reconectar: evita redescubrir
+        el tablero disparo a disparo.
+
+        Returns:
+            True si se sincronizó, False en caso de error.
+        """
+        peticion = 'STATE'
+        if self.token_sesion is not None and self.version_tablero is not None:
+            peticion = f"STATE:{self.token_sesion}:{self.version_tablero}"
+        try:
+            response = self._enviar_mensaje(peticion)
+        except ConnectionRefusedError:
+            print(f"Error: No se pudo conectar al servidor en {self._destino()}")
+            return False
+        except Exception as e:
+            print(f"Error al sincronizar el estado: {e}")
+            return False
+
+        if response.startswith("304"):
+            # La caché local coincide con el servidor
+            return True
+
+        if not response.startswith("200:"):
+            # Ej: 410 si la partida del lobby ya se cerró
+            print(f"Error al sincronizar el estado: {response}")
+            return False
+        try:
+            codigo, token, version, estado, filas, columnas, datos = response.split(':')
+            version = int(version)
+            filas, columnas = int(filas), int(columnas)
+            bitmap = int.from_bytes(bytes.fromhex(datos), 'little')
+        except ValueError:
+            print(f"Respuesta de estado inválida: {response}")
+            return False
+
+        # Ajustar el tablero al tamaño del servidor
+        if len(self.filas) != filas or len(self.columnas) != columnas:
+            self.filas = [chr(ord('A') + i) for i in range(filas)]
+            self.columnas = [str(j + 1) for j in range(columnas)]
+
+        tablero = {}
+        self.celdas_hundidas = set()
+        for i, pos in enumerate(f"{f}{c}" for f in self.filas for c in self.columnas):
+            valor = bitmap >> (2 * i) & 3
+            tablero[pos] = '~' if valor == 0 else 'O' if valor == 1 else 'X'
+            if valor == 3:
+                self.celdas_hundidas.add(pos)
+        self.tablero_ataques = tablero
+        self.marcar_cambio()
+        self.sincronizaciones += 1
+        self.token_sesion = token
+        self.version_tablero = version
+
+        # Reconstruir contadores y estado del autómata
+        self.ataques_realizados = sum(1 for v in tablero.values() if v != '~')
+        if estado == 'q2':
+            self.estado_actual = self.VICTORIA
+            self.barcos_hundidos = 1
+        else:
+            self.estado_actual = self.ATACANDO if self.ataques_realizados else self.INICIO
+            self.barcos_hundidos = 0
+        return True
+
+    def reiniciar_partida(self):
+        """Olvida la partida actual (tablero, sesión y contadores) para empezar otra."""
+        self.tablero_ataques = {f"{f}{c}": '~' for f in self.filas for c in self.columnas}
+        self.marcar_cambio()
+        self.estado_actual = self.INICIO
+        self.ataques_realizados = 0
+        self.barcos_hundidos = 0
+        self.token_sesion = None
+        self.version_tablero = None
+        self.celdas_hundidas = set()
+
+    def unirse_lobby(self, host, port, timeout=None):
+        """
+        Pide partida a un lobby de emparejamiento (ver fsm_naval.lobby) y deja
+        el cliente configurado para jugarla. Bloquea hasta que el lobby forma
+        la partida (o hasta `timeout` segundos).
+
+        Returns:
+            Id de la partida, o None si no se pudo obtener.
+        """
+        for intento in range(self.reintentos_saturacion + 1):
+            try:
+                sock = TransporteTCP(host, port).conectar()
+                try:
+                    sock.settimeout(timeout)
+                    sock.sendall(b"JOIN")
+                    partes = []
+                    while True:
+                        datos = sock.recv(4096)
+                        if not datos:
+                            break
+                        partes.append(datos)
+                finally:
+                    sock.close()
+            except ConnectionRefusedError:
+                print(f"Error: No se pudo conectar al lobby en {host}:{port}")
+                return None
+            except OSError as e:
+                print(f"Error al pedir partida al lobby: {e}")
+                return None
+
+            respuesta = b"".join(partes).decode()
+            espera = espera_sugerida(respuesta)
+            if espera is None or intento == self.reintentos_saturacion:
+                break
+            # Lobby saturado: esperar y volver a la cola
+            self._esperar_reintento(espera, intento)
+
+        campos = respuesta.split(':')
+        if len(campos) != 4 or campos[0] != "200":
+            print(f"El lobby no asignó partida: {respuesta or 'sin respuesta'}")
+            return None
+        _, partida, host_partida, puerto = campos
+
+        self.server_host = host_partida
+        self.server_port = int(puerto)
+        self.transporte = None
+        self.reiniciar_partida()
+        self.partida_lobby = partida
+        return partida
+
+    def estadisticas_cache(self):
+        """
+        Estadísticas de la caché de resultados (cuánto tráfico inútil se ahorró).
+
+        Returns:
+            dict con 'aciertos', 'fallos' y 'tasa_aciertos'
+        """
+        total = self.cache_aciertos + self.cache_fallos
+        return {
+            'aciertos': self.cache_aciertos,
+            'fallos': self.cache_fallos,
+            'tasa_aciertos': self.cache_aciertos / total if total else 0.0,
+        }
+
+    def _procesar_respuesta(self, coordenada, respuesta):
+        """
+        Procesa la respuesta del servidor y actualiza el estado del FSM.
+        
+        Args:
+            coordenada: Coordenada atacada
+            respuesta: Respuesta del servidor
+        """
+        codigo, mensaje = respuesta.split(':', 1)
+        self.marcar_cambio(coordenada)
+        
+        # Función de transición δ según el estado actual y la entrada
+        if self.estado_actual == self.INICIO:
+            # Transición al estado ATACANDO
+            self.estado_actual = self.ATACANDO
+        
+        if self.estado_actual == self.ATACANDO:
+            if codigo == "200" and "Hundido" in mensaje:
+                # Barco impactado y hundido
+                self.tablero_ataques[coordenada] = 'X'
+                self.barcos_hundidos += 1
+                
+                # Si hundir todos los barcos era el objetivo final, transición a VICTORIA
+                self.estado_actual = self.VICTORIA
+                
+            elif codigo in ("200", "202") and ("Impacto" in mensaje or "Impactado" in mensaje):
+                # Barco impactado pero no hundido
+                self.tablero_ataques[coordenada] = 'X'
+                
+            elif codigo == "404" and ("Fallido" in mensaje or "Flota_Ya_Hundida" in mensaje):
+                # Fallo (agua)
+                self.tablero_ataques[coordenada] = 'O'
+                
+            elif "409" in codigo:
+                # Ataque repetido
+                print(f"Error: {mensaje} - Coordenada ya atacada")
+                self.ataques_realizados -= 1  # No contar como ataque válido
+                
+            elif "404" in codigo and coordenada not in self.tablero_ataques:
+                # Error en la coordenada
+                print(f"Error: {mensaje}")
+                self.ataques_realizados -= 1  # No contar como ataque válido
+        
+        # Para este juego simplificado, no implementamos transición a DERROTA
+        # ya que se puede seguir atacando hasta hundir el barco
+    
+    def iniciar_cliente(self):
+        """
+        Inicia el cliente de ataque.
+        """
+        print("\n╔══════════════════════════════════════════╗")
+        print("║ [ CLIENTE DE ATAQUE - FSM ]              ║")
+        print("╚══════════════════════════════════════════╝")
+        
+        # Configurar conexión al servidor
+        print(f"Ingrese la IP del servidor (Enter para usar {self.server_host}):")
+        host = input()
+        if host:
+            self.server_host = host
+            
+        print(f"Ingrese el puerto del servidor (Enter para usar {self.server_port}):")
+        port = input()
+        if port:
+            self.server_port = int(port)
+        
+        print(f"\nConectando al servidor en {self.server_host}:{self.server_port}")
+
+        # Recuperar el estado de la partida (si ya se había atacado antes)
+        self.sincronizar_estado()
+        
+        # Mostrar tablero inicial
+        self.mostrar_tablero()
+        
+        # Bucle principal de juego
+        while self.estado_actual != self.VICTORIA and self.estado_actual != self.DERROTA:
+            print("\nIngrese coordenada de ataque (ej: B1):")
+            coordenada = input().strip().upper()
+            
+            if not coordenada:
+                continue
+            
+            # Enviar ataque y recibir respuesta
+            respuesta = self.enviar_ataque(coordenada)
+            
+            if respuesta:
+                print(f"Respuesta: {respuesta}")
+                
+                # Mostrar tablero actualizado
+                self.mostrar_tablero()
+                
+                # Verificar si se ha ganado
+                if self.estado_actual == self.VICTORIA:
+                    print("\n¡Has ganado! Toda la flota enemiga ha sido destruida.")
+                    print(f"Ataques realizados: {self.ataques_realizados}")
+                    break
+        
+        if self.render:
+            self.render.terminar()
+        print("\nFin del juego.")
+
+def main():
+    """
+    Función principal para iniciar el cliente FSM.
+    """
+    cliente = NavalClientFSM()
+
+    # Transporte opcional (ej: FSM_TRANSPORTE=unix:///tmp/flota.sock)
+    url_transporte = os.environ.get('FSM_TRANSPORTE')
+    if url_transporte:
+        cliente.transporte = crear_transporte(url_transporte)
+    # Modo UDP opcional (FSM_UDP=1)
+    cliente.modo_udp = os.environ.get('FSM_UDP') == '1'
+
+    cliente.iniciar_cliente()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+FSM Naval Battle - Estado Compacto de Partida
+-----------------------------------
+`EstadoPartida` implementa las mismas reglas que `NavalServerFSM.procesar_ataque`
+(mismos estados q0/q1/q2 y mismas respuestas), pero sin sockets ni
+diccionarios por celda:
+
+- `__slots__` y almacenamiento preasignado: un bytearray con el barco de cada
+  celda y otro con el resultado de los disparos, indexados por
+  fila * columnas + columna.
+- `reiniciar()` solo limpia las celdas que se tocaron (lista de celdas
+  sucias), así que cuesta O(1) amortizado por operación de la partida.
+
+Lo usan los defensores del torneo (torneo.py) y las partidas del lobby
+(lobby.py), que solo necesitan ataques y STATE (`procesar_mensaje`). Los
+servidores de un solo tablero (`iniciar_servidor`, `ServidorRaid`) siguen con
+un `NavalServerFSM` completo, que además atiende PROFILE, la GUI y el render.
+
+`PoolEstados` recicla objetos entre partidas para no pagar asignaciones ni GC
+con mucha rotación.
+
+`EstadoPartida.tablero` es una vista de solo lectura (coordenada -> tipo o
+None), suficiente para los defensores del torneo y para
+`ArchivoPartidas.agregar`.
+"""
+
+import random
+from collections.abc import Mapping
+
+# Código interno de cada tipo de barco en el bytearray (0 = agua)
+TIPOS = ('D', 'S', 'L')
+_CODIGOS = {t: i + 1 for i, t in enumerate(TIPOS)}
+
+_SIN_BARCOS = [0] * (len(TIPOS) + 1)
+
+# Resultado de cada celda en `disparos`
+SIN_ATACAR, FALLO, IMPACTO = 0, 1, 2
+
+# Tokens de sesión: un generador por proceso sembrado con os.urandom, para no
+# pedir entropía al sistema en cada reinicio (identifican la partida, no son secretos)
+_RNG_TOKENS = random.Random()
+
+
+def _nuevo_token():
+    return f"{_RNG_TOKENS.getrandbits(64):016x}"
+
+
+class _VistaTablero(Mapping):
+    """Vista coordenada -> tipo de barco (o None) sobre el bytearray de un EstadoPartida."""
+
+    __slots__ = ('_estado',)
+
+    def __init__(self, estado):
+        self._estado = estado
+
+    def __getitem__(self, pos):
+        i = self._estado.indice(pos)
+        if i is None:
+            raise KeyError(pos)
+        codigo = self._estado.barcos[i]
+        return TIPOS[codigo - 1] if codigo else None
+
+    def __iter__(self):
+        return iter(self._estado.coordenadas)
+
+    def __len__(self):
+        return self._estado.celdas
+
+
+class EstadoPartida:
+    """
+    Estado de una partida del lado defensor, compacto y reutilizable.
+
+    Args:
+        filas, columnas: tamaño del tablero (hasta 26 filas)
+    """
+
+    # Estados del autómata (los mismos que NavalServerFSM)
+    INICIO = 'q0'
+    FLOTA_INTACTA = 'q1'
+    HUNDIDO = 'q2'
+
+    __slots__ = ('filas', 'columnas', 'celdas', 'coordenadas', '_indices', 'barcos', 'disparos',
+                 'restantes', 'por_tipo', 'sucias', 'secuencia_ataques', 'estado_actual',
+                 'version_tablero', 'token_sesion', 'tablero')
+
+    def __init__(self, filas=5, columnas=5):
+        self.filas = filas
+        self.columnas = columnas
+        self.celdas = filas * columnas
+        self.coordenadas = [f"{chr(ord('A') + f)}{c + 1}" for f in range(filas) for c in range(columnas)]
+        self._indices = {pos: i for i, pos in enumerate(self.coordenadas)}
+
+        self.barcos = bytearray(self.celdas)     # 0 = agua, si no código del tipo
+        self.disparos = bytearray(self.celdas)   # SIN_ATACAR / FALLO / IMPACTO
+        self.restantes = 0                       # Celdas de barco sin impactar
+        self.por_tipo = [0] * (len(TIPOS) + 1)   # Celdas sin impactar por código de tipo
+        self.sucias = []                         # Índices tocados desde el último reinicio
+        self.secuencia_ataques = []
+        self.estado_actual = self.INICIO
+        self.version_tablero = 0
+        self.token_sesion = _nuevo_token()
+        self.tablero = _VistaTablero(self)
+
+    def indice(self, pos):
+        """Índice de una coordenada ('B3' -> 7 en 5x5), o None si no es válida."""
+        return self._indices.get(pos)
+
+    def colocar_barco(self, tipo, posiciones):
+        """
+        Coloca un barco (misma validación que NavalServerFSM.colocar_barco, sin mensajes).
+
+        Returns:
+            True si se colocó, False si el tipo o alguna posición no es válida u ocupada.
+        """
+        codigo = _CODIGOS.get(tipo)
+        if codigo is None:
+            return False
+        barcos = self.barcos
+        indices = []
+        for p in posiciones:
+            i = self._indices.get(p)
+            if i is None or barcos[i]:
+                return False
+            indices.append(i)
+        for i in indices:
+            barcos[i] = codigo
+        self.sucias.extend(indices)
+        self.restantes += len(indices)
+        self.por_tipo[codigo] += len(indices)
+        if self.restantes:
+            self.estado_actual = self.FLOTA_INTACTA
+        return True
+
+    def quitar_barco(self, tipo):
+        """
+        Quita el barco de un tipo, sin tocar el resto de la flota.
+
+        Returns:
+            True si había un barco de ese tipo.
+        """
+        codigo = _CODIGOS.get(tipo)
+        if codigo is None:
+            return False
+        habia = False
+        for i in self.sucias:
+            if self.barcos[i] == codigo:
+                self.barcos[i] = 0
+                habia = True
+        self.restantes -= self.por_tipo[codigo]
+        self.por_tipo[codigo] = 0
+        if not self.restantes and self.estado_actual == self.FLOTA_INTACTA:
+            self.estado_actual = self.INICIO
+        return habia
+
+    def procesar_ataque(self, coordenada):
+        """
+        Aplica un ataque (mismas respuestas que NavalServerFSM.procesar_ataque).
+
+        Returns:
+            Tuple: (código_respuesta, mensaje_detalle)
+        """
+        i = self._indices.get(coordenada)
+        if i is None:
+            return "404", "Coordenada inválida"
+        if self.disparos[i]:
+            return "409", "Atacado_Previamente"
+
+        if self.estado_actual == self.INICIO:
+            # Sin flota el disparo no se registra (igual que en el servidor)
+            return "400", "Flota_No_Colocada"
+
+        self.version_tablero += 1
+        self.sucias.append(i)
+
+        if self.estado_actual == self.FLOTA_INTACTA:
+            self.secuencia_ataques.append(coordenada)
+            codigo = self.barcos[i]
+            if codigo:
+                self.disparos[i] = IMPACTO
+                self.restantes -= 1
+                self.por_tipo[codigo] -= 1
+                if not self.restantes:
+                    self.estado_actual = self.HUNDIDO
+                    return "200", "Hundido"
+                return "200", "Impacto"
+            self.disparos[i] = FALLO
+            return "404", "Fallido"
+
+        # HUNDIDO: ya no hay barcos para hundir
+        self.disparos[i] = FALLO
+        return "404", "Flota_Ya_Hundida"
+
+    def estado_sesion(self):
+        """
+        Vista del atacante del tablero (mismo formato que NavalServerFSM.estado_sesion).
+
+        Returns:
+            Tuple: (código_respuesta, "token:versión:estado:filas:columnas:bitmap_hex")
+        """
+        barcos = self.barcos
+        por_tipo = self.por_tipo
+        bitmap = 0
+        for i, disparo in enumerate(self.disparos):
+            if disparo == IMPACTO:
+                # Impacto en un barco al que no le quedan celdas = hundido
+                valor = 2 if por_tipo[barcos[i]] else 3
+            else:
+                valor = disparo
+            if valor:
+                bitmap |= valor << (2 * i)
+
+        datos = bitmap.to_bytes((2 * self.celdas + 7) // 8, 'little').hex()
+        return "200", (f"{self.token_sesion}:{self.version_tablero}:{self.estado_actual}:"
+                       f"{self.filas}:{self.columnas}:{datos}")
+
+    def procesar_mensaje(self, mensaje):
+        """
+        Petición de estado ("STATE[:token:versión]") o coordenada de ataque, con las
+        mismas respuestas que NavalServerFSM.procesar_mensaje (sin PROFILE ni admisión,
+        que quedan a cargo de quien atiende la red).
+
+        Returns:
+            Tuple: (código_respuesta, mensaje_detalle)
+        """
+        partes = mensaje.split(':')
+        if partes[0].upper() == 'STATE':
+            if len(partes) == 3 and partes[1] == self.token_sesion and partes[2] == str(self.version_tablero):
+                return "304", "Sin_Cambios"
+            return self.estado_sesion()
+        codigo, detalle = self.procesar_ataque(mensaje)
+        return codigo, f"{detalle}:{self.token_sesion}:{self.version_tablero}"
+
+    def reiniciar(self):
+        """
+        Deja el estado como recién creado, limpiando solo las celdas que se tocaron.
+        El token de sesión se renueva: es otra partida.
+        """
+        barcos = self.barcos
+        disparos = self.disparos
+        for i in self.sucias:
+            barcos[i] = 0
+            disparos[i] = 0
+        self.sucias.clear()
+        self.secuencia_ataques.clear()
+        self.por_tipo[:] = _SIN_BARCOS
+        self.restantes = 0
+        self.estado_actual = self.INICIO
+        self.version_tablero = 0
+        self.token_sesion = _nuevo_token()
+
+
+class PoolEstados:
+    """
+    Pool de objetos de partida reutilizables.
+
+    Args:
+        fabrica: función que crea un objeto nuevo (por defecto EstadoPartida)
+        maximo: objetos libres que se guardan como máximo (el resto se descarta)
+        reiniciar: función que deja un objeto listo para otra partida
+                   (por defecto llama a su método `reiniciar()`)
+    """
+
+    def __init__(self, fabrica=EstadoPartida, maximo=1024, reiniciar=None):
+        self.fabrica = fabrica
+        self.maximo = maximo
+        self.reiniciar = reiniciar or (lambda objeto: objeto.reiniciar())
+        self.libres = []
+
+        # Estadísticas
+        self.creados = 0
+        self.reusados = 0
+
+    def obtener(self):
+        """Devuelve un objeto listo para una partida nueva."""
+        if self.libres:
+            self.reusados += 1
+            return self.libres.pop()
+        self.creados += 1
+        return self.fabrica()
+
+    def devolver(self, objeto):
+        """Reinicia el objeto y lo guarda para la próxima partida."""
+        if len(self.libres) < self.maximo:
+            self.reiniciar(objeto)
+            self.libres.append(objeto)
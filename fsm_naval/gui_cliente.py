@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+GUI para el cliente de ataque naval (5x5)
+
+Permite ingresar IP y puerto del servidor y atacar casillas A1..E5
+mediante una interfaz gráfica sencilla con Tkinter.
+
+Usa la clase `NavalClientFSM` de `fsm_naval.cliente` para enviar
+ataques al servidor.
+"""
+
+import threading
+import tkinter as tk
+from tkinter import messagebox
+
+from .cliente import NavalClientFSM
+from .gui_tablero import TableroCanvas
+
+
+class NavalClientGUI:
+    def __init__(self, master=None):
+        self.master = master or tk.Tk()
+        self.master.title('Cliente de Ataque - GUI (5x5)')
+
+        self.client = NavalClientFSM()
+        self._sincronizaciones = 0  # Última sincronización del cliente ya pintada
+
+        # Frame de configuración
+        cfg = tk.Frame(self.master)
+        cfg.pack(padx=8, pady=6, anchor='w')
+
+        tk.Label(cfg, text='Servidor IP:').grid(row=0, column=0, sticky='w')
+        self.ip_entry = tk.Entry(cfg, width=15)
+        self.ip_entry.insert(0, self.client.server_host)
+        self.ip_entry.grid(row=0, column=1, padx=4)
+
+        tk.Label(cfg, text='Puerto:').grid(row=0, column=2, sticky='w')
+        self.port_entry = tk.Entry(cfg, width=6)
+        self.port_entry.insert(0, str(self.client.server_port))
+        self.port_entry.grid(row=0, column=3, padx=4)
+
+        self.connect_btn = tk.Button(cfg, text='Configurar', command=self.configurar_servidor)
+        self.connect_btn.grid(row=0, column=4, padx=6)
+
+        # Pedir partida a un lobby (ver fsm_naval.lobby) en la IP/puerto indicados
+        self.lobby_btn = tk.Button(cfg, text='Buscar partida', command=self.buscar_partida)
+        self.lobby_btn.grid(row=0, column=5, padx=6)
+
+        # Frame del tablero
+        board_frame = tk.Frame(self.master)
+        board_frame.pack(padx=8, pady=6)
+
+        # Obtener filas/columnas del cliente (suponemos que existen)
+        self.filas = getattr(self.client, 'filas', ['A', 'B', 'C', 'D', 'E'])
+        self.columnas = getattr(self.client, 'columnas', ['1', '2', '3', '4', '5'])
+
+        # Tablero sobre un Canvas: solo dibuja las celdas visibles (ver gui_tablero.py)
+        self.board = TableroCanvas(board_frame, self.filas, self.columnas, al_pulsar=self.on_click)
+        self.board.pack()
+
+        # Estado y control
+        status_frame = tk.Frame(self.master)
+        status_frame.pack(fill='x', padx=8, pady=(0,8))
+        self.status_label = tk.Label(status_frame, text='Estado: listo')
+        self.status_label.pack(side='left')
+
+        self.ataques_label = tk.Label(status_frame, text=f'Ataques: {self.client.ataques_realizados}')
+        self.ataques_label.pack(side='right')
+
+    def configurar_servidor(self):
+        ip = self.ip_entry.get().strip()
+        port = self.port_entry.get().strip()
+        if ip:
+            self.client.server_host = ip
+        # Configuración manual = servidor de juego directo (no una partida del lobby)
+        self.client.partida_lobby = None
+        try:
+            if port:
+                self.client.server_port = int(port)
+        except ValueError:
+            messagebox.showerror('Puerto inválido', 'El puerto debe ser un número entero.')
+            return
+
+        self.status_label.config(text=f'Configurado a {self.client.server_host}:{self.client.server_port}, sincronizando...')
+
+        # Recuperar el tablero de la partida en curso (reconexión) sin bloquear la GUI
+        t = threading.Thread(target=self._sync_thread)
+        t.daemon = True
+        t.start()
+
+    def buscar_partida(self):
+        ip = self.ip_entry.get().strip() or 'localhost'
+        try:
+            port = int(self.port_entry.get().strip())
+        except ValueError:
+            messagebox.showerror('Puerto inválido', 'El puerto debe ser un número entero.')
+            return
+
+        self.lobby_btn.config(state='disabled')
+        self.status_label.config(text=f'Esperando partida en el lobby {ip}:{port}...')
+
+        # La espera en el lobby puede ser larga: no bloquear la GUI
+        t = threading.Thread(target=self._lobby_thread, args=(ip, port))
+        t.daemon = True
+        t.start()
+
+    def _lobby_thread(self, ip, port):
+        partida = self.client.unirse_lobby(ip, port)
+        ok = partida is not None and self.client.sincronizar_estado()
+        self.master.after(0, lambda: self._after_lobby(partida, ok))
+
+    def _after_lobby(self, partida, ok):
+        self.lobby_btn.config(state='normal')
+        self._after_sync(ok)
+        if ok:
+            # Mostrar el servidor de la partida asignada
+            self.ip_entry.delete(0, 'end')
+            self.ip_entry.insert(0, self.client.server_host)
+            self.port_entry.delete(0, 'end')
+            self.port_entry.insert(0, str(self.client.server_port))
+            self.status_label.config(text=f'Partida {partida} en {self.client.server_host}:{self.client.server_port}')
+
+    def _sync_thread(self):
+        ok = self.client.sincronizar_estado()
+        self.master.after(0, lambda: self._after_sync(ok))
+
+    def _after_sync(self, ok):
+        if not ok:
+            self.status_label.config(text='No se pudo sincronizar con el servidor')
+            return
+
+        self._repintar_tablero()
+        self.ataques_label.config(text=f'Ataques: {self.client.ataques_realizados}')
+        self.status_label.config(text=f'Sincronizado con {self.client.server_host}:{self.client.server_port}')
+
+    def _repintar_tablero(self):
+        """Pinta todo el tablero con la vista del cliente tras una sincronización."""
+        self._sincronizaciones = self.client.sincronizaciones
+
+        # El servidor puede tener otro tamaño de tablero
+        if self.client.filas != self.board.filas or self.client.columnas != self.board.columnas:
+            self.filas, self.columnas = self.client.filas, self.client.columnas
+            self.board.redimensionar(self.filas, self.columnas)
+
+        # La caché tras STATE tiene todas las celdas (también las '~'): actualizar
+        # cambia las visibles en el acto y el resto al entrar en la vista
+        for coord, mark in self.client.tablero_ataques.items():
+            self._pintar(coord, mark)
+
+    def _pintar(self, coord, mark):
+        """Pinta una celda según su marca ('X' impacto, 'O' fallo, '~' sin atacar)."""
+        if mark == 'X':
+            self.board.actualizar(coord, 'X', fondo='red', color='white', activa=False)
+        elif mark == 'O':
+            self.board.actualizar(coord, 'O', fondo='light blue', activa=False)
+        else:
+            self.board.actualizar(coord)
+
+    def on_click(self, coord):
+        # También los resultados ya conocidos van al hilo: el cliente confirma su
+        # caché con el servidor (STATE condicional) antes de responder 409
+        # Evitar doble envío mientras se procesa
+        self.board.activar(coord, False)
+        self.status_label.config(text=f'Enviando ataque {coord}...')
+
+        # Ejecutar envío en hilo para no bloquear GUI
+        t = threading.Thread(target=self._send_thread, args=(coord,))
+        t.daemon = True
+        t.start()
+
+    def _send_thread(self, coord):
+        try:
+            resp = self.client.enviar_ataque(coord)
+        except Exception as e:
+            resp = None
+            err = str(e)
+
+        # Programar actualización de la GUI en el hilo principal
+        self.master.after(0, lambda: self._after_attack(coord, resp))
+
+    def _after_attack(self, coord, response):
+        if response is None:
+            # Error de conexión u otro
+            messagebox.showerror('Error', f'No se recibió respuesta del servidor.')
+            # Re-habilitar la celda para reintentar
+            self.board.activar(coord)
+            self.status_label.config(text='Error: sin respuesta')
+            return
+
+        # Procesar respuesta esperada en formato "COD:Mensaje"
+        try:
+            codigo, mensaje = response.split(':', 1)
+        except Exception:
+            messagebox.showwarning('Respuesta inválida', f'Respuesta inesperada: {response}')
+            self.board.activar(coord)
+            return
+
+        # El ataque pudo resincronizar el tablero (ej: tras un 409 o un 410 en UDP):
+        # repintar todo, no solo la celda pulsada
+        if self.client.sincronizaciones != self._sincronizaciones:
+            self._repintar_tablero()
+
+        # Actualizar contador
+        self.ataques_label.config(text=f'Ataques: {self.client.ataques_realizados}')
+
+        if '200' in codigo or '202' in codigo:
+            # Impacto
+            self._pintar(coord, 'X')
+            self.status_label.config(text=f'{coord}: {mensaje}')
+        elif '404' in codigo:
+            # Fallo
+            self._pintar(coord, 'O')
+            self.status_label.config(text=f'{coord}: {mensaje}')
+        elif '409' in codigo:
+            # Ataque repetido
+            messagebox.showinfo('Repetido', f'{coord} ya fue atacado previamente.')
+            # Marcar según lo que tiene el cliente (si hay marca)
+            self._pintar(coord, self.client.tablero_ataques.get(coord, '~'))
+            self.status_label.config(text=f'{coord}: {mensaje}')
+        else:
+            # Otros códigos (ej: 429/503 si el servidor siguió saturado): se puede reintentar
+            self.board.activar(coord)
+            self.status_label.config(text=f'{coord}: {response}')
+
+    def run(self):
+        self.master.mainloop()
+
+
+def main():
+    gui = NavalClientGUI()
+    gui.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Interfaz gráfica para el servidor de flota (`fsm_naval.servidor`).
+- Permite ingresar IP y puerto.
+- Muestra el tablero (5x5, A1..E5) sobre un Canvas y permite colocar la flota.
+- Botones para iniciar/detener el servidor (se ejecuta en hilo separado, o en
+  un proceso propio que publica el tablero en memoria compartida).
+"""
+import threading
+import multiprocessing
+import tkinter as tk
+from tkinter import messagebox
+
+from .servidor import NavalServerFSM
+from .gui_tablero import TableroCanvas
+
+class ServerGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title('FSM - Servidor de Flota (GUI)')
+
+        self.servidor = NavalServerFSM()
+        self.server_thread = None
+
+        # Con el servidor en un hilo, los ataques y las ediciones de la flota pasan
+        # por el actor de la partida (ver actores.py) y se aplican de a uno
+        self.actor = None
+
+        # Modo proceso separado: proceso servidor + tablero en memoria compartida
+        self.server_process = None
+        self.compartido = None
+
+        # Top frame: IP / Port
+        top = tk.Frame(root)
+        top.pack(padx=10, pady=6, anchor='w')
+
+        tk.Label(top, text='IP:').grid(row=0, column=0)
+        self.ip_var = tk.StringVar(value=self.servidor.host)
+        self.ip_entry = tk.Entry(top, textvariable=self.ip_var, width=15)
+        self.ip_entry.grid(row=0, column=1, padx=(0,10))
+
+        tk.Label(top, text='Puerto:').grid(row=0, column=2)
+        self.port_var = tk.StringVar(value=str(self.servidor.port))
+        self.port_entry = tk.Entry(top, textvariable=self.port_var, width=6)
+        self.port_entry.grid(row=0, column=3, padx=(0,10))
+
+        self.start_btn = tk.Button(top, text='Iniciar Servidor', command=self.start_server)
+        self.start_btn.grid(row=0, column=4, padx=(0,6))
+
+        self.stop_btn = tk.Button(top, text='Detener Servidor', command=self.stop_server, state='disabled')
+        self.stop_btn.grid(row=0, column=5)
+
+        self.proceso_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(top, text='Proceso separado', variable=self.proceso_var).grid(row=0, column=6, padx=(6,0))
+
+        # Ship placement controls
+        place_frame = tk.Frame(root)
+        place_frame.pack(padx=10, pady=(4,6), anchor='w')
+
+        tk.Label(place_frame, text='Barco:').grid(row=0, column=0)
+        self.selected_ship_var = tk.StringVar(value='D')
+        ship_menu = tk.OptionMenu(place_frame, self.selected_ship_var, 'D', 'SS', 'LLL')
+        ship_menu.config(width=5)
+        ship_menu.grid(row=0, column=1, padx=(4,8))
+
+        tk.Label(place_frame, text='Orientación:').grid(row=0, column=2)
+        self.orientation_var = tk.StringVar(value='H')
+        orient_menu = tk.OptionMenu(place_frame, self.orientation_var, 'H', 'V')
+        orient_menu.config(width=3)
+        orient_menu.grid(row=0, column=3, padx=(4,8))
+
+        tk.Button(place_frame, text='Limpiar flota', command=self.clear_fleet).grid(row=0, column=4, padx=(6,0))
+
+        # Status
+        self.status_var = tk.StringVar(value='Estado: detenido')
+        tk.Label(root, textvariable=self.status_var).pack(anchor='w', padx=10)
+
+        # Board frame
+        board_frame = tk.Frame(root)
+        board_frame.pack(padx=10, pady=8)
+
+        # Tablero sobre un Canvas: solo dibuja las celdas visibles (ver gui_tablero.py)
+        filas = [chr(ord('A') + i) for i in range(self.servidor.filas)]
+        cols = [str(j + 1) for j in range(self.servidor.columnas)]
+        self.board = TableroCanvas(board_frame, filas, cols, al_pulsar=self.toggle_cell)
+        self.board.pack()
+
+        # Después de construir el tablero, sincronizar con el tablero del servidor
+        self.refresh_board()
+
+        # Info / legend
+        legend = tk.Frame(root)
+        legend.pack(padx=10, pady=(0,8), anchor='w')
+        tk.Label(legend, text='Leyenda: D = Destroyer, SS = Submarino (2), LLL = Acorazado (3), ~ = agua, X = impacto, 0 = fallo (agua)').pack(side='left')
+        tk.Button(legend, text='Refrescar flota', command=self.refresh_board).pack(side='left', padx=(8,0))
+
+        # Bind close
+        # Iniciar polling para refrescar tablero automáticamente (muestra impactos recibidos por el servidor)
+        self.root.after(500, self._poll_server)
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+
+    def _flota_bloqueada(self):
+        """En modo proceso la flota vive en el proceso servidor: no se edita mientras corre."""
+        if self.server_process and self.server_process.is_alive():
+            messagebox.showerror('Servidor en ejecución', 'Detenga el servidor para modificar la flota.')
+            return True
+        return False
+
+    def _editar(self, funcion, *args):
+        """Aplica una edición de la flota en el turno de la partida si el servidor corre en un hilo."""
+        actor = self.actor
+        if actor is not None:
+            try:
+                futuro = actor.ejecutar(funcion, *args)
+            except RuntimeError:
+                pass  # El servidor se detuvo: ya no hay ataques concurrentes
+            else:
+                return futuro.result()
+        return funcion(*args)
+
+    def toggle_cell(self, pos):
+        """Colocar el Destroyer en la celda seleccionada (solo 1 permitido)."""
+        if self._flota_bloqueada():
+            return
+
+        ship_choice = self.selected_ship_var.get()
+        orient = self.orientation_var.get()
+
+        # Map GUI choice to internal type
+        tipo_map = {'D': 'D', 'SS': 'S', 'LLL': 'L'}
+        tipo = tipo_map.get(ship_choice, 'D')
+
+        # If placing single-cell Destroyer
+        if tipo == 'D':
+            servidor_tab = self.servidor.tablero
+            current = next((p for p, v in servidor_tab.items() if v == 'D'), None)
+
+            if current == pos:
+                if messagebox.askyesno('Quitar', f'Quitar Destroyer de {pos}?'):
+                    # Quitar solo el Destroyer (conserva el resto de la flota y la configuración)
+                    self._editar(self.servidor.quitar_barco, 'D')
+                    self.refresh_board()
+                    self.status_var.set('Estado: Destroyer removido')
+                return
+
+            # No permitir sobre otros barcos (antes de quitar el actual al mover)
+            if self.servidor.tablero.get(pos) in ('S', 'L'):
+                messagebox.showerror('Error', f'No se puede colocar Destroyer sobre otro barco en {pos}.')
+                return
+
+            if current and current != pos:
+                if not messagebox.askyesno('Mover', f'Mover Destroyer de {current} a {pos}?'):
+                    return
+
+                def mover():
+                    # Quitar y colocar en un solo paso del actor
+                    self.servidor.quitar_barco('D')
+                    return self.servidor.colocar_flota(pos)
+                ok = self._editar(mover)
+            else:
+                ok = self._editar(self.servidor.colocar_flota, pos)
+            if ok:
+                self.refresh_board()
+                self.status_var.set(f'Destroyer colocado en {pos}')
+            else:
+                messagebox.showerror('Error', f'No se pudo colocar Destroyer en {pos}.')
+            return
+
+        # Para barcos multi-celda (SS -> longitud 2, L -> longitud 3)
+        length = 2 if tipo == 'S' else 3
+
+        # Calcular posiciones a partir de pos y orientación
+        row = pos[0]
+        col = int(pos[1:])
+        rows = self.board.filas
+
+        positions = []
+        try:
+            if orient == 'H':
+                # Avanzar columnas
+                for offset in range(length):
+                    c = col + offset
+                    positions.append(f"{row}{c}")
+            else:
+                # Vertical: avanzar filas
+                start_idx = rows.index(row)
+                for offset in range(length):
+                    r = rows[start_idx + offset]
+                    positions.append(f"{r}{col}")
+        except Exception:
+            messagebox.showerror('Error', 'Colocación fuera del tablero')
+            return
+
+        # Validar solapamientos y existencia
+        for p in positions:
+            if p not in self.servidor.tablero:
+                messagebox.showerror('Error', f'Posición inválida {p} en la colocación')
+                return
+            if self.servidor.tablero.get(p) is not None:
+                messagebox.showerror('Error', f'Celda {p} ya ocupada')
+                return
+
+        # Evitar múltiples instancias del mismo tipo
+        if self.servidor.ships.get(tipo):
+            if not messagebox.askyesno('Reemplazar', f'Ya existe un {ship_choice}. ¿Reemplazarlo?'):
+                return
+            # Quitar existente del mismo tipo
+            self._editar(self.servidor.quitar_barco, tipo)
+
+        ok = self._editar(self.servidor.colocar_barco, tipo, positions)
+        if ok:
+            self.refresh_board()
+            self.status_var.set(f'{ship_choice} colocado en {positions}')
+        else:
+            messagebox.showerror('Error', 'No se pudo colocar el barco')
+
+    def clear_fleet(self):
+        """Limpia la flota en el servidor y refresca la GUI."""
+        if self._flota_bloqueada():
+            return
+        if messagebox.askyesno('Limpiar', '¿Desea quitar todos los barcos del tablero?'):
+            self._editar(self.servidor.limpiar_flota)
+            self.refresh_board()
+            self.status_var.set('Flota limpiada')
+
+    def refresh_board(self):
+        """Actualizar visualmente las celdas según el tablero y los impactos del servidor (solo se redibujan las que cambian)."""
+        textos = {'D': 'D', 'S': 'SS', 'L': 'LLL'}
+        impactos = self.servidor.impactos
+        tablero = self.servidor.tablero
+        for pos in tablero:
+            # Priorizar impactos
+            marca = impactos.get(pos)
+            if marca == 'X':
+                self.board.actualizar(pos, 'X')
+            elif marca == 'O':
+                self.board.actualizar(pos, '0')
+            else:
+                self.board.actualizar(pos, textos.get(tablero[pos], '~'))
+
+    def _poll_server(self):
+        """Polling periódico: refresca la vista del tablero para mostrar impactos que llegan desde el hilo del servidor."""
+        try:
+            if self.compartido:
+                # Leer el estado publicado por el proceso servidor
+                if self.compartido.volcar_en(self.servidor):
+                    self.refresh_board()
+                if not self.server_process.is_alive():
+                    self._liberar_proceso()
+                    self.status_var.set('Estado: detenido')
+                    self.start_btn.config(state='normal')
+                    self.stop_btn.config(state='disabled')
+            else:
+                self.refresh_board()
+        finally:
+            # Reprogramar
+            self.root.after(500, self._poll_server)
+
+    def start_server(self):
+        # Validar IP y puerto
+        ip = self.ip_var.get().strip()
+        try:
+            port = int(self.port_var.get().strip())
+        except ValueError:
+            messagebox.showerror('Puerto inválido', 'Ingrese un número de puerto válido')
+            return
+
+        # Setear en la instancia
+        self.servidor.host = ip
+        self.servidor.port = port
+
+        # Iniciar hilo del servidor
+        if (self.server_thread and self.server_thread.is_alive()) or \
+                (self.server_process and self.server_process.is_alive()):
+            messagebox.showinfo('Servidor', 'El servidor ya está corriendo')
+            return
+
+        if self.proceso_var.get():
+            self._start_server_process(ip, port)
+            return
+
+        from .actores import ActorPartida
+        self.actor = self.servidor.actor = ActorPartida(self.servidor)
+
+        def run_server():
+            try:
+                self.status_var.set(f'Estado: escuchando en {ip}:{port}')
+                self.servidor.iniciar_servidor()
+            except Exception as e:
+                print('Excepción en servidor:', e)
+            finally:
+                actor, self.actor = self.actor, None
+                self.servidor.actor = None
+                actor.detener()
+                self.status_var.set('Estado: detenido')
+                self.start_btn.config(state='normal')
+                self.stop_btn.config(state='disabled')
+
+        self.server_thread = threading.Thread(target=run_server, daemon=True)
+        self.server_thread.start()
+        self.start_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+        self.status_var.set(f'Estado: iniciando servidor en {ip}:{port} (ver consola)')
+
+    def _start_server_process(self, ip, port):
+        """Lanza el núcleo del servidor en un proceso propio (ver memoria.py)."""
+        from . import memoria
+
+        flota = {t: sorted(p for p, v in self.servidor.tablero.items() if v == t) for t in ('D', 'S', 'L')}
+        self.compartido = memoria.TableroCompartido(filas=self.servidor.filas,
+                                                        columnas=self.servidor.columnas, crear=True)
+        self.compartido.publicar(self.servidor)
+        self.server_process = multiprocessing.Process(
+            target=memoria.ejecutar_servidor,
+            args=(self.compartido.nombre, ip, port, flota),
+            daemon=True)
+        self.server_process.start()
+        self.start_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+        self.status_var.set(f'Estado: escuchando en {ip}:{port} (proceso {self.server_process.pid})')
+
+    def _liberar_proceso(self):
+        """Detiene el proceso servidor (si sigue vivo) y libera la memoria compartida."""
+        if self.server_process:
+            if self.server_process.is_alive():
+                self.server_process.terminate()
+            self.server_process.join(timeout=2)
+            self.server_process = None
+        if self.compartido:
+            self.compartido.liberar()
+            self.compartido = None
+
+    def stop_server(self):
+        if self.server_process:
+            self._liberar_proceso()
+            self.status_var.set('Estado: detenido (proceso terminado)')
+            self.start_btn.config(state='normal')
+            self.stop_btn.config(state='disabled')
+            return
+
+        # Intentar cerrar el socket del servidor para detener el loop
+        try:
+            if self.servidor.server_socket:
+                self.servidor.detener_servidor()
+                self.status_var.set('Estado: detenido (socket cerrado)')
+            else:
+                self.status_var.set('Estado: detenido (no había socket)')
+        except Exception as e:
+            messagebox.showwarning('Detener servidor', f'Error al detener: {e}')
+        self.start_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+
+    def on_close(self):
+        # Intentar apagar servidor antes de salir
+        if messagebox.askyesno('Salir', '¿Desea detener el servidor y salir?'):
+            try:
+                self.servidor.detener_servidor()
+                self._liberar_proceso()
+            except Exception:
+                pass
+            self.root.destroy()
+
+
+def main():
+    root = tk.Tk()
+    app = ServerGUI(root)
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
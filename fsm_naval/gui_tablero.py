@@ -0,0 +1,326 @@
+"""
+Tablero de las GUIs sobre un único `tk.Canvas` (en lugar de un `tk.Button`
+por celda), pensado para tableros grandes:
+
+- Solo se dibujan las celdas visibles en la ventana; al desplazarse se crean
+  las que entran y se borran las que salen.
+- Desplazamiento con barras y rueda del ratón (Shift + rueda: horizontal) y
+  zoom con Ctrl + rueda o las teclas + / -.
+- El clic se traduce a coordenada con aritmética (sin un binding por celda).
+- `actualizar()` solo toca los ítems de la celda si su aspecto cambió y está
+  visible; el resto se dibuja al entrar en la ventana.
+
+El aspecto de cada celda (texto, fondo, color, activa) se guarda solo para
+las celdas distintas de la celda por defecto.
+"""
+
+import tkinter as tk
+
+# Aspecto por defecto de una celda (como un tk.Button sin tocar)
+FONDO = '#d9d9d9'
+TEXTO = '~'
+COLOR = 'black'
+COLOR_INACTIVA = 'gray50'
+BORDE = 'gray60'
+
+TAM_MIN, TAM_MAX = 12, 96
+
+# (texto, fondo, color del texto, activa) de una celda sin tocar
+_POR_DEFECTO = (TEXTO, FONDO, None, True)
+
+
+def _color(aspecto):
+    texto, fondo, color, activa = aspecto
+    return color or (COLOR if activa else COLOR_INACTIVA)
+
+
+def rango_visible(inicio, largo, margen, tam, n):
+    """
+    Índices de las filas (o columnas) que caen en una ventana de píxeles.
+
+    Args:
+        inicio, largo: comienzo y tamaño de la ventana (coordenadas del canvas)
+        margen: píxeles ocupados por las etiquetas antes de la primera celda
+        tam: tamaño de una celda en píxeles
+        n: número de filas (o columnas)
+
+    Returns:
+        Tuple: (primera, última + 1), recortado a [0, n].
+    """
+    primera = max(0, int((inicio - margen) // tam))
+    ultima = min(n, int((inicio + largo - margen) // tam) + 1)
+    return primera, max(primera, ultima)
+
+
+class TableroCanvas(tk.Frame):
+    """
+    Tablero virtualizado sobre un Canvas con barras de desplazamiento.
+
+    Args:
+        master: widget contenedor
+        filas: etiquetas de las filas (ej: ['A', 'B', ...])
+        columnas: etiquetas de las columnas (ej: ['1', '2', ...])
+        al_pulsar: función llamada con la coordenada pulsada (ej: 'B3')
+        tam_celda: tamaño inicial de cada celda en píxeles
+        ancho_max, alto_max: tamaño máximo de la ventana visible en píxeles
+    """
+
+    def __init__(self, master, filas, columnas, al_pulsar, tam_celda=36, ancho_max=600, alto_max=600):
+        super().__init__(master)
+        self.al_pulsar = al_pulsar
+        self.tam = tam_celda
+        self.ancho_max = ancho_max
+        self.alto_max = alto_max
+
+        # Aspecto de las celdas distintas de la celda por defecto:
+        # coordenada -> (texto, fondo, color, activa)
+        self.celdas = {}
+
+        # Ítems dibujados (solo celdas visibles): (i, j) -> (rectángulo, texto)
+        self._items = {}
+        self._etiquetas_filas = {}     # i -> ítem de texto
+        self._etiquetas_columnas = {}  # j -> ítem de texto
+        self._redibujo_pendiente = False
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, bg='white')
+        self.barra_x = tk.Scrollbar(self, orient='horizontal', command=self.canvas.xview)
+        self.barra_y = tk.Scrollbar(self, orient='vertical', command=self.canvas.yview)
+        self.canvas.config(xscrollcommand=self._desplazado_x, yscrollcommand=self._desplazado_y)
+        self.canvas.grid(row=0, column=0, sticky='nsew')
+        self.barra_y.grid(row=0, column=1, sticky='ns')
+        self.barra_x.grid(row=1, column=0, sticky='ew')
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Franjas de las etiquetas (quedan fijas arriba y a la izquierda)
+        self._franja_x = self.canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='', tags='etiqueta')
+        self._franja_y = self.canvas.create_rectangle(0, 0, 0, 0, fill='white', outline='', tags='etiqueta')
+
+        self.canvas.bind('<Configure>', lambda e: self._programar_redibujo())
+        self.canvas.bind('<Button-1>', self._clic)
+        self.canvas.bind('<MouseWheel>', self._rueda)
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._rueda(e, horizontal=True))
+        self.canvas.bind('<Control-MouseWheel>', lambda e: self.zoom(1.25 if e.delta > 0 else 0.8))
+        self.canvas.bind('<Button-4>', lambda e: self.canvas.yview_scroll(-1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.canvas.yview_scroll(1, 'units'))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self.canvas.xview_scroll(-1, 'units'))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self.canvas.xview_scroll(1, 'units'))
+        self.canvas.bind('<Control-Button-4>', lambda e: self.zoom(1.25))
+        self.canvas.bind('<Control-Button-5>', lambda e: self.zoom(0.8))
+        self.canvas.bind('<plus>', lambda e: self.zoom(1.25))
+        self.canvas.bind('<KP_Add>', lambda e: self.zoom(1.25))
+        self.canvas.bind('<minus>', lambda e: self.zoom(0.8))
+        self.canvas.bind('<KP_Subtract>', lambda e: self.zoom(0.8))
+
+        self.redimensionar(filas, columnas)
+
+    # ------------------------------------------------------------------
+    # Geometría (aritmética pura)
+    # ------------------------------------------------------------------
+    @property
+    def margen(self):
+        """Píxeles reservados para las etiquetas de filas y columnas."""
+        return max(16, self.tam * 2 // 3)
+
+    def celda_en(self, x, y):
+        """Coordenada de la celda en el punto (x, y) del canvas, o None si no hay celda."""
+        m = self.margen
+        if x < m or y < m:
+            return None
+        i = int((y - m) // self.tam)
+        j = int((x - m) // self.tam)
+        if i >= len(self.filas) or j >= len(self.columnas):
+            return None
+        return f"{self.filas[i]}{self.columnas[j]}"
+
+    def _posicion(self, pos):
+        """(i, j) de una coordenada, o None si no pertenece al tablero."""
+        fila = pos.rstrip('0123456789')
+        i = self._indice_fila.get(fila)
+        j = self._indice_columna.get(pos[len(fila):])
+        if i is None or j is None:
+            return None
+        return i, j
+
+    def _ventana(self):
+        """Rangos (filas, columnas) de celdas visibles."""
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        ancho = self.canvas.winfo_width()
+        alto = self.canvas.winfo_height()
+        filas = rango_visible(y0, alto, self.margen, self.tam, len(self.filas))
+        columnas = rango_visible(x0, ancho, self.margen, self.tam, len(self.columnas))
+        return filas, columnas
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def redimensionar(self, filas, columnas):
+        """Cambia las filas/columnas del tablero (borra el aspecto de todas las celdas)."""
+        self.filas = list(filas)
+        self.columnas = list(columnas)
+        self._indice_fila = {f: i for i, f in enumerate(self.filas)}
+        self._indice_columna = {c: j for j, c in enumerate(self.columnas)}
+        self.celdas.clear()
+        self._reconfigurar()
+
+    def actualizar(self, pos, texto=TEXTO, fondo=FONDO, color=None, activa=True):
+        """
+        Cambia el aspecto de una celda. Solo redibuja si cambió y está visible.
+
+        Args:
+            pos: coordenada (ej: 'B3')
+            texto, fondo: texto y color de fondo de la celda
+            color: color del texto (None = negro, o gris si está inactiva)
+            activa: si False, los clics sobre la celda se ignoran
+        """
+        aspecto = (texto, fondo, color, activa)
+        if self.celdas.get(pos, _POR_DEFECTO) == aspecto:
+            return
+        if aspecto == _POR_DEFECTO:
+            self.celdas.pop(pos, None)
+        else:
+            self.celdas[pos] = aspecto
+
+        ij = self._posicion(pos)
+        items = self._items.get(ij) if ij else None
+        if items:
+            rect, txt = items
+            self.canvas.itemconfig(rect, fill=fondo)
+            self.canvas.itemconfig(txt, text=texto, fill=_color(aspecto))
+
+    def activa(self, pos):
+        """True si la celda acepta clics."""
+        return self.celdas.get(pos, _POR_DEFECTO)[3]
+
+    def activar(self, pos, activa=True):
+        """Activa o desactiva una celda sin cambiar su texto ni sus colores."""
+        texto, fondo, color, _ = self.celdas.get(pos, _POR_DEFECTO)
+        self.actualizar(pos, texto, fondo, color, activa)
+
+    def zoom(self, factor):
+        """Acerca (factor > 1) o aleja el tablero manteniendo el centro de la vista."""
+        tam = max(TAM_MIN, min(TAM_MAX, int(round(self.tam * factor))))
+        if tam == self.tam:
+            return
+        # Fracción del tablero en el centro de la vista, para conservarla
+        ancho, alto = self._tamano_total()
+        cx = (self.canvas.canvasx(0) + self.canvas.winfo_width() / 2) / ancho
+        cy = (self.canvas.canvasy(0) + self.canvas.winfo_height() / 2) / alto
+        self.tam = tam
+        self._reconfigurar(ajustar_ventana=False)
+        ancho, alto = self._tamano_total()
+        self.canvas.xview_moveto(max(0.0, cx - self.canvas.winfo_width() / 2 / ancho))
+        self.canvas.yview_moveto(max(0.0, cy - self.canvas.winfo_height() / 2 / alto))
+
+    # ------------------------------------------------------------------
+    # Dibujo
+    # ------------------------------------------------------------------
+    def _tamano_total(self):
+        return (self.margen + len(self.columnas) * self.tam,
+                self.margen + len(self.filas) * self.tam)
+
+    def _reconfigurar(self, ajustar_ventana=True):
+        """Borra todos los ítems de celdas y vuelve a dibujar la vista (tras cambiar tamaño o zoom)."""
+        for rect, txt in self._items.values():
+            self.canvas.delete(rect, txt)
+        for item in list(self._etiquetas_filas.values()) + list(self._etiquetas_columnas.values()):
+            self.canvas.delete(item)
+        self._items.clear()
+        self._etiquetas_filas.clear()
+        self._etiquetas_columnas.clear()
+
+        ancho, alto = self._tamano_total()
+        # Rueda y flechas de las barras avanzan de a una celda
+        self.canvas.config(scrollregion=(0, 0, ancho, alto),
+                           xscrollincrement=self.tam, yscrollincrement=self.tam)
+        if ajustar_ventana:
+            self.canvas.config(width=min(ancho, self.ancho_max), height=min(alto, self.alto_max))
+        self._programar_redibujo()
+
+    def _programar_redibujo(self):
+        # Agrupar varios eventos de desplazamiento en un solo redibujo
+        if not self._redibujo_pendiente:
+            self._redibujo_pendiente = True
+            self.after_idle(self._dibujar_visibles)
+
+    def _desplazado_x(self, *args):
+        self.barra_x.set(*args)
+        self._programar_redibujo()
+
+    def _desplazado_y(self, *args):
+        self.barra_y.set(*args)
+        self._programar_redibujo()
+
+    def _dibujar_visibles(self):
+        """Crea los ítems de las celdas que entraron en la vista y borra los de las que salieron."""
+        self._redibujo_pendiente = False
+        (f0, f1), (c0, c1) = self._ventana()
+        tam, m = self.tam, self.margen
+        fuente = ('Helvetica', max(6, tam // 3))
+
+        for (i, j) in [ij for ij in self._items if not (f0 <= ij[0] < f1 and c0 <= ij[1] < c1)]:
+            self.canvas.delete(*self._items.pop((i, j)))
+
+        for i in range(f0, f1):
+            y = m + i * tam
+            for j in range(c0, c1):
+                if (i, j) in self._items:
+                    continue
+                x = m + j * tam
+                pos = f"{self.filas[i]}{self.columnas[j]}"
+                aspecto = self.celdas.get(pos, _POR_DEFECTO)
+                rect = self.canvas.create_rectangle(x + 1, y + 1, x + tam - 1, y + tam - 1,
+                                                    fill=aspecto[1], outline=BORDE)
+                txt = self.canvas.create_text(x + tam / 2, y + tam / 2, text=aspecto[0],
+                                              fill=_color(aspecto), font=fuente)
+                self._items[(i, j)] = (rect, txt)
+
+        self._dibujar_etiquetas(f0, f1, c0, c1, fuente)
+
+    def _dibujar_etiquetas(self, f0, f1, c0, c1, fuente):
+        """Etiquetas de las filas/columnas visibles, fijas en el borde de la vista."""
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        tam, m = self.tam, self.margen
+        ancho, alto = self._tamano_total()
+        self.canvas.coords(self._franja_x, x0, y0, x0 + ancho, y0 + m)
+        self.canvas.coords(self._franja_y, x0, y0, x0 + m, y0 + alto)
+
+        for etiquetas, inicio, fin in ((self._etiquetas_filas, f0, f1), (self._etiquetas_columnas, c0, c1)):
+            for k in [k for k in etiquetas if not inicio <= k < fin]:
+                self.canvas.delete(etiquetas.pop(k))
+
+        for i in range(f0, f1):
+            x, y = x0 + m / 2, m + i * tam + tam / 2
+            if i in self._etiquetas_filas:
+                self.canvas.coords(self._etiquetas_filas[i], x, y)
+            else:
+                self._etiquetas_filas[i] = self.canvas.create_text(x, y, text=self.filas[i],
+                                                                   font=fuente, tags='etiqueta')
+        for j in range(c0, c1):
+            x, y = m + j * tam + tam / 2, y0 + m / 2
+            if j in self._etiquetas_columnas:
+                self.canvas.coords(self._etiquetas_columnas[j], x, y)
+            else:
+                self._etiquetas_columnas[j] = self.canvas.create_text(x, y, text=self.columnas[j],
+                                                                      font=fuente, tags='etiqueta')
+        self.canvas.tag_raise('etiqueta')
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+    def _clic(self, event):
+        self.canvas.focus_set()  # Para recibir las teclas de zoom
+        if event.x < self.margen or event.y < self.margen:
+            return  # Clic sobre las etiquetas fijas
+        pos = self.celda_en(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if pos is not None and self.activa(pos):
+            self.al_pulsar(pos)
+
+    def _rueda(self, event, horizontal=False):
+        pasos = -1 if event.delta > 0 else 1
+        if horizontal:
+            self.canvas.xview_scroll(pasos, 'units')
+        else:
+            self.canvas.yview_scroll(pasos, 'units')
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+FSM Naval Battle - Lobby de Emparejamiento
+-----------------------------------
+Servicio delante de los servidores de juego: los clientes piden partida al
+lobby en vez de conocer la IP y el puerto de un servidor concreto.
+
+Protocolo (una conexión por mensaje, como el juego):
+    JOIN          -> el lobby retiene la conexión hasta completar la partida y
+                     responde "200:id_partida:host:puerto" (host y puerto del lobby)
+    id|mensaje    -> mensaje del juego de siempre ("A1", "STATE...") para la
+                     partida `id`, por el mismo puerto del lobby; una partida
+                     cerrada o inexistente responde "410:Partida_Desconocida"
+    STATS         -> "200:en_cola:partidas:uniones"
+    PROFILE:...   -> perfilado en caliente del lobby (ver perfilado.py; solo desde
+                     localhost). También llega como "id|PROFILE:..." y se atiende
+                     igual: el perfil es del proceso, no de una partida.
+
+Control de admisión (ver admision.py): los JOIN pasan por el límite global
+y por el de cada cliente, y los mensajes de cada partida también por el de
+la partida; con la cola llena, JOIN responde 503.
+
+Cada partida es un `EstadoPartida` (estado.py) con flota aleatoria. Todas
+comparten el puerto del lobby (no se abre un socket por partida: los
+descriptores solo los ocupan las conexiones en curso) y todo corre en un solo
+hilo sobre `selectors`, sin un hilo por partida. Una partida se cierra y su
+estado vuelve al pool en cuanto su flota queda hundida; el reinicio solo
+limpia las celdas que se tocaron y renueva el token (= id de la partida).
+
+Costos por petición:
+- Cola de espera: deque (append/popleft O(1)). Los que se desconectan
+  mientras esperan se descartan de forma perezosa al sacarlos de la cola.
+- Partidas: dict por id (el id viaja en cada mensaje), así que nunca se
+  recorren las partidas activas.
+- Expiración por inactividad: OrderedDict en orden de último uso; solo se
+  mira la más vieja.
+
+Uso:
+    python3 -m fsm_naval lobby [--puerto 6000] [--jugadores 2]
+"""
+
+import time
+import random
+import argparse
+import selectors
+from collections import deque, OrderedDict
+
+from .estado import PoolEstados
+from .admision import ControlAdmision
+from .transporte import TransporteTCP
+from .torneo import defensor_aleatorio
+
+
+class Lobby:
+    """
+    Lobby de emparejamiento.
+
+    Args:
+        host, port: dirección de escucha del lobby (port=0: puerto libre)
+        jugadores_por_partida: clientes que comparten cada partida
+        host_anunciado: host que se entrega a los clientes (por defecto el de escucha
+                        o 127.0.0.1 si se escucha en todas las interfaces)
+        semilla: semilla de las flotas aleatorias (None = al azar)
+    """
+
+    def __init__(self, host='', port=6000, jugadores_por_partida=2, host_anunciado=None, semilla=None):
+        self.host = host
+        self.port = port
+        self.jugadores_por_partida = jugadores_por_partida
+        self.host_anunciado = host_anunciado or host or '127.0.0.1'
+        self.rng = random.Random(semilla)
+
+        # Límites
+        self.backlog = 1024            # Conexiones pendientes del lobby (ráfagas de JOIN)
+        self.max_partidas = 10000      # Con el lobby lleno, JOIN responde 503
+        self.max_en_cola = 10000       # Jugadores esperando como máximo (cola acotada)
+        self.inactividad = 300.0       # Segundos sin mensajes antes de cerrar una partida
+
+        # Archivo de partidas terminadas compartido por todas las partidas (opcional)
+        self.archivo = None
+
+        # Límites de ritmo compartidos por el lobby y todas sus partidas (None = sin límites)
+        self.admision = ControlAdmision()
+
+        # Jugadores esperando: cola de sockets + dict para descartar abandonos en O(1)
+        self.cola = deque()
+        self.esperando = {}            # socket -> dirección
+
+        # Partidas activas: id -> EstadoPartida. Los estados de partidas cerradas
+        # se reciclan (reiniciar renueva el token = id nuevo)
+        self.partidas = {}
+        self.pool = PoolEstados()
+        self._actividad = OrderedDict()  # id -> último uso, del más viejo al más nuevo
+
+        # Estadísticas
+        self.uniones = 0
+        self.partidas_creadas = 0
+        self.errores_aceptar = 0
+        self.errores_conexion = 0
+
+        # Perfilado en caliente (ver perfilado.py); se crea con el primer PROFILE.
+        # Se inicia y se revisa en el hilo del bucle, así mide el lobby entero.
+        self.perfilador = None
+
+        self.selector = None
+        self.lobby_socket = None
+        self._activo = False
+
+    # ------------------------------------------------------------------
+    # Cola de espera
+    # ------------------------------------------------------------------
+    def _aceptar_lobby(self, sock, _):
+        try:
+            conn, direccion = sock.accept()
+        except OSError:
+            # BlockingIOError, ECONNABORTED o sin descriptores (EMFILE): el lobby sigue
+            self.errores_aceptar += 1
+            return
+        conn.setblocking(False)
+        self.selector.register(conn, selectors.EVENT_READ, (self._leer_lobby, direccion))
+
+    def _leer_lobby(self, conn, direccion):
+        try:
+            datos = conn.recv(1024)
+        except OSError:
+            datos = b''
+
+        if conn in self.esperando:
+            # Un jugador en espera no debería enviar nada más: datos vacíos = se fue
+            if not datos:
+                del self.esperando[conn]
+                self._cerrar(conn)
+            return
+
+        texto = datos.decode(errors='replace').strip()
+        id_partida, separador, mensaje = texto.partition('|')
+        if separador:
+            if mensaje.split(':')[0].upper() != 'PROFILE':
+                self._mensaje_partida(conn, direccion, id_partida, mensaje)
+                return
+            # El perfil es del proceso: "id|PROFILE:..." se atiende como "PROFILE:..."
+            texto = mensaje
+
+        comando = texto.split(':')[0].upper()
+        if comando == 'PROFILE':
+            self._responder(conn, "{}:{}".format(*self._perfilado(texto, direccion)))
+        elif comando == 'JOIN':
+            rechazo = self.admision.admitir(direccion) if self.admision is not None else None
+            if rechazo is None and len(self.esperando) >= self.max_en_cola:
+                rechazo = "503", "Servidor_Saturado:1000"
+            if rechazo:
+                self._responder(conn, "{}:{}".format(*rechazo))
+                return
+            self.uniones += 1
+            self.cola.append(conn)
+            self.esperando[conn] = direccion
+            self._emparejar()
+        elif comando == 'STATS':
+            self._responder(conn, f"200:{len(self.esperando)}:{len(self.partidas)}:{self.uniones}")
+        elif datos:
+            self._responder(conn, "400:Comando_Invalido")
+        else:
+            self._cerrar(conn)
+
+    def _perfilado(self, mensaje, direccion):
+        """Comando PROFILE del lobby (solo desde loopback)."""
+        if direccion[0] not in ('127.0.0.1', '::1'):
+            return "403", "Prohibido"
+        from .perfilado import Perfilador, procesar_comando
+        if self.perfilador is None:
+            self.perfilador = Perfilador()
+        return procesar_comando(self.perfilador, mensaje.split(':'))
+
+    def _emparejar(self):
+        """Crea partidas mientras haya suficientes jugadores en la cola."""
+        while len(self.esperando) >= self.jugadores_por_partida:
+            jugadores = []
+            while len(jugadores) < self.jugadores_por_partida:
+                conn = self.cola.popleft()
+                # Descartar perezosamente a los que abandonaron la cola
+                if self.esperando.pop(conn, None) is not None:
+                    jugadores.append(conn)
+
+            if len(self.partidas) >= self.max_partidas:
+                for conn in jugadores:
+                    self._responder(conn, "503:Lobby_Lleno")
+                continue
+
+            id_partida = self._crear_partida()
+            for conn in jugadores:
+                self._responder(conn, f"200:{id_partida}:{self.host_anunciado}:{self.port}")
+
+    # ------------------------------------------------------------------
+    # Partidas
+    # ------------------------------------------------------------------
+    def _crear_partida(self):
+        """
+        Crea (o recicla del pool) una partida con flota aleatoria.
+
+        Returns:
+            Id de la partida.
+        """
+        partida = self.pool.obtener()
+        defensor_aleatorio(partida, self.rng)
+        # El id de la partida es su token de sesión
+        id_partida = partida.token_sesion
+
+        self.partidas[id_partida] = partida
+        self._actividad[id_partida] = time.monotonic()
+        self.partidas_creadas += 1
+        return id_partida
+
+    def _mensaje_partida(self, conn, direccion, id_partida, mensaje):
+        """Atiende un mensaje del juego ("id|A1") dirigido a una partida."""
+        partida = self.partidas.get(id_partida)
+        if partida is None:
+            self._responder(conn, "410:Partida_Desconocida")
+            return
+
+        rechazo = self.admision.admitir(direccion, id_partida) if self.admision is not None else None
+        if rechazo:
+            self._responder(conn, "{}:{}".format(*rechazo))
+            return
+
+        codigo, respuesta = partida.procesar_mensaje(mensaje)
+        self._responder(conn, f"{codigo}:{respuesta}")
+
+        if partida.estado_actual == partida.HUNDIDO:
+            # Partida terminada: liberarla ya (no esperar a la inactividad)
+            self.cerrar_partida(id_partida)
+        else:
+            self._actividad[id_partida] = time.monotonic()
+            self._actividad.move_to_end(id_partida)
+
+    def cerrar_partida(self, id_partida):
+        """Cierra una partida (archivándola si corresponde) y recicla su estado."""
+        partida = self.partidas.pop(id_partida, None)
+        self._actividad.pop(id_partida, None)
+        if partida is None:
+            return
+        if self.archivo is not None and partida.secuencia_ataques:
+            try:
+                self.archivo.agregar(partida)
+            except OSError as e:
+                print(f"No se pudo archivar la partida: {e}")
+        self.pool.devolver(partida)
+
+    def _expirar(self, ahora):
+        """Cierra las partidas sin actividad reciente (solo mira las más viejas)."""
+        while self._actividad:
+            id_partida, ultimo = next(iter(self._actividad.items()))
+            if ahora - ultimo < self.inactividad:
+                break
+            self.cerrar_partida(id_partida)
+
+    # ------------------------------------------------------------------
+    # Utilidades de sockets
+    # ------------------------------------------------------------------
+    def _responder(self, conn, texto):
+        # Respuestas cortas: caben enteras en el búfer de envío de un socket nuevo
+        try:
+            conn.send(texto.encode())
+        except OSError:
+            pass
+        self._cerrar(conn)
+
+    def _descartar(self, sock, error):
+        """Cierra una conexión que falló al atenderla, sin detener el lobby."""
+        self.errores_conexion += 1
+        print(f"Error atendiendo una conexión: {error}")
+        if sock is self.lobby_socket:
+            return
+        self.esperando.pop(sock, None)
+        self._cerrar(sock)
+
+    def _cerrar(self, sock):
+        try:
+            self.selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+
+    # ------------------------------------------------------------------
+    # Bucle principal
+    # ------------------------------------------------------------------
+    def detener_lobby(self):
+        """Pide al bucle que termine (se puede llamar desde otro hilo)."""
+        self._activo = False
+
+    def iniciar_lobby(self):
+        """
+        Inicia el lobby y atiende a la vez la cola y todas las partidas.
+        """
+        self.selector = selectors.DefaultSelector()
+        transporte = TransporteTCP(self.host, self.port)
+        try:
+            self.lobby_socket = transporte.escuchar(self.backlog)
+            self.lobby_socket.setblocking(False)
+            self.port = transporte.port
+            self.selector.register(self.lobby_socket, selectors.EVENT_READ, (self._aceptar_lobby, None))
+
+            print(f"\n╔══════════════════════════════════════════╗")
+            print(f"║ [ LOBBY DE EMPAREJAMIENTO - FSM ]        ║")
+            print(f"╚══════════════════════════════════════════╝")
+            print(f"Escuchando en {transporte} ({self.jugadores_por_partida} jugadores por partida)...")
+
+            self._activo = True
+            while self._activo:
+                for clave, _ in self.selector.select(timeout=0.5):
+                    atender, datos = clave.data
+                    try:
+                        atender(clave.fileobj, datos)
+                    except Exception as e:
+                        # Un error de una conexión solo cierra esa conexión
+                        self._descartar(clave.fileobj, e)
+                self._expirar(time.monotonic())
+                # Cerrar la ventana de perfilado si ya venció (el select despierta cada 0.5 s)
+                if self.perfilador:
+                    self.perfilador.revisar()
+
+        except KeyboardInterrupt:
+            print("\nLobby detenido por el usuario.")
+        except Exception as e:
+            print(f"Error en el lobby: {e}")
+        finally:
+            for conn in list(self.esperando):
+                self._cerrar(conn)
+            self.esperando.clear()
+            self.cola.clear()
+            for id_partida in list(self.partidas):
+                self.cerrar_partida(id_partida)
+            for clave in list(self.selector.get_map().values()):
+                self._cerrar(clave.fileobj)
+            self.selector.close()
+            if self.perfilador:
+                self.perfilador.detener()
+            print(f"Lobby cerrado ({self.uniones} uniones, {self.partidas_creadas} partidas).")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='fsm_naval lobby', description='Lobby de emparejamiento')
+    parser.add_argument('--host', default='')
+    parser.add_argument('--puerto', type=int, default=6000)
+    parser.add_argument('--jugadores', type=int, default=2, help='jugadores por partida')
+    parser.add_argument('--anunciar', help='host que se entrega a los clientes')
+    parser.add_argument('--archivo', help='base del archivo de partidas terminadas')
+    parser.add_argument('--semilla', type=int, default=None, help='semilla de las flotas aleatorias')
+    args = parser.parse_args(argv)
+
+    lobby = Lobby(args.host, args.puerto, args.jugadores, args.anunciar, args.semilla)
+    if args.archivo:
+        from .archivo import ArchivoPartidas
+        lobby.archivo = ArchivoPartidas(args.archivo)
+    lobby.iniciar_lobby()
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""
+FSM Naval Battle - Tablero en Memoria Compartida
+-----------------------------------
+Permite ejecutar el núcleo del servidor (`NavalServerFSM.iniciar_servidor`)
+en un proceso propio y publicar su estado en un segmento de
+`multiprocessing.shared_memory`. La GUI del servidor solo lee el segmento,
+así que no compite por el GIL con el bucle de sockets.
+
+Formato del segmento:
+    cabecera  <QHHB3x : secuencia, filas, columnas, estado del autómata
+    celdas    1 byte por celda (orden por filas):
+              nibble bajo = tipo de barco (0 agua, 1 D, 2 S, 3 L)
+              nibble alto = impacto (0 '~', 1 'O', 2 'X')
+
+La secuencia funciona como un seqlock: el escritor la deja impar mientras
+escribe y par al terminar; el lector reintenta si la ve impar o si cambió
+durante la copia. Si el escritor muere a mitad de una publicación, el lector
+deja de reintentar a los ESPERA_LECTURA segundos y se queda con la última
+copia consistente. El lector lee a través de un mapeo de solo lectura.
+"""
+
+import os
+import mmap
+import time
+import signal
+import struct
+from multiprocessing import shared_memory
+
+from .servidor import NavalServerFSM
+
+CABECERA = struct.Struct('<QHHB3x')
+
+TIPOS = {None: 0, 'D': 1, 'S': 2, 'L': 3}
+TIPOS_INV = {v: k for k, v in TIPOS.items()}
+IMPACTOS = {'~': 0, 'O': 1, 'X': 2}
+IMPACTOS_INV = {v: k for k, v in IMPACTOS.items()}
+ESTADOS = ('q0', 'q1', 'q2')
+
+# Tiempo máximo que el lector espera a que termine una publicación (segundos)
+ESPERA_LECTURA = 0.05
+
+
+class TableroCompartido:
+    """
+    Segmento de memoria compartida con el estado del tablero del servidor.
+
+    El proceso que lo crea (la GUI) es el responsable de liberarlo con `liberar()`.
+    """
+
+    def __init__(self, nombre=None, filas=5, columnas=5, crear=False):
+        if crear:
+            tam = CABECERA.size + filas * columnas
+            self.shm = shared_memory.SharedMemory(name=nombre, create=True, size=tam)
+            CABECERA.pack_into(self.shm.buf, 0, 0, filas, columnas, 0)
+        else:
+            # El proceso servidor hereda el resource_tracker de la GUI, así que
+            # el segmento se registra una sola vez y lo libera su creador.
+            self.shm = shared_memory.SharedMemory(name=nombre)
+        self.nombre = self.shm.name
+        self.creador = crear
+        _, self.filas, self.columnas, _ = CABECERA.unpack_from(self.shm.buf, 0)
+        self._ultima_secuencia = None
+
+        # Lado lector: mapeo de solo lectura (se abre con la primera lectura)
+        self._mapa_lectura = None
+        self._vista_lectura = None
+        self._ultima_copia = None
+
+    def _vista_solo_lectura(self):
+        """Vista del segmento para leer, mapeada sin permiso de escritura."""
+        if self._vista_lectura is None:
+            try:
+                import _posixshmem
+            except ImportError:
+                # Sin shm_open (Windows): vista de solo lectura sobre el mapeo existente
+                self._vista_lectura = self.shm.buf.toreadonly()
+            else:
+                fd = _posixshmem.shm_open('/' + self.nombre, os.O_RDONLY, mode=0o600)
+                try:
+                    self._mapa_lectura = mmap.mmap(fd, self.shm.size, access=mmap.ACCESS_READ)
+                finally:
+                    os.close(fd)
+                self._vista_lectura = memoryview(self._mapa_lectura)
+        return self._vista_lectura
+
+    def publicar(self, servidor):
+        """Escribe el estado actual del servidor en el segmento (lado escritor)."""
+        buf = self.shm.buf
+        secuencia = CABECERA.unpack_from(buf, 0)[0]
+        # Secuencia impar: escritura en curso
+        struct.pack_into('<Q', buf, 0, secuencia + 1)
+
+        celdas = bytearray(self.filas * self.columnas)
+        for i, pos in enumerate(servidor.tablero):
+            celdas[i] = IMPACTOS.get(servidor.impactos[pos], 0) << 4 | TIPOS.get(servidor.tablero[pos], 0)
+        buf[CABECERA.size:CABECERA.size + len(celdas)] = celdas
+        buf[12] = ESTADOS.index(servidor.estado_actual)
+
+        struct.pack_into('<Q', buf, 0, secuencia + 2)
+
+    def leer(self):
+        """
+        Copia consistente del segmento (lado lector).
+
+        Returns:
+            Tuple: (secuencia, estado, bytes de celdas). Si no se logra una copia
+            consistente en ESPERA_LECTURA segundos, la última obtenida (None si
+            todavía no hubo ninguna).
+        """
+        buf = self._vista_solo_lectura()
+        limite = time.monotonic() + ESPERA_LECTURA
+        while True:
+            s1, _, _, estado = CABECERA.unpack_from(buf, 0)
+            if not s1 & 1:
+                celdas = bytes(buf[CABECERA.size:CABECERA.size + self.filas * self.columnas])
+                s2 = struct.unpack_from('<Q', buf, 0)[0]
+                if s1 == s2:
+                    self._ultima_copia = (s1, ESTADOS[estado], celdas)
+                    return self._ultima_copia
+            if time.monotonic() > limite:
+                # El escritor no terminó (¿murió a mitad de publicar?)
+                return self._ultima_copia
+            time.sleep(0)
+
+    def volcar_en(self, servidor):
+        """
+        Copia impactos y estado del segmento en una instancia local del servidor
+        (la que usa la GUI para dibujar).
+
+        Returns:
+            True si hubo cambios desde la última lectura.
+        """
+        copia = self.leer()
+        if copia is None or copia[0] == self._ultima_secuencia:
+            return False
+        secuencia, estado, celdas = copia
+        self._ultima_secuencia = secuencia
+        for pos, valor in zip(servidor.tablero, celdas):
+            servidor.impactos[pos] = IMPACTOS_INV[valor >> 4]
+        servidor.marcar_cambio()
+        servidor.estado_actual = estado
+        return True
+
+    def cerrar(self):
+        if self._vista_lectura is not None:
+            self._vista_lectura.release()
+            if self._mapa_lectura is not None:
+                self._mapa_lectura.close()
+            self._vista_lectura = self._mapa_lectura = None
+        self.shm.close()
+
+    def liberar(self):
+        """Cierra y elimina el segmento (solo el creador)."""
+        self.cerrar()
+        if self.creador:
+            self.shm.unlink()
+
+
+def _detener(signum, frame):
+    # Convertir SIGTERM en KeyboardInterrupt para que iniciar_servidor cierre ordenadamente
+    raise KeyboardInterrupt
+
+
+def ejecutar_servidor(nombre, host, port, flota):
+    """
+    Punto de entrada del proceso servidor.
+
+    Args:
+        nombre: nombre del segmento de memoria compartida (ya creado)
+        host, port: dirección de escucha
+        flota: mapa tipo -> posiciones colocadas desde la GUI
+    """
+    signal.signal(signal.SIGTERM, _detener)
+
+    servidor = NavalServerFSM()
+    servidor.host = host
+    servidor.port = port
+    for tipo, posiciones in flota.items():
+        if posiciones:
+            servidor.colocar_barco(tipo, posiciones)
+
+    tablero = TableroCompartido(nombre)
+    servidor.observadores.append(tablero.publicar)
+    tablero.publicar(servidor)
+    try:
+        servidor.iniciar_servidor()
+    finally:
+        tablero.cerrar()
@@ -0,0 +1,190 @@
+"""
+FSM Naval Battle - Perfilado en Caliente
+-----------------------------------
+Permite perfilar un servidor en producción sin reiniciarlo, durante una
+ventana de tiempo acotada:
+
+- 'determinista': `cProfile` sobre el hilo del servidor (accept/recv/
+  procesar_ataque/send). Se guarda en formato pstats (`.prof`), legible con
+  `python3 -m pstats` o snakeviz.
+- 'muestreo': un hilo toma muestras periódicas de la pila del hilo del
+  servidor (bajo costo). Se guarda en formato de pilas plegadas
+  (`.folded`), legible con flamegraph.pl o speedscope.
+
+Se controla desde el propio servidor con los mensajes
+`PROFILE:start[:modo[:segundos]]`, `PROFILE:stop` y `PROFILE:status`
+(solo desde localhost), o con la señal SIGUSR1 (ver `instalar_senal`).
+"""
+
+import os
+import sys
+import time
+import signal
+import cProfile
+import threading
+from collections import Counter
+
+MODOS = ('determinista', 'muestreo')
+
+
+class Perfilador:
+    """
+    Perfilador de ventana acotada para el hilo del servidor.
+
+    `iniciar` debe llamarse desde el hilo que se quiere perfilar (el bucle
+    del servidor, o el hilo del actor de la partida), y `revisar` después de
+    cada petición para cerrar la ventana del modo determinista cuando vence.
+    """
+
+    def __init__(self, directorio='.'):
+        self.directorio = directorio
+        self.modo = None
+        self.ruta = None
+        self.fin = None
+        self.ultima_ruta = None
+
+        self._perfil = None
+        self._hilo = None
+        self._hilo_perfilado = None
+        self._parar = threading.Event()
+
+    @property
+    def activo(self):
+        return self.modo is not None
+
+    def iniciar(self, modo='muestreo', segundos=30.0, intervalo=0.005):
+        """
+        Comienza a perfilar durante `segundos`.
+
+        Returns:
+            Tuple: (ok, ruta del archivo de salida o mensaje de error)
+        """
+        if self.activo:
+            return False, f"Perfilado ya activo ({self.modo})"
+        if modo not in MODOS:
+            return False, f"Modo inválido: {modo}"
+
+        marca = time.strftime('%Y%m%d-%H%M%S')
+        extension = 'prof' if modo == 'determinista' else 'folded'
+        self.ruta = os.path.join(self.directorio, f"perfil-{marca}-{os.getpid()}.{extension}")
+        self.modo = modo
+        self.fin = time.monotonic() + segundos
+        self._hilo_perfilado = threading.get_ident()
+
+        if modo == 'determinista':
+            self._perfil = cProfile.Profile()
+            self._perfil.enable()
+        else:
+            self._parar.clear()
+            self._hilo = threading.Thread(target=self._muestrear,
+                                          args=(threading.get_ident(), intervalo),
+                                          daemon=True)
+            self._hilo.start()
+        return True, self.ruta
+
+    def revisar(self, cerrar=False):
+        """
+        Cierra la ventana si ya venció (o enseguida, con cerrar=True). Solo actúa
+        desde el hilo perfilado: cProfile se desactiva en el hilo que lo activó.
+        """
+        if (self.activo and threading.get_ident() == self._hilo_perfilado
+                and (cerrar or time.monotonic() >= self.fin)):
+            self.detener()
+
+    def detener(self):
+        """
+        Detiene el perfilado y escribe el archivo de resultados.
+
+        Returns:
+            Ruta del archivo escrito, o None si no había perfilado activo.
+        """
+        if not self.activo:
+            return None
+        if self.modo == 'determinista':
+            self._perfil.disable()
+            self._perfil.dump_stats(self.ruta)
+            self._perfil = None
+        else:
+            self._parar.set()
+            if self._hilo is not threading.current_thread():
+                self._hilo.join()
+            self._hilo = None
+        self.ultima_ruta = self.ruta
+        self.modo = None
+        print(f"Perfil guardado en {self.ultima_ruta}")
+        return self.ultima_ruta
+
+    def _muestrear(self, hilo_id, intervalo):
+        """Hilo de muestreo: cuenta las pilas del hilo servidor en formato plegado."""
+        pilas = Counter()
+        while not self._parar.is_set() and time.monotonic() < self.fin:
+            frame = sys._current_frames().get(hilo_id)
+            if frame is None:
+                break
+            pila = []
+            while frame is not None:
+                codigo = frame.f_code
+                pila.append(f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}")
+                frame = frame.f_back
+            pilas[';'.join(reversed(pila))] += 1
+            time.sleep(intervalo)
+
+        with open(self.ruta, 'w') as f:
+            for pila, n in pilas.most_common():
+                f.write(f"{pila} {n}\n")
+
+        if not self._parar.is_set():
+            # La ventana venció sola
+            self._parar.set()
+            self.ultima_ruta = self.ruta
+            self.modo = None
+            print(f"Perfil guardado en {self.ultima_ruta}")
+
+    def estado(self):
+        """Descripción breve del estado para el mensaje PROFILE:status."""
+        if self.activo:
+            return f"{self.modo}:{max(0.0, self.fin - time.monotonic()):.1f}s:{self.ruta}"
+        return f"inactivo:{self.ultima_ruta or '-'}"
+
+
+def procesar_comando(perfilador, partes):
+    """
+    Aplica un comando PROFILE ya separado por ':' (ej: ['PROFILE', 'start', 'determinista']).
+
+    Returns:
+        Tuple: (código_respuesta, mensaje_detalle)
+    """
+    accion = partes[1].lower() if len(partes) > 1 else 'status'
+    if accion == 'start':
+        modo = partes[2] if len(partes) > 2 else 'muestreo'
+        try:
+            segundos = float(partes[3]) if len(partes) > 3 else 30.0
+        except ValueError:
+            return "400", "Duración inválida"
+        ok, detalle = perfilador.iniciar(modo, segundos)
+        return ("200", f"Perfilando:{detalle}") if ok else ("409", detalle)
+    if accion == 'stop':
+        ruta = perfilador.detener()
+        return ("200", f"Perfil_Guardado:{ruta}") if ruta else ("409", "Perfilado no activo")
+    if accion == 'status':
+        return "200", perfilador.estado()
+    return "400", "Comando de perfilado inválido"
+
+
+def instalar_senal(servidor, segundos=30.0, sig=None):
+    """
+    Instala un manejador de señal (SIGUSR1 por defecto) que alterna el
+    perfilado por muestreo del servidor. Solo desde el hilo principal.
+    """
+    sig = sig or signal.SIGUSR1
+
+    def manejador(signum, frame):
+        if servidor.perfilador is None:
+            servidor.perfilador = Perfilador()
+        if servidor.perfilador.activo:
+            servidor.perfilador.detener()
+        else:
+            ok, detalle = servidor.perfilador.iniciar('muestreo', segundos)
+            print(f"Perfilado por muestreo iniciado ({segundos}s): {detalle}")
+
+    signal.signal(sig, manejador)
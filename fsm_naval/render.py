@@ -0,0 +1,115 @@
+"""
+FSM Naval Battle - Dibujo Incremental del Tablero en Consola
+-----------------------------------
+`RenderTablero` guarda el texto ya armado de cada fila y solo vuelve a armar
+las filas marcadas como cambiadas desde el último dibujo. El cuadro completo
+se escribe con una sola llamada a write() (en vez de un print por celda).
+
+Modo en sitio (opcional, para monitorear en consola): el primer cuadro limpia
+la pantalla, dibuja el tablero arriba y limita el desplazamiento de la
+terminal a las líneas de debajo (región de desplazamiento, DECSTBM). Lo que
+se imprima después (ej: el registro de cada petición del servidor) se
+desplaza por debajo sin mover el tablero. Los cuadros siguientes guardan el
+cursor, reescriben en su línea absoluta solo las filas cambiadas y lo
+restauran. `terminar()` devuelve la región completa a la terminal.
+
+Uso (ver NavalServerFSM.mostrar_tablero / NavalClientFSM.mostrar_tablero):
+    render = RenderTablero(filas, columnas, celda, cabecera, pie)
+    render.marcar('B3')   # tras cambiar una celda (None = todo el tablero)
+    render.dibujar()
+"""
+
+import sys
+
+# Secuencias ANSI del modo en sitio
+_LIMPIAR = "\x1b[2J\x1b[H"        # Borrar la pantalla y llevar el cursor al inicio
+_REGION = "\x1b[{}r"              # Desplazar solo desde la línea indicada hasta el final
+_REGION_COMPLETA = "\x1b[r"       # Desplazar toda la pantalla
+_IR = "\x1b[{};1H"                # Cursor al inicio de una línea (1 = primera)
+_BORRAR_LINEA = "\x1b[2K"
+_GUARDAR = "\x1b7"
+_RESTAURAR = "\x1b8"
+
+
+class RenderTablero:
+    """
+    Dibujo de un tablero por filas, con caché de filas y escritura única.
+
+    Args:
+        filas: etiquetas de las filas (ej: ['A', 'B', ...])
+        columnas: etiquetas de las columnas (ej: ['1', '2', ...])
+        celda: función posición -> texto de la celda (ej: 'B3' -> ' X ')
+        cabecera: líneas fijas antes de las filas (título, números de columna, borde)
+        pie: líneas fijas después de las filas (borde, leyenda)
+        en_sitio: fijar el tablero arriba de la pantalla y actualizarlo con ANSI
+        salida: archivo de salida (por defecto, sys.stdout en el momento de dibujar)
+    """
+
+    def __init__(self, filas, columnas, celda, cabecera, pie, en_sitio=False, salida=None):
+        self.filas = list(filas)
+        self.columnas = list(columnas)
+        self.celda = celda
+        self.cabecera = list(cabecera)
+        self.pie = list(pie)
+        self.en_sitio = en_sitio
+        self.salida = salida
+
+        self._indice_fila = {f: i for i, f in enumerate(self.filas)}
+        self._texto_filas = [None] * len(self.filas)
+        self._sucias = set(range(len(self.filas)))
+        self._fijado = 0  # Líneas del tablero fijado arriba (modo en sitio; 0 = no fijado)
+
+        # Estadísticas
+        self.filas_armadas = 0
+
+    def marcar(self, pos=None):
+        """Marca como cambiada la fila de `pos` (o todas, si pos es None)."""
+        if pos is None:
+            self._sucias.update(range(len(self.filas)))
+            return
+        i = self._indice_fila.get(pos.rstrip('0123456789'))
+        if i is not None:
+            self._sucias.add(i)
+
+    def _armar_fila(self, i):
+        fila = self.filas[i]
+        celda = self.celda
+        self.filas_armadas += 1
+        return f"{fila}│" + "".join([celda(f"{fila}{col}") for col in self.columnas]) + "│"
+
+    def dibujar(self):
+        """Escribe el tablero, rearmando solo las filas cambiadas."""
+        sucias = self._sucias
+        for i in sucias:
+            self._texto_filas[i] = self._armar_fila(i)
+
+        lineas = self.cabecera + self._texto_filas + self.pie
+        if not self.en_sitio:
+            texto = "\n".join(lineas) + "\n"
+        elif self._fijado == len(lineas):
+            # Tablero ya fijado: reescribir solo las filas cambiadas y volver al cursor
+            inicio = len(self.cabecera) + 1
+            texto = (_GUARDAR
+                     + "".join(_IR.format(inicio + i) + _BORRAR_LINEA + self._texto_filas[i]
+                               for i in sorted(sucias))
+                     + _RESTAURAR)
+        else:
+            # Primer cuadro (o cambió el alto): fijar el tablero arriba y dejar
+            # que el resto de la salida se desplace por debajo
+            n = len(lineas)
+            texto = (_LIMPIAR + "\n".join(lineas) + "\n"
+                     + _REGION.format(n + 1) + _IR.format(n + 1))
+            self._fijado = n
+        sucias.clear()
+        self._escribir(texto)
+
+    def terminar(self):
+        """Devuelve la región de desplazamiento completa (modo en sitio), sin mover el cursor."""
+        if self._fijado:
+            self._fijado = 0
+            self._escribir(_GUARDAR + _REGION_COMPLETA + _RESTAURAR)
+
+    def _escribir(self, texto):
+        salida = self.salida or sys.stdout
+        salida.write(texto)
+        salida.flush()
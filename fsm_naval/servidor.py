@@ -0,0 +1,675 @@
+"""
+FSM Naval Battle - Servidor de Defensa
+-----------------------------------
+Este programa implementa un servidor que maneja un autómata finito determinista (DFA)
+para representar un sistema de defensa naval simplificado en una cuadrícula 2x2.
+
+Autómata Finito para el Servidor:
+--------------------------------
+Q = {q0, q1, q2} : {Inicio, Flota_Intacta, Hundido}
+Σ = {A1, A2, B1, B2} (Coordenadas de la cuadrícula 2x2)
+q₀ = q0 (Inicio)
+F = {q2} (Hundido - Estado de aceptación)
+δ = Función de transición (depende de la ubicación del barco)
+"""
+
+import os
+import socket
+import time
+from collections import OrderedDict
+
+from .transporte import TransporteTCP, crear_transporte, codificar_datagrama, decodificar_datagrama
+from .render import RenderTablero
+
+def _nuevo_token():
+    # Equivale a secrets.token_hex(8) sin el costo de importar `secrets` al arrancar
+    return os.urandom(8).hex()
+
+class NavalServerFSM:
+    """
+    Implementación de la Máquina de Estados Finitos para el servidor de defensa naval.
+    """
+    # Estados del autómata
+    INICIO = 'q0'        # Estado inicial (colocación de flota)
+    FLOTA_INTACTA = 'q1' # Flota colocada, sin impactos
+    HUNDIDO = 'q2'       # Barco hundido (estado final/aceptación)
+    
+    def __init__(self):
+        # Estado actual del autómata
+        self.estado_actual = self.INICIO
+        
+        # Tamaño del tablero (2x2, 5x5)
+        self.filas = 5
+        self.columnas = 5
+
+        # Tablero de juego (representado como diccionario para facilitar acceso)
+        # Valores posibles en tablero (tipo interno): None (agua), 'D' (Destroyer), 'S' (Submarino), 'L' (Acorazado)
+        self.tablero = {
+            'A1': None, 'A2': None, 'A3': None, 'A4': None, 'A5': None,
+            'B1': None, 'B2': None, 'B3': None, 'B4': None, 'B5': None,
+            'C1': None, 'C2': None, 'C3': None, 'C4': None, 'C5': None,
+            'D1': None, 'D2': None, 'D3': None, 'D4': None, 'D5': None,
+            'E1': None, 'E2': None, 'E3': None, 'E4': None, 'E5': None
+        }
+
+        # Estado de impactos (para seguimiento visual)
+        # Valores: '~' (sin atacar), 'O' (fallo/agua), 'X' (impacto)
+        self.impactos = {
+            'A1': '~', 'A2': '~', 'A3': '~', 'A4': '~', 'A5': '~',
+            'B1': '~', 'B2': '~', 'B3': '~', 'B4': '~', 'B5': '~',
+            'C1': '~', 'C2': '~', 'C3': '~', 'C4': '~', 'C5': '~',
+            'D1': '~', 'D2': '~', 'D3': '~', 'D4': '~', 'D5': '~',
+            'E1': '~', 'E2': '~', 'E3': '~', 'E4': '~', 'E5': '~'
+        }
+
+        # Historial de ataques (para evitar ataques repetidos)
+        self.ataques_recibidos = set()
+
+        # Secuencia ordenada de disparos de la partida en curso (para el archivo)
+        self.secuencia_ataques = []
+
+        # Token de sesión de la partida: permite al cliente saber, al reconectar,
+        # si sigue en la misma partida (se renueva en limpiar_flota)
+        self.token_sesion = _nuevo_token()
+
+        # Versión de la vista del atacante: aumenta con cada ataque registrado.
+        # Junto con el token permite al cliente validar su caché de resultados.
+        self.version_tablero = 0
+
+        # Archivo de partidas terminadas (ver archivo.ArchivoPartidas); None = no archivar
+        self.archivo = None
+        self._partida_archivada = False
+
+        # Funciones llamadas con el servidor tras cada ataque procesado
+        # (ej: publicar el tablero en memoria compartida, ver memoria.py)
+        self.observadores = []
+
+        # Actor de la partida (ver actores.py); None = procesar en el hilo del bucle.
+        # Con actor, los mensajes y las ediciones de otros hilos (GUI) se aplican de a uno.
+        self.actor = None
+
+        # Perfilado en caliente (ver perfilado.py); se crea con el primer PROFILE
+        self.perfilador = None
+
+        # Dibujo del tablero en consola (ver render.py): se crea con el primer
+        # mostrar_tablero y solo rearma las filas marcadas con marcar_cambio.
+        # En sitio = tablero fijo arriba de la consola, el registro pasa por debajo.
+        self.render = None
+        self.mostrar_en_sitio = False
+
+        # Estructura para manejar barcos multi-celda
+        # ships -> mapa tipo -> conjunto de posiciones (ej: 'S': {'B1','B2'})
+        self.ships = {
+            'D': set(),  # Destroyer (1 celda)
+            'S': set(),  # Submarino (2 celdas)
+            'L': set()   # Acorazado (3 celdas)
+        }
+
+        # Conjunto de todas las celdas ocupadas por cualquier barco
+        self.ship_cells = set()
+
+        # Socket del servidor
+        self.server_socket = None
+        self.host = '' ##'localhost'  # Para propósitos educativos, usar localhost
+        self.port = 5000         # Puerto por defecto
+
+        # Transporte (ver transporte.py); None = TCP en host:port
+        self.transporte = None
+
+        # Control de admisión (ver admision.py); None = sin límites de ritmo
+        self.admision = None
+        # Conexiones pendientes de aceptar como máximo (el resto las rechaza el sistema)
+        # y segundos que se espera el mensaje de un cliente antes de descartarlo
+        self.max_pendientes = 8
+        self.timeout_cliente = 2.0
+
+        # Modo UDP: respuestas ya enviadas por (cliente, partida, secuencia), para
+        # contestar las retransmisiones sin volver a procesar el ataque
+        self.max_respuestas_udp = 4096
+
+    # Nota: no colocar flota por defecto aquí. La GUI podrá colocar barcos manualmente.
+    
+    def colocar_flota(self, posicion_destroyer):
+        """
+        Coloca un barco (Destroyer) en el tablero.
+        
+        Args:
+            posicion_destroyer: Posición del Destroyer (ej: 'A1')
+        """
+        # Validar posición
+        if posicion_destroyer not in self.tablero:
+            print(f"Posición {posicion_destroyer} inválida.")
+            return False
+
+        # Colocar el Destroyer (1 celda)
+        self.tablero[posicion_destroyer] = 'D'
+        self.ships['D'].add(posicion_destroyer)
+        self.ship_cells.add(posicion_destroyer)
+        self.marcar_cambio(posicion_destroyer)
+
+        # Cambiar estado a FLOTA_INTACTA
+        self.estado_actual = self.FLOTA_INTACTA
+        print(f"Destroyer colocado en {posicion_destroyer}")
+        return True
+
+    def _colocar_barcos_defecto(self):
+        """
+        Coloca por defecto un Submarino (2 celdas) y un Acorazado (3 celdas).
+        Las posiciones elegidas son didácticas y fijas: Submarino en B1-B2, Acorazado en C1-C3.
+        """
+        # Submarino (2 casillas)
+        subs = ['B1', 'B2']
+        for p in subs:
+            if p in self.tablero:
+                self.tablero[p] = 'S'
+                self.ships['S'].add(p)
+                self.ship_cells.add(p)
+
+        # Acorazado (3 casillas)
+        acor = ['C1', 'C2', 'C3']
+        for p in acor:
+            if p in self.tablero:
+                self.tablero[p] = 'L'
+                self.ships['L'].add(p)
+                self.ship_cells.add(p)
+
+        self.marcar_cambio()
+        if self.ship_cells:
+            self.estado_actual = self.FLOTA_INTACTA
+            print(f"Flota por defecto colocada: Submarino {subs}, Acorazado {acor}")
+
+    def archivar_partida(self):
+        """
+        Guarda la partida en curso en el archivo de partidas, si hay uno configurado.
+
+        Returns:
+            True si la partida se archivó, False si no había nada que archivar.
+        """
+        if self.archivo is None or self._partida_archivada or not self.secuencia_ataques:
+            return False
+        try:
+            self.archivo.agregar(self)
+        except OSError as e:
+            print(f"No se pudo archivar la partida: {e}")
+            return False
+        self._partida_archivada = True
+        return True
+
+    def limpiar_flota(self):
+        """Quita todos los barcos del tablero y resetea impactos/estado."""
+        # Guardar la partida antes de perderla
+        self.archivar_partida()
+        self.secuencia_ataques = []
+        self._partida_archivada = False
+        self.token_sesion = _nuevo_token()
+        self.version_tablero = 0
+
+        # Limpiar todas las celdas (también las de barcos ya impactados,
+        # que ya no están en ship_cells)
+        for pos in self.tablero:
+            self.tablero[pos] = None
+        # Reset estructuras
+        for k in self.ships:
+            self.ships[k].clear()
+        self.ship_cells.clear()
+        self.ataques_recibidos.clear()
+
+        # Reset impactos
+        for k in self.impactos:
+            self.impactos[k] = '~'
+
+        self.marcar_cambio()
+        self.estado_actual = self.INICIO
+
+    def quitar_barco(self, tipo):
+        """Quita del tablero el barco de un tipo, sin tocar el resto de la flota.
+
+        Returns:
+            True si había un barco de ese tipo.
+        """
+        celdas = [p for p, v in self.tablero.items() if v == tipo]
+        for p in celdas:
+            self.tablero[p] = None
+            self.ship_cells.discard(p)
+            self.marcar_cambio(p)
+        if tipo in self.ships:
+            self.ships[tipo].clear()
+        if not self.ship_cells and self.estado_actual == self.FLOTA_INTACTA:
+            self.estado_actual = self.INICIO
+        return bool(celdas)
+
+    def colocar_barco(self, tipo, posiciones):
+        """Coloca un barco de tipo dado en las posiciones listadas.
+
+        Args:
+            tipo: 'D', 'S' o 'L'
+            posiciones: lista/iterable de posiciones (ej: ['B1','B2'])
+
+        Returns:
+            True si se colocó correctamente, False si hay conflicto o posición inválida.
+        """
+        # Validar tipo
+        if tipo not in ('D', 'S', 'L'):
+            print(f"Tipo de barco inválido: {tipo}")
+            return False
+
+        # Validar posiciones
+        pos_list = list(posiciones)
+        for p in pos_list:
+            if p not in self.tablero:
+                print(f"Posición inválida: {p}")
+                return False
+            if self.tablero[p] is not None:
+                print(f"Posición ocupada: {p}")
+                return False
+
+        # Colocar
+        for p in pos_list:
+            self.tablero[p] = tipo
+            self.ships[tipo].add(p)
+            self.ship_cells.add(p)
+            self.marcar_cambio(p)
+
+        # Actualizar estado
+        if self.ship_cells:
+            self.estado_actual = self.FLOTA_INTACTA
+        return True
+    
+    def marcar_cambio(self, pos=None):
+        """Avisa al dibujo de consola que cambió una celda (None = todo el tablero)."""
+        if self.render is not None:
+            self.render.marcar(pos)
+
+    def _celda_defensa(self, pos):
+        """Texto de una celda del tablero de defensa (3 caracteres)."""
+        if self.impactos[pos] == 'X':
+            return ' X '
+        if self.impactos[pos] == 'O':
+            return ' O '
+        # Mostrar tipo de barco si existe
+        tipo = self.tablero[pos]
+        if tipo == 'D':
+            return ' D '
+        if tipo == 'S':
+            return 'SS '
+        if tipo == 'L':
+            return 'LLL'
+        return ' ~ '
+
+    def mostrar_tablero(self):
+        """
+        Muestra el tablero actual del juego (solo rearma las filas que cambiaron).
+        """
+        if self.render is None:
+            # Usaremos ancho de columna fijo para mostrar etiquetas más largas (ej: 'SS','LLL')
+            filas = [chr(ord('A') + i) for i in range(self.filas)]
+            cols = [str(j + 1) for j in range(self.columnas)]
+            self.render = RenderTablero(
+                filas, cols, self._celda_defensa,
+                cabecera=["", f"Tablero de defensa ({self.filas}x{self.columnas}):",
+                          "  " + "".join(f" {c} " for c in cols),
+                          " ┌────────────────────────────┐"],
+                pie=[" └────────────────────────────┘",
+                     " D: Destroyer, SS: Submarino (2), LLL: Acorazado (3), ~: Agua, O: Fallo, X: Impacto"])
+        self.render.en_sitio = self.mostrar_en_sitio
+        self.render.dibujar()
+        
+    def procesar_ataque(self, coordenada):
+        """
+        Procesa un ataque recibido y aplica la función de transición del autómata.
+        
+        Args:
+            coordenada: Coordenada del ataque (ej: 'A1')
+            
+        Returns:
+            Tuple: (código_respuesta, mensaje_detalle)
+        """
+        # Validar coordenada
+        if coordenada not in self.tablero:
+            return "404", "Coordenada inválida"
+        
+        # Verificar ataque repetido
+        if coordenada in self.ataques_recibidos:
+            return "409", "Atacado_Previamente"
+        
+        # Sin flota el disparo no se registra: la vista del atacante no cambia
+        if self.estado_actual == self.INICIO:
+            return "400", "Flota_No_Colocada"
+
+        # Registrar el ataque. La versión cuenta los disparos registrados, que son
+        # justo las celdas atacadas que ve el cliente en la respuesta a STATE.
+        self.ataques_recibidos.add(coordenada)
+        self.version_tablero += 1
+        self.marcar_cambio(coordenada)
+        
+        # Función de transición δ según el estado actual y la entrada
+        if self.estado_actual == self.FLOTA_INTACTA:
+            self.secuencia_ataques.append(coordenada)
+            # Verificar si impactó alguna parte de la flota
+            if coordenada in self.ship_cells:
+                # Marcar impacto
+                self.impactos[coordenada] = 'X'
+                # Remover la celda ocupada
+                self.ship_cells.discard(coordenada)
+                # También quitar de la estructura de ships
+                for t, sset in self.ships.items():
+                    if coordenada in sset:
+                        sset.discard(coordenada)
+                        break
+
+                # Si ya no quedan casillas con barcos, toda la flota está hundida
+                if not self.ship_cells:
+                    self.estado_actual = self.HUNDIDO
+                    self.archivar_partida()
+                    return "200", "Hundido"
+                else:
+                    return "200", "Impacto"
+            else:
+                self.impactos[coordenada] = 'O'  # Marcar fallo (agua)
+                return "404", "Fallido"
+
+        elif self.estado_actual == self.HUNDIDO:
+            # Ya no hay barcos para hundir
+            self.impactos[coordenada] = 'O'  # Marcar como agua
+            return "404", "Flota_Ya_Hundida"
+        
+        # Estado no reconocido (no debería ocurrir, pero por completitud)
+        return "500", "Error en el estado del autómata"
+    
+    def estado_sesion(self):
+        """
+        Vista del atacante del tablero completo, para resincronizar un cliente
+        en un solo viaje de ida y vuelta (petición STATE).
+
+        Cada celda se codifica con 2 bits, en orden por filas:
+            0 = sin atacar, 1 = fallo, 2 = impacto, 3 = impacto en barco hundido
+        Las posiciones de barcos no atacadas no se revelan.
+
+        Returns:
+            Tuple: (código_respuesta, "token:versión:estado:filas:columnas:bitmap_hex")
+        """
+        # Un tipo de barco está hundido si tenía celdas y ya no le queda ninguna
+        hundidos = {t for t, sset in self.ships.items()
+                    if not sset and any(v == t for v in self.tablero.values())}
+
+        bitmap = 0
+        for i, pos in enumerate(self.tablero):
+            if self.impactos[pos] == 'X':
+                valor = 3 if self.tablero[pos] in hundidos else 2
+            elif self.impactos[pos] == 'O':
+                valor = 1
+            else:
+                valor = 0
+            bitmap |= valor << (2 * i)
+
+        n_bytes = (2 * len(self.tablero) + 7) // 8
+        datos = bitmap.to_bytes(n_bytes, 'little').hex()
+        return "200", (f"{self.token_sesion}:{self.version_tablero}:{self.estado_actual}:"
+                       f"{self.filas}:{self.columnas}:{datos}")
+
+    def procesar_perfilado(self, partes):
+        """
+        Comando de control del perfilado en caliente:
+            PROFILE:start[:modo[:segundos]]   modo = muestreo | determinista
+            PROFILE:stop
+            PROFILE:status
+
+        Returns:
+            Tuple: (código_respuesta, mensaje_detalle)
+        """
+        from .perfilado import Perfilador, procesar_comando
+        if self.perfilador is None:
+            self.perfilador = Perfilador()
+        return procesar_comando(self.perfilador, partes)
+
+    def procesar_mensaje(self, mensaje, origen=None):
+        """
+        Despacha un mensaje recibido: petición de estado, comando de perfilado
+        o coordenada de ataque.
+
+        La petición de estado puede llevar el token y la versión que conoce el
+        cliente ("STATE:token:versión"); si coinciden se responde 304 sin datos.
+        Los comandos PROFILE solo se aceptan desde la misma máquina.
+
+        La respuesta a un ataque termina con el token y la versión del tablero
+        ("200:Impacto:token:versión"): así el cliente detecta que la partida se
+        reinició (token nuevo) sin pedir STATE.
+
+        Con control de admisión, los mensajes de clientes remotos que superen
+        su ritmo reciben 429/503 sin procesarse.
+
+        Args:
+            mensaje: texto recibido
+            origen: dirección del cliente (None para llamadas locales)
+
+        Returns:
+            Tuple: (código_respuesta, mensaje_detalle)
+        """
+        partes = mensaje.split(':')
+        if partes[0].upper() == 'PROFILE':
+            # Unix y memoria son siempre locales; en TCP solo se acepta loopback
+            if isinstance(origen, tuple) and origen[0] not in ('127.0.0.1', '::1'):
+                return "403", "Prohibido"
+            return self.procesar_perfilado(partes)
+        if self.admision is not None and origen is not None:
+            rechazo = self.admision.admitir(origen, self.token_sesion)
+            if rechazo:
+                return rechazo
+        if partes[0].upper() == 'STATE':
+            if len(partes) == 3 and partes[1] == self.token_sesion and partes[2] == str(self.version_tablero):
+                return "304", "Sin_Cambios"
+            return self.estado_sesion()
+        codigo, detalle = self.procesar_ataque(mensaje)
+        return codigo, f"{detalle}:{self.token_sesion}:{self.version_tablero}"
+
+    def detener_servidor(self):
+        """
+        Cierra el socket de escucha. Se puede llamar desde otro hilo (ej: la GUI):
+        el shutdown() desbloquea el accept() pendiente también en sockets Unix.
+        """
+        if self.server_socket:
+            try:
+                self.server_socket.shutdown(socket.SHUT_RDWR)
+            except (OSError, AttributeError):
+                pass
+            self.server_socket.close()
+
+    def iniciar_servidor(self):
+        """
+        Inicia el servidor para escuchar ataques.
+        """
+        transporte = self.transporte or TransporteTCP(self.host, self.port)
+        self.server_socket = None
+        
+        try:
+            # Crear el socket del servidor y escuchar conexiones
+            # Cola de conexiones pendientes acotada: ante una avalancha el sistema
+            # rechaza las que sobran en vez de acumular latencia
+            self.server_socket = transporte.escuchar(self.max_pendientes)
+            if isinstance(transporte, TransporteTCP):
+                self.port = transporte.port
+            
+            print(f"\n╔══════════════════════════════════════════╗")
+            print(f"║ [ SERVIDOR DE DEFENSA - FSM ]             ║")
+            print(f"╚══════════════════════════════════════════╝")
+            print(f"Escuchando en {transporte}...")
+            
+            # Mostrar estado inicial del tablero
+            self.mostrar_tablero()
+            
+            while True:
+                # Aceptar conexión del cliente
+                client_socket, client_address = self.server_socket.accept()
+                print(f"\nConexión establecida con {client_address}")
+                
+                try:
+                    # Un cliente lento no puede retener el bucle (atiende de a uno)
+                    client_socket.settimeout(self.timeout_cliente)
+
+                    # Recibir ataque
+                    data = client_socket.recv(1024).decode().strip()
+                    print(f"Ataque recibido: {data}")
+                    
+                    # Procesar el ataque (o la petición de estado) a través del FSM,
+                    # en el turno de la partida si hay actor. PROFILE se atiende en
+                    # este hilo: el perfilador se inicia y se detiene (revisar) aquí
+                    # y mide el bucle de red (accept, recv, sendall).
+                    if self.actor is not None and data.split(':')[0].upper() != 'PROFILE':
+                        codigo, respuesta = self.actor.enviar(data, client_address).result()
+                    else:
+                        codigo, respuesta = self.procesar_mensaje(data, client_address)
+                    
+                    # Enviar respuesta
+                    client_socket.sendall(f"{codigo}:{respuesta}".encode())
+                    print(f"Respuesta enviada: {codigo}:{respuesta}")
+                    if codigo in ("429", "503"):
+                        # Mensaje rechazado: no cambió nada, no redibujar
+                        continue
+
+                    # Avisar a los observadores del cambio de estado (el actor ya lo hizo)
+                    if self.actor is None:
+                        for observador in self.observadores:
+                            observador(self)
+                    
+                    # Mostrar el tablero actualizado
+                    self.mostrar_tablero()
+                    
+                    # Si el barco está hundido, mostrar mensaje de fin
+                    if self.estado_actual == self.HUNDIDO:
+                        print("\n¡El Destroyer ha sido hundido! Toda la flota destruida.")
+                    
+                except Exception as e:
+                    print(f"Error al procesar la solicitud: {e}")
+                
+                finally:
+                    # Cerrar la conexión con el cliente
+                    client_socket.close()
+                    # Cerrar la ventana de perfilado si ya venció
+                    if self.perfilador:
+                        self.perfilador.revisar()
+        
+        except KeyboardInterrupt:
+            print("\nServidor detenido por el usuario.")
+        except Exception as e:
+            print(f"Error en el servidor: {e}")
+        finally:
+            if self.server_socket:
+                self.server_socket.close()
+            if self.perfilador:
+                self.perfilador.detener()
+            # No perder la partida en curso al cerrar
+            self.archivar_partida()
+            if self.render:
+                self.render.terminar()
+            print("Servidor cerrado.")
+
+    def iniciar_servidor_udp(self):
+        """
+        Inicia el servidor en modo UDP: un datagrama por ataque, sin conexión.
+
+        Cada datagrama lleva "partida|secuencia|coordenada". Las retransmisiones
+        del cliente (misma secuencia) reciben la misma respuesta guardada en vez
+        de un 409, porque ataques_recibidos ya contiene la coordenada. Un id de
+        partida distinto del token actual recibe 410 (el cliente debe pedir STATE).
+        """
+        self.server_socket = None
+        respuestas = OrderedDict()
+        try:
+            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.server_socket.bind((self.host, self.port))
+            self.port = self.server_socket.getsockname()[1]
+            print(f"Escuchando datagramas UDP en {self.host}:{self.port}...")
+            self.mostrar_tablero()
+
+            while True:
+                datos, direccion = self.server_socket.recvfrom(2048)
+                try:
+                    partida, secuencia, carga = decodificar_datagrama(datos)
+                except ValueError:
+                    continue
+
+                clave = (direccion, partida, secuencia)
+                salida = respuestas.get(clave)
+                if salida is None:
+                    es_control = carga.split(':')[0].upper() in ('STATE', 'PROFILE')
+                    if not es_control and partida not in ('-', self.token_sesion):
+                        codigo, respuesta = "410", "Partida_Desconocida"
+                    else:
+                        codigo, respuesta = self.procesar_mensaje(carga, direccion)
+                    salida = codificar_datagrama(self.token_sesion, secuencia, f"{codigo}:{respuesta}")
+                    # Los rechazos por ritmo no se guardan: el reintento sí debe procesarse
+                    if codigo not in ("429", "503"):
+                        respuestas[clave] = salida
+                        if len(respuestas) > self.max_respuestas_udp:
+                            respuestas.popitem(last=False)
+
+                    for observador in self.observadores:
+                        observador(self)
+                    if codigo == "200" and respuesta.startswith("Hundido:"):
+                        print("\n¡Toda la flota ha sido hundida!")
+                self.server_socket.sendto(salida, direccion)
+
+                if self.perfilador:
+                    self.perfilador.revisar()
+
+        except KeyboardInterrupt:
+            print("\nServidor detenido por el usuario.")
+        except Exception as e:
+            print(f"Error en el servidor: {e}")
+        finally:
+            if self.server_socket:
+                self.server_socket.close()
+            if self.perfilador:
+                self.perfilador.detener()
+            self.archivar_partida()
+            if self.render:
+                self.render.terminar()
+            print("Servidor cerrado.")
+
+def main():
+    """
+    Función principal para iniciar el servidor FSM.
+    """
+    servidor = NavalServerFSM()
+
+    # Transporte opcional (ej: FSM_TRANSPORTE=unix:///tmp/flota.sock)
+    url_transporte = os.environ.get('FSM_TRANSPORTE')
+    if url_transporte:
+        servidor.transporte = crear_transporte(url_transporte)
+
+    # Archivo de partidas opcional (ej: FSM_ARCHIVO_PARTIDAS=partidas)
+    base_archivo = os.environ.get('FSM_ARCHIVO_PARTIDAS')
+    if base_archivo:
+        from .archivo import ArchivoPartidas
+        servidor.archivo = ArchivoPartidas(base_archivo)
+        print(f"Archivando partidas en {base_archivo}.dat / {base_archivo}.idx")
+
+    # Límites de ritmo por cliente, por partida y global (FSM_SIN_LIMITES=1 los desactiva)
+    if os.environ.get('FSM_SIN_LIMITES') != '1':
+        from .admision import ControlAdmision
+        servidor.admision = ControlAdmision()
+
+    # Perfilado en caliente: `kill -USR1 <pid>` activa/desactiva el muestreo
+    if os.name == 'posix':
+        from .perfilado import instalar_senal
+        instalar_senal(servidor)
+    
+    # Configuración inicial
+    print("╔══════════════════════════════════════════╗")
+    print("║ [ SERVIDOR DE DEFENSA - FSM ]             ║")
+    print("╚══════════════════════════════════════════╝")
+    print("🛠 Configuración inicial:")
+    
+    # Para este ejemplo didáctico, seleccionamos una posición fija
+    # En una implementación completa, se pediría al usuario que la ingrese
+    
+    
+    # Iniciar servidor para recibir ataques (FSM_UDP=1: modo datagrama)
+    if os.environ.get('FSM_UDP') == '1':
+        servidor.iniciar_servidor_udp()
+    else:
+        servidor.iniciar_servidor()
+    
+
+if __name__ == "__main__":
+    main()
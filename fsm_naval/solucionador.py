@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+FSM Naval Battle - Solucionador Minimax
+-----------------------------------
+Calcula de forma exacta el número de disparos que necesita el mejor atacante
+posible en el peor caso para hundir toda la flota, con la información que da
+el servidor: Fallido, Impacto o Hundido (toda la flota).
+
+Estado de información del atacante: máscara de impactos H y de fallos M.
+Las flotas consistentes son las uniones de celdas de barcos F (sin
+solapamientos) con H ⊆ F, F ∩ M = ∅ y F ≠ H.
+
+Técnicas:
+- Tabla de transposición por (H, M) en forma canónica bajo las simetrías del
+  tablero (8 si es cuadrado, 4 si no).
+- Jugadas forzadas: las celdas presentes en todas las flotas consistentes se
+  disparan sin ramificar; las celdas que no están en ninguna se descartan.
+- Celdas equivalentes (misma partición de las flotas) se prueban una sola vez.
+- Cota superior: disparar a todas las celdas aún posibles.
+- Poda con cotas inferiores: el mínimo de celdas por impactar, ceil(log2(|S|+1)) (cada
+  disparo cierra a lo sumo una flota y deja dos ramas abiertas) y una cota de
+  adversario: fijado el resto de la flota R, el defensor puede responder
+  Fallido mientras quede una posición libre del barco escondido, así que hacen
+  falta |R \ H| + (posiciones disjuntas del barco) + (largo - 1) disparos.
+
+Uso:
+    python3 -m fsm_naval.solucionador                       # 5x5, flota D, S, L
+    python3 -m fsm_naval.solucionador --filas 6 --columnas 6 --tabla tt.pkl
+"""
+
+import os
+import sys
+import time
+import pickle
+import argparse
+
+# Flota por defecto (como _colocar_barcos_defecto + Destroyer): tipo -> longitud
+FLOTA_DEFECTO = {'D': 1, 'S': 2, 'L': 3}
+
+
+def _popcount(x):
+    return bin(x).count('1')
+
+
+def colocaciones(filas, columnas, largo):
+    """Máscaras de todas las posiciones posibles de un barco de `largo` celdas."""
+    res = set()
+    for f in range(filas):
+        for c in range(columnas):
+            if c + largo <= columnas:
+                res.add(sum(1 << (f * columnas + c + k) for k in range(largo)))
+            if f + largo <= filas:
+                res.add(sum(1 << ((f + k) * columnas + c) for k in range(largo)))
+    return sorted(res)
+
+
+def flotas(filas, columnas, largos):
+    """Uniones de celdas de todas las colocaciones sin solapamientos de la flota."""
+    actuales = {0}
+    for largo in sorted(largos, reverse=True):
+        opciones = colocaciones(filas, columnas, largo)
+        actuales = {f | p for f in actuales for p in opciones if not f & p}
+    return sorted(actuales)
+
+
+def _simetrias(filas, columnas):
+    """Permutaciones de celdas del grupo de simetrías del tablero."""
+    def celda(f, c):
+        return f * columnas + c
+
+    transformaciones = [
+        lambda f, c: (f, c),
+        lambda f, c: (f, columnas - 1 - c),
+        lambda f, c: (filas - 1 - f, c),
+        lambda f, c: (filas - 1 - f, columnas - 1 - c),
+    ]
+    if filas == columnas:
+        transformaciones += [
+            lambda f, c: (c, f),
+            lambda f, c: (c, filas - 1 - f),
+            lambda f, c: (columnas - 1 - c, f),
+            lambda f, c: (columnas - 1 - c, filas - 1 - f),
+        ]
+    return [[celda(*t(f, c)) for f in range(filas) for c in range(columnas)] for t in transformaciones]
+
+
+class Solucionador:
+    """
+    Solucionador minimax del peor caso de disparos hasta hundir la flota.
+
+    Args:
+        filas, columnas: tamaño del tablero
+        flota: mapa tipo -> longitud (por defecto D=1, S=2, L=3)
+        progreso: función llamada con un dict de estadísticas cada `cada` nodos
+        cada: nodos entre reportes de progreso
+    """
+
+    def __init__(self, filas=5, columnas=5, flota=None, progreso=None, cada=100000):
+        self.filas = filas
+        self.columnas = columnas
+        self.flota = dict(flota or FLOTA_DEFECTO)
+        self.celdas = filas * columnas
+        self.tamano_flota = sum(self.flota.values())
+        self.flotas = flotas(filas, columnas, self.flota.values())
+
+        # Para la cota de adversario: por cada barco, sus posiciones y las flotas sin él
+        self.escondidos = [
+            (largo, colocaciones(filas, columnas, largo),
+             flotas(filas, columnas, [l for t, l in self.flota.items() if t != tipo]))
+            for tipo, largo in sorted(self.flota.items(), key=lambda tl: tl[1])
+        ]
+
+        self.tabla = {}  # clave canónica (H, M) -> (exacto, valor)
+        self.nodos = 0
+        self.progreso = progreso
+        self.cada = cada
+        self._inicio = None
+
+        # Guardado periódico (para poder reanudar corridas largas)
+        self.ruta_tabla = None
+        self.intervalo_guardado = 60.0
+        self._ultimo_guardado = 0.0
+
+        # Tablas de traducción por byte para aplicar cada simetría a una máscara
+        self._tablas_simetria = []
+        for perm in _simetrias(filas, columnas)[1:]:
+            por_byte = []
+            for base in range(0, self.celdas, 8):
+                tabla = []
+                for b in range(256):
+                    m = 0
+                    for k in range(8):
+                        if b >> k & 1 and base + k < self.celdas:
+                            m |= 1 << perm[base + k]
+                    tabla.append(m)
+                por_byte.append(tabla)
+            self._tablas_simetria.append(por_byte)
+
+    # ------------------------------------------------------------------
+    # Tabla de transposición
+    # ------------------------------------------------------------------
+    def _transformar(self, mascara, por_byte):
+        m = 0
+        for tabla in por_byte:
+            m |= tabla[mascara & 0xFF]
+            mascara >>= 8
+        return m
+
+    def _canonica(self, h, m):
+        """Representante mínimo de (H, M) bajo las simetrías del tablero."""
+        mejor = (h, m)
+        for por_byte in self._tablas_simetria:
+            cand = (self._transformar(h, por_byte), self._transformar(m, por_byte))
+            if cand < mejor:
+                mejor = cand
+        return mejor
+
+    # ------------------------------------------------------------------
+    # Búsqueda
+    # ------------------------------------------------------------------
+    def _cota(self, h, n):
+        """Cota inferior de disparos restantes para `n` flotas consistentes con impactos `h`."""
+        return max(self.tamano_flota - _popcount(h), (n).bit_length())
+
+    def _cota_adversario(self, h, m, tope):
+        """
+        Cota inferior fijando el resto de la flota R ⊇ H y dejando que el defensor
+        esconda uno de los barcos; se detiene al alcanzar `tope`.
+        """
+        mejor = 0
+        for largo, posiciones, restos in self.escondidos:
+            for R in restos:
+                if R & h != h or R & m:
+                    continue
+                # Empaquetado voraz de posiciones disjuntas (<= mínimo de disparos para tocarlas todas)
+                ocupado = R | m
+                disjuntas = 0
+                for p in posiciones:
+                    if not p & ocupado:
+                        ocupado |= p
+                        disjuntas += 1
+                if disjuntas:
+                    cota = _popcount(R & ~h) + disjuntas + largo - 1
+                    if cota > mejor:
+                        mejor = cota
+                        if mejor >= tope:
+                            return mejor
+        return mejor
+
+    def _reportar(self):
+        if self.progreso and self.nodos % self.cada == 0:
+            self.progreso({
+                'nodos': self.nodos,
+                'tabla': len(self.tabla),
+                'segundos': time.monotonic() - self._inicio,
+            })
+        if self.ruta_tabla and time.monotonic() - self._ultimo_guardado > self.intervalo_guardado:
+            self.guardar(self.ruta_tabla)
+
+    def _resolver(self, h, m, S, tope):
+        """
+        Valor minimax del estado (H, M) con flotas consistentes S.
+
+        Devuelve el valor exacto si es menor que `tope`; si no, una cota
+        inferior >= `tope` (poda).
+        """
+        self.nodos += 1
+        self._reportar()
+
+        # Jugadas forzadas: celdas presentes en todas las flotas
+        k = 0
+        while True:
+            comun = ~0
+            for F in S:
+                comun &= F
+            seguras = comun & ~h
+            if not seguras:
+                break
+            k += _popcount(seguras)
+            h |= seguras
+            S = [F for F in S if F != h]
+            if not S:
+                return k
+        tope -= k
+
+        clave = self._canonica(h, m)
+        entrada = self.tabla.get(clave)
+        cota = self._cota(h, len(S))
+        if entrada is not None:
+            exacto, valor = entrada
+            if exacto or valor >= tope:
+                return k + valor
+            cota = max(cota, valor)
+        if cota < tope:
+            cota = max(cota, self._cota_adversario(h, m, tope))
+        if cota >= tope:
+            return k + cota
+
+        # Cota superior: disparar a todas las celdas posibles termina la partida
+        union = 0
+        for F in S:
+            union |= F
+        techo = _popcount(union & ~h)
+        if cota >= techo:
+            self.tabla[clave] = (True, techo)
+            return k + techo
+
+        # Firma de cada celda candidata: qué flotas la contienen
+        firmas = {}
+        for i, F in enumerate(S):
+            resto = F & ~h
+            bit = 1 << i
+            while resto:
+                c = resto & -resto
+                firmas[c] = firmas.get(c, 0) | bit
+                resto ^= c
+        todas = (1 << len(S)) - 1
+        # Una celda por firma; probar primero las que dividen más parejo
+        candidatas = {}
+        for c, firma in firmas.items():
+            if firma not in candidatas:
+                candidatas[firma] = c
+        orden = sorted(candidatas.items(),
+                       key=lambda fc: max(_popcount(fc[0]), len(S) - _popcount(fc[0])))
+
+        mejor = tope
+        exacto = False
+        for firma, c in orden:
+            hc = h | c
+            impactos = [F for i, F in enumerate(S) if firma >> i & 1 and F != hc]
+            fallos = [F for i, F in enumerate(S) if not firma >> i & 1] if firma != todas else []
+
+            # Poda rápida con las cotas de los hijos
+            v = 1
+            if fallos:
+                v = max(v, 1 + self._cota(h, len(fallos)))
+            if impactos:
+                v = max(v, 1 + self._cota(hc, len(impactos)))
+            if v >= mejor:
+                continue
+
+            if fallos:
+                v = max(v, 1 + self._resolver(h, m | c, fallos, mejor - 1))
+                if v >= mejor:
+                    continue
+            if impactos:
+                v = max(v, 1 + self._resolver(hc, m, impactos, mejor - 1))
+            if v < mejor:
+                mejor = v
+                exacto = True
+                if mejor <= cota:
+                    break
+
+        if exacto:
+            self.tabla[clave] = (True, mejor)
+        else:
+            # Falló por arriba: el valor es al menos `tope`
+            self.tabla[clave] = (False, tope)
+        return k + mejor
+
+    def resolver(self, impactos=0, fallos=0):
+        """
+        Valor del juego desde un estado de información dado (por defecto, el inicio).
+
+        Args:
+            impactos, fallos: máscaras de bits de celdas (índice fila * columnas + columna)
+
+        Returns:
+            Número de disparos del peor caso con juego óptimo.
+        """
+        self._inicio = time.monotonic()
+        self._ultimo_guardado = self._inicio
+        S = [F for F in self.flotas if F & impactos == impactos and not F & fallos and F != impactos]
+        if not S:
+            return 0
+        valor = self._resolver(impactos, fallos, S, self.celdas + 1)
+        if self.ruta_tabla:
+            self.guardar(self.ruta_tabla)
+        return valor
+
+    def mejor_disparo(self, impactos=0, fallos=0):
+        """
+        Disparo óptimo (peor caso) desde un estado dado.
+
+        Returns:
+            Tuple: (índice de celda, valor) o (None, 0) si no quedan flotas posibles.
+        """
+        S = [F for F in self.flotas if F & impactos == impactos and not F & fallos and F != impactos]
+        if not S:
+            return None, 0
+        mejor = (None, self.celdas + 1)
+        union = 0
+        for F in S:
+            union |= F
+        candidatas = union & ~impactos
+        while candidatas:
+            c = candidatas & -candidatas
+            candidatas ^= c
+            hc = impactos | c
+            impactos_s = [F for F in S if F & c and F != hc]
+            fallos_s = [F for F in S if not F & c]
+            v = 1
+            if fallos_s:
+                v = max(v, 1 + self.resolver(impactos, fallos | c))
+            if impactos_s:
+                v = max(v, 1 + self.resolver(hc, fallos))
+            if v < mejor[1]:
+                mejor = (c.bit_length() - 1, v)
+        return mejor
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+    def _parametros(self):
+        return (self.filas, self.columnas, sorted(self.flota.items()))
+
+    def guardar(self, ruta):
+        """Guarda la tabla de transposición para reanudar más tarde."""
+        with open(ruta, 'wb') as f:
+            pickle.dump({'parametros': self._parametros(), 'tabla': self.tabla}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        self._ultimo_guardado = time.monotonic()
+
+    def cargar(self, ruta):
+        """
+        Carga una tabla guardada con `guardar` (debe ser del mismo tablero y flota).
+
+        Returns:
+            True si se cargó, False si los parámetros no coinciden.
+        """
+        with open(ruta, 'rb') as f:
+            datos = pickle.load(f)
+        if datos['parametros'] != self._parametros():
+            print(f"La tabla {ruta} es de otro tablero/flota: {datos['parametros']}")
+            return False
+        self.tabla.update(datos['tabla'])
+        return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='fsm_naval solucionador',
+                                     description='Peor caso óptimo de disparos hasta hundir la flota')
+    parser.add_argument('--filas', type=int, default=5)
+    parser.add_argument('--columnas', type=int, default=5)
+    parser.add_argument('--flota', default='D1,S2,L3', help='tipos y longitudes, ej: D1,S2,L3')
+    parser.add_argument('--tabla', help='archivo de la tabla de transposición (se reanuda si existe)')
+    parser.add_argument('--progreso', type=int, default=200000, help='nodos entre reportes')
+    args = parser.parse_args(argv)
+
+    flota = {t[0]: int(t[1:]) for t in args.flota.split(',')}
+
+    def reportar(est):
+        print(f"  nodos={est['nodos']:,} tabla={est['tabla']:,} t={est['segundos']:.1f}s", flush=True)
+
+    sol = Solucionador(args.filas, args.columnas, flota, progreso=reportar, cada=args.progreso)
+    print(f"Tablero {args.filas}x{args.columnas}, flota {flota}: {len(sol.flotas):,} flotas posibles")
+    if args.tabla:
+        if os.path.exists(args.tabla):
+            if not sol.cargar(args.tabla):
+                return 2
+            print(f"Reanudando con {len(sol.tabla):,} estados de {args.tabla}")
+        sol.ruta_tabla = args.tabla
+
+    inicio = time.monotonic()
+    valor = sol.resolver()
+    print(f"Peor caso con juego óptimo: {valor} disparos "
+          f"({sol.nodos:,} nodos, {len(sol.tabla):,} estados, {time.monotonic() - inicio:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
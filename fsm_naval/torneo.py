@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+FSM Naval Battle - Torneo de Estrategias
+-----------------------------------
+Enfrenta estrategias de ataque contra estrategias de colocación de flota en
+un round-robin, usando la misma semántica del juego real: el defensor coloca
+su flota en un `EstadoPartida` (mismas reglas que `NavalServerFSM`, ver
+estado.py) y el atacante dispara a través de `procesar_ataque` /
+`NavalClientFSM._procesar_respuesta`. Ambos objetos se reciclan entre
+partidas con `PoolEstados`.
+
+Las partidas se reparten en bloques (chunks) sobre un `ProcessPoolExecutor`
+para usar todos los núcleos. Cada partida tiene su propia semilla derivada de
+la semilla del torneo, así que el resultado es el mismo sin importar el
+número de procesos.
+
+Estrategias:
+- Atacante: clase que recibe un `random.Random` y define `elegir(cliente)`,
+  que devuelve la próxima coordenada a atacar según `cliente.tablero_ataques`.
+- Defensor: función `defensor(servidor, rng)` que coloca la flota con
+  `servidor.colocar_barco`.
+Deben estar definidas a nivel de módulo para poder enviarse a los procesos.
+
+Uso:
+    python3 -m fsm_naval torneo --partidas 200 --semilla 1
+"""
+
+import os
+import math
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from .cliente import NavalClientFSM
+from .estado import PoolEstados
+
+# Flota por defecto: tipo -> longitud
+FLOTA = (('L', 3), ('S', 2), ('D', 1))
+
+def _vecinos(pos, filas, columnas):
+    """Celdas ortogonalmente adyacentes a `pos` dentro del tablero."""
+    f = filas.index(pos[0])
+    c = columnas.index(pos[1:])
+    for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        if 0 <= f + df < len(filas) and 0 <= c + dc < len(columnas):
+            yield f"{filas[f + df]}{columnas[c + dc]}"
+
+
+# ----------------------------------------------------------------------
+# Estrategias de ataque
+# ----------------------------------------------------------------------
+class AtacanteAleatorio:
+    """Dispara a una celda al azar no atacada."""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def elegir(self, cliente):
+        libres = [p for p, v in cliente.tablero_ataques.items() if v == '~']
+        return self.rng.choice(libres)
+
+
+class AtacanteCaza(AtacanteAleatorio):
+    """Caza y remate: al azar hasta impactar, luego ataca las celdas vecinas de los impactos."""
+
+    def elegir(self, cliente):
+        tablero = cliente.tablero_ataques
+        objetivos = [v for p, m in tablero.items() if m == 'X'
+                     for v in _vecinos(p, cliente.filas, cliente.columnas) if tablero[v] == '~']
+        if objetivos:
+            return self.rng.choice(objetivos)
+        return self.buscar(cliente)
+
+    def buscar(self, cliente):
+        return super().elegir(cliente)
+
+
+class AtacanteParidad(AtacanteCaza):
+    """Como la caza, pero al buscar prioriza las celdas de un tablero de ajedrez."""
+
+    def buscar(self, cliente):
+        libres = [p for p, v in cliente.tablero_ataques.items() if v == '~']
+        pares = [p for p in libres
+                 if (cliente.filas.index(p[0]) + cliente.columnas.index(p[1:])) % 2 == 0]
+        return self.rng.choice(pares or libres)
+
+
+# ----------------------------------------------------------------------
+# Estrategias de defensa (colocación de flota)
+# ----------------------------------------------------------------------
+def defensor_defecto(servidor, rng):
+    """Flota didáctica fija: Submarino B1-B2, Acorazado C1-C3 y Destroyer al azar."""
+    servidor.colocar_barco('S', ['B1', 'B2'])
+    servidor.colocar_barco('L', ['C1', 'C2', 'C3'])
+    libres = [p for p, v in servidor.tablero.items() if v is None]
+    servidor.colocar_barco('D', [rng.choice(libres)])
+
+
+def defensor_aleatorio(servidor, rng):
+    """Cada barco en posición y orientación al azar, sin solapamientos."""
+    filas = [chr(ord('A') + i) for i in range(servidor.filas)]
+    for tipo, largo in FLOTA:
+        while True:
+            if rng.random() < 0.5:
+                f = rng.randrange(servidor.filas)
+                c = rng.randrange(servidor.columnas - largo + 1)
+                posiciones = [f"{filas[f]}{c + k + 1}" for k in range(largo)]
+            else:
+                f = rng.randrange(servidor.filas - largo + 1)
+                c = rng.randrange(servidor.columnas)
+                posiciones = [f"{filas[f + k]}{c + 1}" for k in range(largo)]
+            if all(servidor.tablero[p] is None for p in posiciones):
+                servidor.colocar_barco(tipo, posiciones)
+                break
+
+
+def defensor_bordes(servidor, rng):
+    """Barcos pegados a los bordes del tablero (en posiciones al azar del borde)."""
+    n_f, n_c = servidor.filas, servidor.columnas
+    filas = [chr(ord('A') + i) for i in range(n_f)]
+    for tipo, largo in FLOTA:
+        while True:
+            lado = rng.randrange(4)
+            if lado in (0, 1):
+                f = 0 if lado == 0 else n_f - 1
+                c = rng.randrange(n_c - largo + 1)
+                posiciones = [f"{filas[f]}{c + k + 1}" for k in range(largo)]
+            else:
+                c = 0 if lado == 2 else n_c - 1
+                f = rng.randrange(n_f - largo + 1)
+                posiciones = [f"{filas[f + k]}{c + 1}" for k in range(largo)]
+            if all(servidor.tablero[p] is None for p in posiciones):
+                servidor.colocar_barco(tipo, posiciones)
+                break
+
+
+ATACANTES = {
+    'aleatorio': AtacanteAleatorio,
+    'caza': AtacanteCaza,
+    'paridad': AtacanteParidad,
+}
+
+DEFENSORES = {
+    'defecto': defensor_defecto,
+    'aleatorio': defensor_aleatorio,
+    'bordes': defensor_bordes,
+}
+
+
+# ----------------------------------------------------------------------
+# Partidas
+# ----------------------------------------------------------------------
+# Objetos reciclados entre partidas (uno por proceso): el defensor usa el
+# estado compacto de estado.py, con las mismas reglas que NavalServerFSM
+_POOL_DEFENSORES = PoolEstados()
+_POOL_ATACANTES = PoolEstados(NavalClientFSM, reiniciar=NavalClientFSM.reiniciar_partida)
+
+
+def jugar_partida(atacante, defensor, semilla_flota, semilla_ataque):
+    """
+    Juega una partida completa.
+
+    Returns:
+        Número de disparos necesarios para hundir toda la flota.
+    """
+    servidor = _POOL_DEFENSORES.obtener()
+    cliente = _POOL_ATACANTES.obtener()
+    try:
+        defensor(servidor, random.Random(semilla_flota))
+        estrategia = atacante(random.Random(semilla_ataque))
+        limite = len(servidor.tablero)
+        disparos = 0
+        while cliente.estado_actual != cliente.VICTORIA and disparos < limite:
+            coordenada = estrategia.elegir(cliente)
+            codigo, mensaje = servidor.procesar_ataque(coordenada)
+            cliente._procesar_respuesta(coordenada, f"{codigo}:{mensaje}")
+            disparos += 1
+        return disparos
+    finally:
+        _POOL_DEFENSORES.devolver(servidor)
+        _POOL_ATACANTES.devolver(cliente)
+
+
+def _jugar_bloque(tarea):
+    """Juega un bloque de partidas de un mismo emparejamiento (se ejecuta en un proceso del pool)."""
+    nombre_a, atacante, nombre_d, defensor, inicio, fin, semilla = tarea
+    return [jugar_partida(atacante, defensor,
+                          f"{semilla}:{nombre_d}:{i}",
+                          f"{semilla}:{nombre_a}:{nombre_d}:{i}")
+            for i in range(inicio, fin)]
+
+
+# ----------------------------------------------------------------------
+# Estadística
+# ----------------------------------------------------------------------
+def intervalo_media(valores, z=1.96):
+    """Media e intervalo de confianza (normal) de una lista de valores."""
+    n = len(valores)
+    media = sum(valores) / n
+    if n < 2:
+        return media, media, media
+    var = sum((v - media) ** 2 for v in valores) / (n - 1)
+    margen = z * math.sqrt(var / n)
+    return media, media - margen, media + margen
+
+
+def intervalo_wilson(exitos, n, z=1.96):
+    """Proporción e intervalo de Wilson (los empates cuentan como medio éxito)."""
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    p = exitos / n
+    den = 1 + z * z / n
+    centro = (p + z * z / (2 * n)) / den
+    margen = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / den
+    return p, centro - margen, centro + margen
+
+
+# ----------------------------------------------------------------------
+# Torneo
+# ----------------------------------------------------------------------
+def torneo(atacantes=None, defensores=None, partidas=100, semilla=0, procesos=None, bloque=None):
+    """
+    Ejecuta el round-robin completo atacantes x defensores.
+
+    Args:
+        atacantes: mapa nombre -> clase atacante (por defecto ATACANTES)
+        defensores: mapa nombre -> función defensora (por defecto DEFENSORES)
+        partidas: partidas por emparejamiento
+        semilla: semilla del torneo (mismo resultado para la misma semilla)
+        procesos: número de procesos (por defecto, todos los núcleos)
+        bloque: partidas por tarea enviada al pool
+
+    Returns:
+        dict con 'disparos' ((atacante, defensor) -> lista de disparos por partida),
+        'atacantes' y 'defensores' (resúmenes con intervalos de confianza).
+    """
+    atacantes = atacantes or ATACANTES
+    defensores = defensores or DEFENSORES
+    procesos = procesos or os.cpu_count() or 1
+    if bloque is None:
+        # Unas 4 tareas por proceso para equilibrar la carga
+        total = partidas * len(atacantes) * len(defensores)
+        bloque = max(1, min(partidas, math.ceil(total / (procesos * 4))))
+
+    tareas = []
+    for nombre_a, atacante in atacantes.items():
+        for nombre_d, defensor in defensores.items():
+            for inicio in range(0, partidas, bloque):
+                tareas.append((nombre_a, atacante, nombre_d, defensor,
+                               inicio, min(inicio + bloque, partidas), semilla))
+
+    disparos = {(a, d): [] for a in atacantes for d in defensores}
+    if procesos == 1:
+        resultados = map(_jugar_bloque, tareas)
+        for tarea, res in zip(tareas, resultados):
+            disparos[(tarea[0], tarea[2])].extend(res)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            # map conserva el orden de las tareas: el resultado es determinista
+            for tarea, res in zip(tareas, pool.map(_jugar_bloque, tareas)):
+                disparos[(tarea[0], tarea[2])].extend(res)
+
+    return {
+        'disparos': disparos,
+        'atacantes': _resumen_atacantes(disparos, atacantes, defensores),
+        'defensores': _resumen_defensores(disparos, atacantes, defensores),
+    }
+
+
+def _resumen_atacantes(disparos, atacantes, defensores):
+    """Disparos hasta hundir y tasa de victorias cara a cara sobre las mismas flotas."""
+    resumen = {}
+    for a in atacantes:
+        propios = [v for d in defensores for v in disparos[(a, d)]]
+        exitos = n = 0
+        for b in atacantes:
+            if b == a:
+                continue
+            for d in defensores:
+                for va, vb in zip(disparos[(a, d)], disparos[(b, d)]):
+                    exitos += 1 if va < vb else 0.5 if va == vb else 0
+                    n += 1
+        resumen[a] = {
+            'disparos': intervalo_media(propios),
+            'victorias': intervalo_wilson(exitos, n),
+        }
+    return resumen
+
+
+def _resumen_defensores(disparos, atacantes, defensores):
+    """Disparos que cada defensa obliga a gastar (más es mejor para el defensor)."""
+    return {d: {'disparos': intervalo_media([v for a in atacantes for v in disparos[(a, d)]])}
+            for d in defensores}
+
+
+def mostrar_resultados(resultado):
+    """Imprime las clasificaciones del torneo."""
+    print("\nAtacantes (menos disparos es mejor):")
+    print(f"  {'estrategia':<12} {'disparos (IC 95%)':<26} {'victorias (IC 95%)'}")
+    orden = sorted(resultado['atacantes'].items(), key=lambda kv: kv[1]['disparos'][0])
+    for nombre, r in orden:
+        m, lo, hi = r['disparos']
+        p, plo, phi = r['victorias']
+        print(f"  {nombre:<12} {m:6.2f} [{lo:6.2f}, {hi:6.2f}]     {p:6.1%} [{plo:6.1%}, {phi:6.1%}]")
+
+    print("\nDefensores (más disparos es mejor):")
+    orden = sorted(resultado['defensores'].items(), key=lambda kv: -kv[1]['disparos'][0])
+    for nombre, r in orden:
+        m, lo, hi = r['disparos']
+        print(f"  {nombre:<12} {m:6.2f} [{lo:6.2f}, {hi:6.2f}]")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='fsm_naval torneo',
+                                     description='Torneo round-robin de estrategias de batalla naval')
+    parser.add_argument('--partidas', type=int, default=100, help='partidas por emparejamiento')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--procesos', type=int, default=None, help='por defecto, todos los núcleos')
+    parser.add_argument('--bloque', type=int, default=None, help='partidas por tarea del pool')
+    args = parser.parse_args(argv)
+
+    resultado = torneo(partidas=args.partidas, semilla=args.semilla,
+                       procesos=args.procesos, bloque=args.bloque)
+    mostrar_resultados(resultado)
+
+
+if __name__ == '__main__':
+    main()
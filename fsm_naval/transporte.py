@@ -0,0 +1,193 @@
+"""
+FSM Naval Battle - Capa de Transporte
+-----------------------------------
+Abstracción común para crear las conexiones del cliente y del servidor.
+El protocolo no cambia (un mensaje "A1" -> una respuesta "200:Impacto" por
+conexión); solo cambia por dónde viaja:
+
+- TransporteTCP     : AF_INET / SOCK_STREAM (comportamiento original)
+- TransporteUnix    : socket de dominio Unix, para bots en la misma máquina
+- TransporteMemoria : dentro del mismo proceso, con socketpair() y una cola;
+                      sin pila de red (pruebas y simulaciones)
+
+Cada transporte ofrece:
+    escuchar()  -> objeto con accept() y close() (lado servidor)
+    conectar()  -> socket conectado con send/recv/close (lado cliente)
+
+`crear_transporte(url)` construye uno a partir de una URL:
+    tcp://host:puerto, unix:///ruta/al/socket, mem://nombre
+
+Modo UDP (opcional): cada mensaje viaja en un solo datagrama
+"partida|secuencia|carga" (ver codificar_datagrama), sin establecer conexión.
+"""
+
+import os
+import queue
+import socket
+import threading
+
+
+class TransporteTCP:
+    """Transporte TCP sobre IPv4."""
+
+    def __init__(self, host='', port=5000):
+        self.host = host
+        self.port = port
+
+    def escuchar(self, backlog=1):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((self.host, self.port))
+            sock.listen(backlog)
+        except OSError:
+            sock.close()
+            raise
+        # Con port=0 el sistema asigna uno libre
+        self.port = sock.getsockname()[1]
+        return sock
+
+    def conectar(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.connect((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+
+class TransporteUnix:
+    """Transporte por socket de dominio Unix (misma máquina, menor latencia que TCP)."""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def escuchar(self, backlog=1):
+        # Quitar un socket viejo que haya quedado de una ejecución anterior
+        if os.path.exists(self.ruta):
+            os.unlink(self.ruta)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.ruta)
+            sock.listen(backlog)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def conectar(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.ruta)
+        except FileNotFoundError:
+            sock.close()
+            raise ConnectionRefusedError(f"No hay servidor en {self.ruta}")
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def __str__(self):
+        return f"unix:{self.ruta}"
+
+
+# Servidores en memoria activos: nombre -> cola de conexiones pendientes
+_servidores_memoria = {}
+_lock_memoria = threading.Lock()
+
+
+class _EscuchaMemoria:
+    """Lado servidor de un transporte en memoria: imita accept()/close() de un socket."""
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.cola = queue.Queue()
+
+    def accept(self):
+        conexion = self.cola.get()
+        if conexion is None:
+            raise OSError("Transporte en memoria cerrado")
+        return conexion, f"mem:{self.nombre}"
+
+    def close(self):
+        with _lock_memoria:
+            if _servidores_memoria.get(self.nombre) is self:
+                del _servidores_memoria[self.nombre]
+        # Despertar a un accept() bloqueado
+        self.cola.put(None)
+
+
+class TransporteMemoria:
+    """Transporte dentro del proceso: cada conexión es un socketpair() entregado por una cola."""
+
+    def __init__(self, nombre='flota'):
+        self.nombre = nombre
+
+    def escuchar(self, backlog=1):
+        escucha = _EscuchaMemoria(self.nombre)
+        with _lock_memoria:
+            _servidores_memoria[self.nombre] = escucha
+        return escucha
+
+    def conectar(self):
+        with _lock_memoria:
+            escucha = _servidores_memoria.get(self.nombre)
+        if escucha is None:
+            raise ConnectionRefusedError(f"No hay servidor en memoria '{self.nombre}'")
+        lado_cliente, lado_servidor = socket.socketpair()
+        escucha.cola.put(lado_servidor)
+        return lado_cliente
+
+    def __str__(self):
+        return f"mem:{self.nombre}"
+
+
+def codificar_datagrama(partida, secuencia, carga):
+    """Arma un datagrama del modo UDP: id de partida, número de secuencia y carga (ej: 'A1')."""
+    return f"{partida}|{secuencia}|{carga}".encode()
+
+
+def decodificar_datagrama(datos):
+    """
+    Inverso de codificar_datagrama.
+
+    Returns:
+        Tuple: (partida, secuencia, carga)
+
+    Raises:
+        ValueError si el datagrama está mal formado.
+    """
+    partida, secuencia, carga = datos.decode().split('|', 2)
+    return partida, int(secuencia), carga
+
+
+def crear_transporte(url):
+    """
+    Construye un transporte a partir de una URL.
+
+    Args:
+        url: 'tcp://host:puerto', 'unix:///ruta', 'mem://nombre' o 'host:puerto'
+
+    Returns:
+        Instancia de transporte, o None si la URL no es válida.
+    """
+    esquema, sep, resto = url.partition('://')
+    if not sep:
+        esquema, resto = 'tcp', url
+    if esquema == 'tcp':
+        host, _, port = resto.rpartition(':')
+        try:
+            return TransporteTCP(host, int(port))
+        except ValueError:
+            print(f"Puerto inválido en {url}")
+            return None
+    if esquema == 'unix':
+        return TransporteUnix(resto)
+    if esquema == 'mem':
+        return TransporteMemoria(resto)
+    print(f"Transporte desconocido: {esquema}")
+    return None